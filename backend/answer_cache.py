@@ -0,0 +1,241 @@
+import os
+import re
+import unicodedata
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Width of the hashed feature space (word/bigram/character-trigram features share it)
+ANSWER_CACHE_DIMENSIONS = int(os.environ.get('ANSWER_CACHE_DIMENSIONS', '4096'))
+# Cosine similarity needed to serve a curated or admin-promoted FAQ answer
+ANSWER_CACHE_THRESHOLD = float(os.environ.get('ANSWER_CACHE_THRESHOLD', '0.5'))
+# Previously answered questions are unreviewed, so they must match more closely
+ANSWER_CACHE_LEARNED_THRESHOLD = float(os.environ.get('ANSWER_CACHE_LEARNED_THRESHOLD', '0.9'))
+ANSWER_CACHE_MAX_LEARNED = int(os.environ.get('ANSWER_CACHE_MAX_LEARNED', '1000'))
+
+# Feature weights: whole words carry the meaning, trigrams only absorb typos and inflections
+_WORD_WEIGHT = 1.0
+_BIGRAM_WEIGHT = 0.7
+_TRIGRAM_WEIGHT = 0.3
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_QUESTION_STOPWORDS = frozenset({
+    'a', 'about', 'am', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'by', 'can', 'could', 'do', 'does',
+    'for', 'from', 'get', 'have', 'hello', 'hi', 'how', 'i', 'if', 'in', 'is', 'it', 'me', 'my', 'of', 'on', 'or',
+    'please', 'should', 'so', 'tell', 'that', 'the', 'there', 'this', 'to', 'u', 'want', 'was', 'we', 'what',
+    'when', 'where', 'which', 'who', 'why', 'will', 'with', 'would', 'you', 'your',
+})
+_IRREGULAR_LEMMAS = {
+    'bought': 'buy', 'buying': 'buy', 'paid': 'pay', 'sold': 'sell', 'made': 'make', 'taught': 'teach',
+    'children': 'child', 'people': 'person', 'artworks': 'artwork', 'classes': 'class', 'galleries': 'gallery',
+    'was': 'be', 'were': 'be', 'is': 'be', 'are': 'be',
+}
+
+
+def lemmatize(token: str) -> str:
+    """Rule-based lemma: irregular forms, then plural, -ing/-ed and trailing-e suffixes."""
+    if token in _IRREGULAR_LEMMAS:
+        return _IRREGULAR_LEMMAS[token]
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        token = token[:-1]
+    if len(token) > 5 and token.endswith('ing'):
+        token = token[:-3]
+    elif len(token) > 4 and token.endswith('ed') and not token.endswith('eed'):
+        token = token[:-2]
+    # "like"/"liked"/"liking" all end up as "lik"
+    return token[:-1] if len(token) > 3 and token.endswith('e') and not token.endswith('ee') else token
+
+
+def normalize_question(text: str) -> List[str]:
+    """Casefolded, stopword-free lemmas in question order, each kept once."""
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode().casefold()
+    lemmas = (lemmatize(token) for token in _TOKEN_RE.findall(text) if token not in _QUESTION_STOPWORDS)
+    return list(dict.fromkeys(lemma for lemma in lemmas if lemma))
+
+
+def _feature_index(feature: str) -> int:
+    return zlib.crc32(feature.encode()) % ANSWER_CACHE_DIMENSIONS
+
+
+def question_features(lemmas: List[str]) -> np.ndarray:
+    """Hashed feature vector: lemma set, adjacent lemma pairs and character trigrams."""
+    vector = np.zeros(ANSWER_CACHE_DIMENSIONS, dtype=np.float32)
+    for lemma in lemmas:
+        vector[_feature_index(f"w:{lemma}")] = _WORD_WEIGHT
+        padded = f" {lemma} "
+        for i in range(len(padded) - 2):
+            index = _feature_index(f"c:{padded[i:i + 3]}")
+            vector[index] = max(vector[index], _TRIGRAM_WEIGHT)
+    for first, second in zip(lemmas, lemmas[1:]):
+        vector[_feature_index(f"b:{first} {second}")] = _BIGRAM_WEIGHT
+    return vector
+
+
+class AnswerCache:
+    """
+    Chatbot answers keyed by question similarity. Entries are curated/promoted FAQ
+    rows ("faq:<id>") or answers the model gave earlier ("learned:<question>",
+    LRU-bounded). Questions become hashed feature vectors and a lookup is one
+    matrix-vector product of cosine scores. IDF is taken over the cached questions
+    when the FAQ is (re)loaded; entries added or removed in between update their own
+    matrix row in place, weighted with that IDF, so learning an answer is O(dimensions).
+    """
+
+    def __init__(self, threshold: float = ANSWER_CACHE_THRESHOLD,
+                 learned_threshold: float = ANSWER_CACHE_LEARNED_THRESHOLD,
+                 max_learned: int = ANSWER_CACHE_MAX_LEARNED):
+        self.threshold = threshold
+        self.learned_threshold = learned_threshold
+        self.max_learned = max_learned
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()  # key -> {question, answer, source, features}
+        # Row i of _matrix/_thresholds belongs to _keys[i]; capacity grows by doubling
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = np.zeros((0, ANSWER_CACHE_DIMENSIONS), dtype=np.float32)
+        self._thresholds = np.zeros(0, dtype=np.float32)
+        self._idf = np.ones(ANSWER_CACHE_DIMENSIONS, dtype=np.float32)
+        self.stats = {"lookups": 0, "faq_hits": 0, "learned_hits": 0, "misses": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _weighted_row(self, features: np.ndarray) -> np.ndarray:
+        weighted = features * self._idf
+        return weighted / max(float(np.linalg.norm(weighted)), 1e-9)
+
+    def _threshold_for(self, key: str) -> float:
+        return self.learned_threshold if key.startswith('learned:') else self.threshold
+
+    def _set_row(self, key: str):
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._keys)
+            if row == len(self._matrix):
+                capacity = max(16, 2 * len(self._matrix))
+                matrix = np.zeros((capacity, ANSWER_CACHE_DIMENSIONS), dtype=np.float32)
+                matrix[:row] = self._matrix
+                thresholds = np.zeros(capacity, dtype=np.float32)
+                thresholds[:row] = self._thresholds
+                self._matrix, self._thresholds = matrix, thresholds
+            self._keys.append(key)
+            self._rows[key] = row
+        self._matrix[row] = self._weighted_row(self._entries[key]["features"])
+        self._thresholds[row] = self._threshold_for(key)
+
+    def _drop_row(self, key: str):
+        """Swap the last row into `key`'s slot."""
+        row = self._rows.pop(key)
+        last = len(self._keys) - 1
+        if row != last:
+            moved = self._keys[last]
+            self._keys[row] = moved
+            self._rows[moved] = row
+            self._matrix[row] = self._matrix[last]
+            self._thresholds[row] = self._thresholds[last]
+        self._keys.pop()
+
+    def _put(self, key: str, question: str, answer: str, source: str) -> bool:
+        lemmas = normalize_question(question)
+        if not lemmas or not answer:
+            return False
+        self._entries[key] = {
+            "question": question,
+            "answer": answer,
+            "source": source,
+            "features": question_features(lemmas),
+        }
+        self._entries.move_to_end(key)
+        self._set_row(key)
+        return True
+
+    def load_faq(self, rows: Iterable[dict]):
+        """Replace every FAQ entry with `rows` (id, question, answer, source); learned answers are kept."""
+        for key in [k for k in self._entries if k.startswith('faq:')]:
+            del self._entries[key]
+        for row in rows:
+            lemmas = normalize_question(row.get('question'))
+            if lemmas and row.get('answer'):
+                self._entries[f"faq:{row['id']}"] = {
+                    "question": row.get('question'),
+                    "answer": row.get('answer'),
+                    "source": row.get('source') or 'curated',
+                    "features": question_features(lemmas),
+                }
+        self._rebuild()
+
+    def upsert_faq(self, row: dict):
+        self._put(f"faq:{row['id']}", row.get('question'), row.get('answer'), row.get('source') or 'curated')
+
+    def remove(self, key: str):
+        if self._entries.pop(key, None) is not None:
+            self._drop_row(key)
+
+    def learn(self, question: str, answer: str):
+        """Remember a model answer for near-identical questions."""
+        key = "learned:" + ' '.join(normalize_question(question))
+        if not self._put(key, question, answer, 'learned'):
+            return
+        learned = [k for k in self._entries if k.startswith('learned:')]
+        for stale_key in learned[:max(0, len(learned) - self.max_learned)]:
+            self.remove(stale_key)
+
+    def _rebuild(self):
+        """Recompute IDF over every cached question and re-weight all rows."""
+        self._keys = list(self._entries)
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        if not self._keys:
+            self._matrix = np.zeros((0, ANSWER_CACHE_DIMENSIONS), dtype=np.float32)
+            self._thresholds = np.zeros(0, dtype=np.float32)
+            self._idf = np.ones(ANSWER_CACHE_DIMENSIONS, dtype=np.float32)
+            return
+        features = np.stack([self._entries[key]["features"] for key in self._keys])
+        document_frequency = np.count_nonzero(features, axis=0)
+        self._idf = (np.log((1 + len(self._keys)) / (1 + document_frequency)) + 1).astype(np.float32)
+        weighted = features * self._idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        self._matrix = weighted / np.maximum(norms, 1e-9)
+        self._thresholds = np.array([self._threshold_for(key) for key in self._keys], dtype=np.float32)
+
+    def lookup(self, question: str) -> Optional[dict]:
+        """Best cached answer above its source's threshold, as {key, question, answer, source, score}, else None."""
+        lemmas = normalize_question(question)
+        self.stats["lookups"] += 1
+        if not lemmas or not self._entries:
+            self.stats["misses"] += 1
+            return None
+        count = len(self._keys)
+        scores = self._matrix[:count] @ self._weighted_row(question_features(lemmas))
+        scores[scores < self._thresholds[:count]] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] < 0:
+            self.stats["misses"] += 1
+            return None
+
+        key = self._keys[best]
+        entry = self._entries[key]
+        if entry["source"] == 'learned':
+            self._entries.move_to_end(key)
+            self.stats["learned_hits"] += 1
+        else:
+            self.stats["faq_hits"] += 1
+        return {
+            "key": key,
+            "question": entry["question"],
+            "answer": entry["answer"],
+            "source": entry["source"],
+            "score": round(float(scores[best]), 4),
+        }
+
+    def metrics(self) -> Dict[str, object]:
+        hits = self.stats["faq_hits"] + self.stats["learned_hits"]
+        lookups = self.stats["lookups"]
+        return {
+            **self.stats,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "faq_entries": sum(1 for key in self._entries if key.startswith('faq:')),
+            "learned_entries": sum(1 for key in self._entries if key.startswith('learned:')),
+        }
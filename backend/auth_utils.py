@@ -1,9 +1,15 @@
 import os
+import re
+import time
+import random
+import asyncio
+import hashlib
 import jwt
 import httpx
+from collections import OrderedDict
 from fastapi import HTTPException, Security, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from typing import Dict, Optional
 
 security = HTTPBearer()
 
@@ -11,24 +17,259 @@ security = HTTPBearer()
 SUPABASE_URL = os.environ.get('SUPABASE_URL', 'https://lurvhgzauuzwftfymjym.supabase.co')
 SUPABASE_JWT_SECRET = os.environ.get('SUPABASE_JWT_SECRET', '')  # Get from Supabase settings
 
-# Cache for JWKS
-_jwks_cache = None
+# Asymmetric (JWKS) verification. Keys are refreshed in the background; the request
+# path only ever reads the in-memory key map.
+JWKS_URL = os.environ.get('SUPABASE_JWKS_URL', f"{SUPABASE_URL}/auth/v1/.well-known/jwks.json")
+JWKS_ALGORITHMS = ("RS256", "ES256")
+JWKS_DEFAULT_REFRESH_SECONDS = int(os.environ.get('JWKS_DEFAULT_REFRESH_SECONDS', '600'))
+JWKS_MIN_REFRESH_SECONDS = int(os.environ.get('JWKS_MIN_REFRESH_SECONDS', '60'))
+JWKS_MAX_REFRESH_SECONDS = int(os.environ.get('JWKS_MAX_REFRESH_SECONDS', '3600'))
+# Unknown kid triggers an early background refresh at most this often
+JWKS_UNKNOWN_KID_COOLDOWN_SECONDS = int(os.environ.get('JWKS_UNKNOWN_KID_COOLDOWN_SECONDS', '30'))
+# Keys dropped from the JWKS keep verifying for this long (outstanding tokens signed before rotation)
+JWKS_RETIRED_KEY_GRACE_SECONDS = int(os.environ.get('JWKS_RETIRED_KEY_GRACE_SECONDS', '3600'))
+# Development only: accept tokens that cannot be verified with a configured key
+AUTH_ALLOW_UNVERIFIED_TOKENS = os.environ.get('AUTH_ALLOW_UNVERIFIED_TOKENS', 'false').lower() == 'true'
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Verified-token / profile-role cache. Role changes made on this process invalidate
+# immediately; the TTL bounds staleness for changes made through other workers.
+AUTH_CACHE_TTL_SECONDS = int(os.environ.get('AUTH_CACHE_TTL_SECONDS', '30'))
+AUTH_CACHE_MAX_ENTRIES = int(os.environ.get('AUTH_CACHE_MAX_ENTRIES', '10000'))
+
+
+class _TTLCache:
+    """Small LRU cache with per-entry expiry and hit/miss counters."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else min(self.ttl_seconds, ttl_seconds)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Decoded claims keyed by token id (jti, or a digest of the token when jti is absent)
+_token_cache = _TTLCache(AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS)
+# Profile role/approval/active flags keyed by user id (sub)
+_profile_cache = _TTLCache(AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS)
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def invalidate_user_auth_cache(user_id: str):
+    """Drop the cached profile role for a user (call after changing role, approval or active status)."""
+    if user_id:
+        _profile_cache.pop(user_id)
+
+
+def get_auth_cache_stats() -> dict:
+    return {"tokens": _token_cache.stats(), "profiles": _profile_cache.stats(), "jwks": _jwks_store.stats()}
 
 def get_supabase_for_auth():
     """Get Supabase client for auth checks"""
-    from supabase_client import get_supabase_client
-    return get_supabase_client()
-
-async def get_jwks():
-    """Fetch JWKS from Supabase"""
-    global _jwks_cache
-    if _jwks_cache:
-        return _jwks_cache
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{SUPABASE_URL}/auth/v1/.well-known/jwks.json")
-        _jwks_cache = response.json()
-        return _jwks_cache
+    from supabase_client import get_async_supabase_client
+    return get_async_supabase_client()
+
+class JWKSKeyStore:
+    """
+    Supabase signing keys parsed once into key objects and indexed by kid.
+    A background task refetches the JWKS when its Cache-Control max-age runs out
+    (with jitter so workers don't refresh in lockstep); unknown kids schedule an
+    early refresh instead of fetching on the request path.
+    """
+
+    def __init__(self, url: str = JWKS_URL):
+        self.url = url
+        self.keys: Dict[str, jwt.PyJWK] = {}
+        self.retired: Dict[str, tuple] = {}  # kid -> (PyJWK, retired_at monotonic)
+        self.refresh_interval = JWKS_DEFAULT_REFRESH_SECONDS
+        self.last_refresh_at: Optional[float] = None
+        self.last_refresh_attempt = 0.0
+        self.refresh_failures = 0
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+
+    def load(self, jwks: dict, max_age: Optional[int] = None):
+        """Swap in a new key set (copy-on-write, so concurrent verifications never see a partial map)."""
+        keys = {}
+        for jwk_data in jwks.get('keys', []):
+            kid = jwk_data.get('kid')
+            if not kid or jwk_data.get('use', 'sig') != 'sig':
+                continue
+            try:
+                key = jwt.PyJWK(jwk_data)
+            except jwt.PyJWKError as e:
+                print(f"Skipping unsupported JWK {kid}: {e}")
+                continue
+            if key.algorithm_name in JWKS_ALGORITHMS:
+                keys[kid] = key
+
+        now = time.monotonic()
+        retired = {
+            kid: entry for kid, entry in self.retired.items()
+            if kid not in keys and now - entry[1] < JWKS_RETIRED_KEY_GRACE_SECONDS
+        }
+        for kid, key in self.keys.items():
+            if kid not in keys:
+                retired[kid] = (key, now)
+
+        self.keys, self.retired = keys, retired
+        self.last_refresh_at = now
+        if max_age is None:
+            max_age = JWKS_DEFAULT_REFRESH_SECONDS
+        self.refresh_interval = min(JWKS_MAX_REFRESH_SECONDS, max(JWKS_MIN_REFRESH_SECONDS, max_age))
+
+    async def refresh(self):
+        self.last_refresh_attempt = time.monotonic()
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(self.url)
+            response.raise_for_status()
+        cache_control = response.headers.get('cache-control', '')
+        match = _MAX_AGE_RE.search(cache_control)
+        if 'no-store' in cache_control or 'no-cache' in cache_control:
+            max_age = 0
+        else:
+            max_age = int(match.group(1)) if match else None
+        self.load(response.json(), max_age)
+
+    def request_refresh(self):
+        if time.monotonic() - self.last_refresh_attempt >= JWKS_UNKNOWN_KID_COOLDOWN_SECONDS:
+            self._wake.set()
+
+    def get_key(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        key = self.keys.get(kid)
+        if key is None and kid in self.retired:
+            key, retired_at = self.retired[kid]
+            if time.monotonic() - retired_at >= JWKS_RETIRED_KEY_GRACE_SECONDS:
+                return None
+        return key
+
+    def verify(self, token: str, header: dict) -> dict:
+        alg = header.get('alg')
+        key = self.get_key(header.get('kid'))
+        if key is None:
+            self.request_refresh()
+            raise jwt.InvalidTokenError("Unknown signing key")
+        # Only accept the algorithm the key was published for (no alg confusion)
+        if key.algorithm_name != alg:
+            raise jwt.InvalidTokenError("Signing algorithm does not match key")
+        return jwt.decode(token, key.key, algorithms=[alg], audience="authenticated")
+
+    async def start(self, initial_timeout: float = 5.0):
+        if self._task is not None:
+            return
+        try:
+            await asyncio.wait_for(self.refresh(), timeout=initial_timeout)
+        except Exception as e:
+            self.refresh_failures += 1
+            print(f"Initial JWKS fetch failed: {e}")
+        self._task = asyncio.create_task(self._loop(), name="jwks-refresh")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            if self.refresh_failures:
+                delay = min(self.refresh_interval, 5 * 2 ** min(self.refresh_failures, 6))
+            elif not self.keys:
+                delay = JWKS_UNKNOWN_KID_COOLDOWN_SECONDS
+            else:
+                delay = self.refresh_interval
+            delay *= random.uniform(0.8, 1.0)
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.refresh()
+                self.refresh_failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.refresh_failures += 1
+                print(f"JWKS refresh failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self.keys),
+            "retired_keys": len(self.retired),
+            "refresh_interval_seconds": self.refresh_interval,
+            "seconds_since_refresh": round(time.monotonic() - self.last_refresh_at, 1) if self.last_refresh_at else None,
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+_jwks_store = JWKSKeyStore()
+
+
+async def start_jwks_refresh():
+    await _jwks_store.start()
+
+
+async def stop_jwks_refresh():
+    await _jwks_store.stop()
+
+
+def decode_supabase_token(token: str) -> dict:
+    """Verify a Supabase JWT: HS256 with the project secret, RS256/ES256 against the JWKS."""
+    header = jwt.get_unverified_header(token)
+    alg = header.get('alg')
+    if alg == 'HS256' and SUPABASE_JWT_SECRET:
+        return jwt.decode(token, SUPABASE_JWT_SECRET, algorithms=["HS256"], audience="authenticated")
+    if alg in JWKS_ALGORITHMS:
+        return _jwks_store.verify(token, header)
+    if AUTH_ALLOW_UNVERIFIED_TOKENS:
+        # For development/testing - decode without verification
+        return jwt.decode(token, options={"verify_signature": False})
+    raise jwt.InvalidTokenError(f"Unsupported signing algorithm: {alg}")
+
 
 async def verify_supabase_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> dict:
     """
@@ -38,18 +279,15 @@ async def verify_supabase_token(credentials: HTTPAuthorizationCredentials = Secu
     token = credentials.credentials
     
     try:
-        # Decode and verify JWT
-        # Note: For production, verify with JWKS
-        if SUPABASE_JWT_SECRET:
-            payload = jwt.decode(
-                token,
-                SUPABASE_JWT_SECRET,
-                algorithms=["HS256"],
-                audience="authenticated"
-            )
-        else:
-            # For development/testing - decode without verification
-            payload = jwt.decode(token, options={"verify_signature": False})
+        token_key = _token_cache_key(token)
+        payload = _token_cache.get(token_key)
+        if payload is None:
+            payload = decode_supabase_token(token)
+            if payload.get('exp'):
+                _token_cache.set(token_key, payload, payload['exp'] - time.time())
+        elif payload.get('exp') and payload['exp'] <= time.time():
+            _token_cache.pop(token_key)
+            raise jwt.ExpiredSignatureError("Signature has expired")
         
         user_id = payload.get('sub')
         email = payload.get('email')
@@ -58,30 +296,34 @@ async def verify_supabase_token(credentials: HTTPAuthorizationCredentials = Secu
             raise HTTPException(status_code=401, detail="Invalid token")
         
         # Fetch the actual role from the profiles table
-        try:
-            supabase = get_supabase_for_auth()
-            profile = supabase.table('profiles').select('role, is_approved, is_active').eq('id', user_id).single().execute()
-            
-            if profile.data:
-                role = profile.data.get('role', 'user')
-                is_approved = profile.data.get('is_approved', False)
-                is_active = profile.data.get('is_active', True)
-            else:
-                role = payload.get('user_metadata', {}).get('role', 'user')
-                is_approved = True
-                is_active = True
-        except Exception as e:
-            print(f"Error fetching profile for auth: {e}")
-            role = payload.get('user_metadata', {}).get('role', 'user')
-            is_approved = True
-            is_active = True
+        profile_flags = _profile_cache.get(user_id)
+        if profile_flags is None:
+            try:
+                supabase = get_supabase_for_auth()
+                profile = await supabase.table('profiles').select('role, is_approved, is_active').eq('id', user_id).single().execute()
+                
+                if profile.data:
+                    profile_flags = {
+                        "role": profile.data.get('role', 'user'),
+                        "is_approved": profile.data.get('is_approved', False),
+                        "is_active": profile.data.get('is_active', True),
+                    }
+                    _profile_cache.set(user_id, profile_flags)
+            except Exception as e:
+                print(f"Error fetching profile for auth: {e}")
+        
+        if profile_flags is None:
+            # Not cached: the profile may be created moments after sign-up
+            profile_flags = {
+                "role": payload.get('user_metadata', {}).get('role', 'user'),
+                "is_approved": True,
+                "is_active": True,
+            }
         
         return {
             "id": user_id,
             "email": email,
-            "role": role,
-            "is_approved": is_approved,
-            "is_active": is_active
+            **profile_flags
         }
     
     except jwt.ExpiredSignatureError:
@@ -0,0 +1,87 @@
+import bisect
+import heapq
+import re
+import unicodedata
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# Prefixes up to this length get their top suggestions precomputed (their key ranges are the widest)
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+# (text, kind, id, popularity)
+Suggestion = Tuple[str, str, Optional[str], float]
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode()
+    return _NON_ALNUM_RE.sub(' ', text.lower()).strip()
+
+
+class PrefixIndex:
+    """
+    Immutable, array-backed prefix index. Every suggestion is keyed by its normalized
+    text and each word suffix ("the blue horse" also under "blue horse", "horse"); keys
+    live in one sorted list with a parallel array of suggestion numbers, so a prefix is
+    a bisect range. Short prefixes, whose ranges are large, have their top-k
+    precomputed. Build a new instance to refresh and swap the reference.
+    """
+
+    def __init__(self, suggestions: Iterable[Suggestion], top_k: int = 10):
+        self.top_k = top_k
+        # Dedupe on (kind, normalized text), keeping the most popular entry
+        best: Dict[Tuple[str, str], Suggestion] = {}
+        for suggestion in suggestions:
+            text, kind, _, popularity = suggestion
+            key = (kind, normalize_text(text))
+            if key[1] and (key not in best or popularity > best[key][3]):
+                best[key] = suggestion
+        # Suggestion numbers in popularity order, so smaller number == more popular
+        self.suggestions: List[Suggestion] = sorted(best.values(), key=lambda s: (-s[3], s[0]))
+
+        pairs = []
+        for number, (text, _, _, _) in enumerate(self.suggestions):
+            words = normalize_text(text).split()
+            for i in range(len(words)):
+                pairs.append((' '.join(words[i:]), number))
+        pairs.sort()
+        self._keys: List[str] = [key for key, _ in pairs]
+        self._refs = array('I', (number for _, number in pairs))
+
+        # (kind or None, prefix) -> most popular suggestion numbers, ascending
+        self._top: Dict[Tuple[Optional[str], str], List[int]] = {}
+        for key, number in pairs:
+            kind = self.suggestions[number][1]
+            for length in range(1, min(PRECOMPUTED_PREFIX_LENGTH, len(key)) + 1):
+                for top_key in ((None, key[:length]), (kind, key[:length])):
+                    top = self._top.setdefault(top_key, [])
+                    if number in top or (len(top) >= top_k and number > top[-1]):
+                        continue
+                    bisect.insort(top, number)
+                    if len(top) > top_k:
+                        top.pop()
+
+    def __len__(self) -> int:
+        return len(self.suggestions)
+
+    def lookup(self, prefix: str, limit: int = 8, kinds: Optional[set] = None) -> List[Suggestion]:
+        key = normalize_text(prefix)
+        if not key:
+            return []
+        limit = min(limit, self.top_k)
+
+        if len(key) <= PRECOMPUTED_PREFIX_LENGTH:
+            if kinds:
+                numbers = sorted({n for kind in kinds for n in self._top.get((kind, key), ())})
+            else:
+                numbers = self._top.get((None, key), [])
+        else:
+            lo = bisect.bisect_left(self._keys, key)
+            hi = bisect.bisect_left(self._keys, key + '\x7f', lo)
+            refs = self._refs[lo:hi]
+            if kinds:
+                refs = (n for n in refs if self.suggestions[n][1] in kinds)
+            numbers = heapq.nsmallest(limit, set(refs))
+
+        return [self.suggestions[number] for number in numbers[:limit]]
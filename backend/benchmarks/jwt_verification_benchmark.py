@@ -0,0 +1,60 @@
+"""
+Micro-benchmark: per-request cost of JWT verification.
+
+Compares HS256 (project secret), RS256 and ES256 (JWKS key objects pre-parsed by
+kid) and the verified-token cache hit path used by verify_supabase_token.
+
+Run from backend/:  python benchmarks/jwt_verification_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SUPABASE_JWT_SECRET", "benchmark-secret-benchmark-secret-0123")
+
+import jwt
+from jwt.algorithms import ECAlgorithm, RSAAlgorithm
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+import auth_utils
+
+
+def _claims() -> dict:
+    now = int(time.time())
+    return {"sub": "00000000-0000-0000-0000-000000000001", "email": "bench@example.com",
+            "aud": "authenticated", "iat": now, "exp": now + 3600}
+
+
+def main(iterations: int = 5000):
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+
+    rsa_jwk = RSAAlgorithm.to_jwk(rsa_key.public_key(), as_dict=True)
+    rsa_jwk.update({"kid": "rsa-1", "alg": "RS256", "use": "sig"})
+    ec_jwk = ECAlgorithm.to_jwk(ec_key.public_key(), as_dict=True)
+    ec_jwk.update({"kid": "ec-1", "alg": "ES256", "use": "sig"})
+    auth_utils._jwks_store.load({"keys": [rsa_jwk, ec_jwk]}, max_age=600)
+
+    tokens = {
+        "HS256": jwt.encode(_claims(), auth_utils.SUPABASE_JWT_SECRET, algorithm="HS256"),
+        "RS256": jwt.encode(_claims(), rsa_key, algorithm="RS256", headers={"kid": "rsa-1"}),
+        "ES256": jwt.encode(_claims(), ec_key, algorithm="ES256", headers={"kid": "ec-1"}),
+    }
+
+    print(f"{'path':<22}{'us/verify':>12}")
+    for alg, token in tokens.items():
+        seconds = timeit.timeit(lambda: auth_utils.decode_supabase_token(token), number=iterations)
+        print(f"{alg + ' verify':<22}{seconds / iterations * 1e6:>12.1f}")
+
+    token = tokens["RS256"]
+    key = auth_utils._token_cache_key(token)
+    auth_utils._token_cache.set(key, auth_utils.decode_supabase_token(token))
+    seconds = timeit.timeit(lambda: auth_utils._token_cache.get(auth_utils._token_cache_key(token)), number=iterations)
+    print(f"{'token cache hit':<22}{seconds / iterations * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
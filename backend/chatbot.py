@@ -0,0 +1,47 @@
+import os
+from typing import Iterable, Optional
+
+CHAT_LLM_MODEL = os.environ.get('CHAT_LLM_MODEL', 'gpt-4o-mini')
+
+CHITRAKAR_SYSTEM_MESSAGE = """You are Chitrakar, a helpful assistant for ChitraKalakar - an Indian art marketplace platform.
+            You help users with:
+            - Finding artists and artworks
+            - Understanding art categories and styles
+            - Explaining the platform features
+            - Answering questions about art classes
+            - Guiding users through purchases and orders
+            - Explaining membership benefits for artists
+
+            Be friendly, helpful, and knowledgeable about Indian art. If you don't know something specific about a user's order or account,
+            politely let them know that an admin will respond within 24 hours. Keep responses concise but helpful."""
+
+# A reply containing any of these is flagged for an admin to follow up
+ADMIN_REVIEW_PHRASES = ("i don't know", "admin will", "cannot help", "contact support")
+
+CHAT_FALLBACK_RESPONSE = "Thank you for your message! Our team will review and respond within 24 hours. In the meantime, feel free to browse our artists and artworks."
+
+
+class ReviewPhraseDetector:
+    """
+    Flags a reply for admin review while it streams in. Only the last
+    (longest phrase - 1) characters are carried between chunks, so a phrase split
+    across chunks is still caught and each chunk is scanned once.
+    """
+
+    def __init__(self, phrases: Iterable[str] = ADMIN_REVIEW_PHRASES):
+        self.phrases = tuple(p.lower() for p in phrases)
+        self._carry = max((len(p) for p in self.phrases), default=1) - 1
+        self._tail = ''
+        self.matched: Optional[str] = None
+
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk; True only on the chunk that completes the first match."""
+        if self.matched is not None or not chunk:
+            return False
+        window = self._tail + chunk.lower()
+        for phrase in self.phrases:
+            if phrase in window:
+                self.matched = phrase
+                return True
+        self._tail = window[-self._carry:] if self._carry else ''
+        return False
@@ -0,0 +1,175 @@
+import csv
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+GAZETTEER_PATH = os.environ.get(
+    'GAZETTEER_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'india_gazetteer.csv')
+)
+
+# Minimum Dice similarity over trigrams for a fuzzy (typo-tolerant) match
+GAZETTEER_FUZZY_THRESHOLD = float(os.environ.get('GAZETTEER_FUZZY_THRESHOLD', '0.45'))
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_place_name(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode()
+    return _NON_ALNUM_RE.sub(' ', text.lower()).strip()
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Place:
+    __slots__ = ('name', 'kind', 'state', 'lat', 'lon', 'population', 'aliases', 'rank')
+
+    def __init__(self, name: str, kind: str, state: Optional[str], lat: float, lon: float, population: int,
+                 aliases: Tuple[str, ...] = ()):
+        self.name = name
+        self.kind = kind
+        self.state = state
+        self.lat = lat
+        self.lon = lon
+        self.population = population
+        self.aliases = aliases
+        self.rank = 0
+
+    def to_location(self) -> dict:
+        """Same shape as the Nominatim-backed results of /api/locations/search."""
+        if self.kind == 'state':
+            display_name = f"{self.name}, India"
+        else:
+            display_name = f"{self.name}, {self.state}, India"
+        return {
+            "display_name": display_name,
+            "city": None if self.kind == 'state' else self.name,
+            "state": self.name if self.kind == 'state' else self.state,
+            "country": "India",
+            "country_code": "IN",
+            "lat": f"{self.lat:.4f}",
+            "lon": f"{self.lon:.4f}",
+        }
+
+
+class _TrieNode:
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.top: List[int] = []  # best-ranked place ids under this prefix
+
+
+class Gazetteer:
+    """
+    Offline index of Indian states, cities and towns. Names, aliases and every word
+    suffix of a name ("navi mumbai" -> "mumbai") go into a prefix trie whose nodes keep
+    their top-k places by population, so a prefix lookup is one walk down the trie.
+    Typos fall back to a trigram index scored by Dice similarity.
+    """
+
+    def __init__(self, places: List[Place], top_k: int = 10):
+        self.top_k = top_k
+        self.places = sorted(places, key=lambda p: -p.population)
+        for rank, place in enumerate(self.places):
+            place.rank = rank
+        self._root = _TrieNode()
+        self._exact: Dict[str, List[int]] = {}
+        self._keys: List[Tuple[int, int]] = []  # key index -> (place id, trigram count)
+        self._trigram_index: Dict[str, List[int]] = {}
+
+        # Places are ranked, so appending in order keeps every node's top list sorted
+        for place_id, place in enumerate(self.places):
+            for key in self._index_keys(place):
+                self._insert(key, place_id)
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> "Gazetteer":
+        places = []
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                places.append(Place(
+                    row['name'], row['kind'], row.get('state') or None,
+                    float(row['lat']), float(row['lon']), int(row.get('population') or 0),
+                    tuple(a for a in (row.get('aliases') or '').split('|') if a),
+                ))
+        return cls(places)
+
+    @staticmethod
+    def _index_keys(place: Place) -> set:
+        keys = set()
+        for name in (place.name, *place.aliases):
+            words = normalize_place_name(name).split()
+            for i in range(len(words)):
+                keys.add(' '.join(words[i:]))
+        return keys
+
+    def _insert(self, key: str, place_id: int):
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            if len(node.top) < self.top_k and place_id not in node.top:
+                node.top.append(place_id)
+        self._exact.setdefault(key, [])
+        if place_id not in self._exact[key]:
+            self._exact[key].append(place_id)
+
+        trigrams = _trigrams(key)
+        key_index = len(self._keys)
+        self._keys.append((place_id, len(trigrams)))
+        for trigram in trigrams:
+            self._trigram_index.setdefault(trigram, []).append(key_index)
+
+    def prefix_search(self, query: str, limit: int = 10) -> List[Place]:
+        key = normalize_place_name(query)
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        # Exact name/alias matches first, then the prefix's best-ranked places
+        ids = list(dict.fromkeys([*self._exact.get(key, []), *node.top]))
+        return [self.places[i] for i in ids[:limit]]
+
+    def fuzzy_search(self, query: str, limit: int = 10, threshold: float = GAZETTEER_FUZZY_THRESHOLD) -> List[Place]:
+        query_trigrams = _trigrams(normalize_place_name(query))
+        shared: Dict[int, int] = {}
+        for trigram in query_trigrams:
+            for key_index in self._trigram_index.get(trigram, ()):
+                shared[key_index] = shared.get(key_index, 0) + 1
+
+        best: Dict[int, float] = {}
+        for key_index, count in shared.items():
+            place_id, key_trigrams = self._keys[key_index]
+            score = 2.0 * count / (len(query_trigrams) + key_trigrams)
+            if score >= threshold and score > best.get(place_id, 0.0):
+                best[place_id] = score
+
+        ranked = sorted(best, key=lambda i: (-best[i], self.places[i].rank))
+        return [self.places[i] for i in ranked[:limit]]
+
+    def search(self, query: str, limit: int = 10) -> List[Place]:
+        """Prefix matches, topped up with fuzzy matches when there are fewer than `limit`."""
+        results = self.prefix_search(query, limit)
+        if len(results) < limit:
+            seen = {id(place) for place in results}
+            for place in self.fuzzy_search(query, limit):
+                if id(place) not in seen:
+                    results.append(place)
+                    if len(results) == limit:
+                        break
+        return results
+
+
+_gazetteer: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """Lazily load the bundled gazetteer (a few hundred rows; builds in milliseconds)."""
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = Gazetteer.load()
+    return _gazetteer
@@ -0,0 +1,202 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from gazetteer import normalize_place_name
+
+# Point at a local stub server in tests (it must speak Nominatim's /search JSON)
+GEOCODER_BASE_URL = os.environ.get('GEOCODER_BASE_URL', 'https://nominatim.openstreetmap.org')
+GEOCODER_USER_AGENT = os.environ.get('GEOCODER_USER_AGENT', 'ChitraKalakar/1.0 (support@chitrakalakar.com)')
+# Nominatim usage policy: at most 1 request per second
+GEOCODER_RATE_PER_SECOND = float(os.environ.get('GEOCODER_RATE_PER_SECOND', '1'))
+GEOCODER_BURST = int(os.environ.get('GEOCODER_BURST', '1'))
+# Give up instead of queueing behind the rate limit for longer than this
+GEOCODER_MAX_QUEUE_SECONDS = float(os.environ.get('GEOCODER_MAX_QUEUE_SECONDS', '2'))
+GEOCODER_TIMEOUT_SECONDS = float(os.environ.get('GEOCODER_TIMEOUT_SECONDS', '4'))
+GEOCODER_CACHE_SIZE = int(os.environ.get('GEOCODER_CACHE_SIZE', '5000'))
+GEOCODER_CACHE_TTL_SECONDS = int(os.environ.get('GEOCODER_CACHE_TTL_SECONDS', '86400'))
+GEOCODER_NEGATIVE_CACHE_TTL_SECONDS = int(os.environ.get('GEOCODER_NEGATIVE_CACHE_TTL_SECONDS', '3600'))
+
+
+class GeocoderUnavailable(Exception):
+    """The provider is rate-limited locally, unreachable or returned an error."""
+
+
+class _LeaderCancelled(Exception):
+    """The caller fetching a shared query went away; its followers fetch it themselves."""
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, max_wait: float):
+        """Take one token, sleeping until one is available; raise if that would exceed max_wait."""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+            if wait > max_wait:
+                raise GeocoderUnavailable("Geocoder rate limit exceeded")
+            # Reserve the token now so callers queue in arrival order
+            self.tokens -= 1
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _nominatim_location(item: dict) -> dict:
+    address = item.get("address", {})
+    return {
+        "display_name": item.get("display_name"),
+        "city": address.get("city") or address.get("town") or address.get("village"),
+        "state": address.get("state"),
+        "country": address.get("country"),
+        "country_code": address.get("country_code", "").upper(),
+        "lat": item.get("lat"),
+        "lon": item.get("lon")
+    }
+
+
+class GeocodingClient:
+    """
+    Forward geocoding against a Nominatim-compatible provider over one pooled
+    httpx.AsyncClient. Identical in-flight queries share one upstream call, results
+    (empty ones for a shorter time) sit in an LRU+TTL cache keyed by normalized
+    (q, country), and upstream calls are paced by a token bucket.
+    """
+
+    def __init__(
+        self,
+        base_url: str = GEOCODER_BASE_URL,
+        rate_per_second: float = GEOCODER_RATE_PER_SECOND,
+        burst: int = GEOCODER_BURST,
+        cache_size: int = GEOCODER_CACHE_SIZE,
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()  # key -> (expires_at, locations)
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self.stats = {"cache_hits": 0, "negative_hits": 0, "coalesced": 0, "upstream_calls": 0, "rate_limited": 0}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(GEOCODER_TIMEOUT_SECONDS),
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+                headers={"User-Agent": GEOCODER_USER_AGENT, "Accept": "application/json"},
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _cache_get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_set(self, key, locations: List[dict]):
+        ttl = GEOCODER_CACHE_TTL_SECONDS if locations else GEOCODER_NEGATIVE_CACHE_TTL_SECONDS
+        self._cache[key] = (time.monotonic() + ttl, locations)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def search(self, q: str, country: Optional[str] = None) -> List[dict]:
+        key = (normalize_place_name(q), (country or '').lower())
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.stats["cache_hits" if cached else "negative_hits"] += 1
+            return cached
+
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            locations = await self._fetch(q, key[1] or None)
+            self._cache_set(key, locations)
+            future.set_result(locations)
+            return locations
+        except asyncio.CancelledError:
+            # Only the leader's client went away (e.g. an autocomplete keystroke): a follower takes over
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch(self, q: str, country: Optional[str]) -> List[dict]:
+        """Query the provider, retrying without the country restriction when it finds nothing."""
+        client = self._get_client()
+        for country_code in ([country, None] if country else [None]):
+            params = {"q": q, "format": "json", "addressdetails": 1, "limit": 10}
+            if country_code:
+                params["countrycodes"] = country_code
+            try:
+                await self.bucket.acquire(GEOCODER_MAX_QUEUE_SECONDS)
+            except GeocoderUnavailable:
+                self.stats["rate_limited"] += 1
+                raise
+            self.stats["upstream_calls"] += 1
+            try:
+                response = await client.get("/search", params=params)
+                response.raise_for_status()
+                data = response.json() if response.text else []
+            except (httpx.HTTPError, ValueError) as e:
+                raise GeocoderUnavailable(str(e)) from e
+            if isinstance(data, list) and data:
+                return [_nominatim_location(item) for item in data[:10]]
+        return []
+
+
+_geocoder: Optional[GeocodingClient] = None
+
+
+def get_geocoder() -> GeocodingClient:
+    global _geocoder
+    if _geocoder is None:
+        _geocoder = GeocodingClient()
+    return _geocoder
+
+
+def set_geocoder(geocoder: GeocodingClient):
+    """Swap the shared client (e.g. for one pointed at a stub server in tests)."""
+    global _geocoder
+    _geocoder = geocoder
+
+
+async def close_geocoder():
+    if _geocoder is not None:
+        await _geocoder.close()
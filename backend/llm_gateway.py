@@ -0,0 +1,320 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+import httpx
+
+# 'emergent' (LlmChat, one chunk per reply), 'openai' (any OpenAI-compatible streaming
+# /chat/completions endpoint, token by token) or 'fake' (canned tokens, works offline).
+# The CHAT_LLM_* names from before the gateway served every feature are still read.
+LLM_PROVIDER = os.environ.get('LLM_PROVIDER') or os.environ.get('CHAT_LLM_PROVIDER', 'emergent')
+LLM_BASE_URL = os.environ.get('LLM_BASE_URL') or os.environ.get('CHAT_LLM_BASE_URL', 'https://api.openai.com/v1')
+LLM_TIMEOUT_SECONDS = float(os.environ.get('LLM_TIMEOUT_SECONDS') or os.environ.get('CHAT_LLM_TIMEOUT_SECONDS', '30'))
+FAKE_LLM_TOKEN_DELAY_SECONDS = float(os.environ.get('FAKE_LLM_TOKEN_DELAY_SECONDS', '0.02'))
+# Provider calls in flight across every feature (the provider quota)
+LLM_GATEWAY_MAX_CONCURRENCY = int(os.environ.get('LLM_GATEWAY_MAX_CONCURRENCY', '8'))
+
+
+class LlmUnavailable(Exception):
+    """The feature's queue is full, or the request's deadline passed while queued or generating."""
+
+
+class FeaturePolicy:
+    __slots__ = ('name', 'priority', 'concurrency', 'max_queue', 'deadline_seconds')
+
+    def __init__(self, name: str, priority: int, concurrency: int, max_queue: int, deadline_seconds: float):
+        self.name = name
+        self.priority = priority  # lower runs first when the global limit is reached
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.deadline_seconds = deadline_seconds
+
+
+LLM_FEATURE_POLICIES = {
+    "chat": FeaturePolicy(
+        "chat", 0,
+        int(os.environ.get('LLM_CHAT_CONCURRENCY', '6')),
+        int(os.environ.get('LLM_CHAT_MAX_QUEUE', '50')),
+        float(os.environ.get('LLM_CHAT_DEADLINE_SECONDS', '20')),
+    ),
+    "pricing": FeaturePolicy(
+        "pricing", 1,
+        int(os.environ.get('LLM_PRICING_CONCURRENCY', '3')),
+        int(os.environ.get('LLM_PRICING_MAX_QUEUE', '20')),
+        float(os.environ.get('LLM_PRICING_DEADLINE_SECONDS', '15')),
+    ),
+}
+
+
+class LlmProvider(ABC):
+    """Streams a completion as text chunks."""
+
+    configured = True
+
+    @abstractmethod
+    def stream(self, session_id: str, system_message: str, message: str, model: str) -> AsyncIterator[str]:
+        """An async generator of reply chunks."""
+
+    async def close(self):
+        pass
+
+
+class EmergentLlmProvider(LlmProvider):
+    """LlmChat only returns whole completions, so the reply arrives as a single chunk."""
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key or os.environ.get("EMERGENT_LLM_KEY")
+        self.configured = bool(self.api_key)
+
+    async def stream(self, session_id: str, system_message: str, message: str, model: str) -> AsyncIterator[str]:
+        from emergentintegrations.llm.chat import LlmChat, UserMessage
+
+        chat = LlmChat(
+            api_key=self.api_key,
+            session_id=session_id,
+            system_message=system_message
+        )
+        chat.with_model("openai", model)
+        yield await chat.send_message(UserMessage(text=message))
+
+
+class OpenAICompatibleLlmProvider(LlmProvider):
+    """Token streaming from an OpenAI-compatible /chat/completions endpoint (stream=true, SSE)."""
+
+    def __init__(self, base_url: str = LLM_BASE_URL, api_key: Optional[str] = None):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = (api_key or os.environ.get('LLM_API_KEY') or os.environ.get('CHAT_LLM_API_KEY')
+                        or os.environ.get('EMERGENT_LLM_KEY'))
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS),
+                headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else {},
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def stream(self, session_id: str, system_message: str, message: str, model: str) -> AsyncIterator[str]:
+        payload = {
+            "model": model,
+            "stream": True,
+            "user": session_id,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": message},
+            ],
+        }
+        async with self._get_client().stream("POST", "/chat/completions", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith('data:'):
+                    continue
+                data = line[5:].strip()
+                if data == '[DONE]':
+                    break
+                choices = json.loads(data).get('choices') or [{}]
+                content = (choices[0].get('delta') or {}).get('content')
+                if content:
+                    yield content
+
+
+class FakeLlmProvider(LlmProvider):
+    """Streams canned tokens with a small delay; the reply echoes the message so tests can check it."""
+
+    def __init__(self, tokens: Optional[Iterable[str]] = None, delay: float = FAKE_LLM_TOKEN_DELAY_SECONDS):
+        self.tokens = list(tokens) if tokens is not None else None
+        self.delay = delay
+
+    async def stream(self, session_id: str, system_message: str, message: str, model: str) -> AsyncIterator[str]:
+        tokens = self.tokens
+        if tokens is None:
+            tokens = ["Namaste! ", "You asked: ", *(f"{word} " for word in message.split()), "— happy exploring."]
+        for token in tokens:
+            await asyncio.sleep(self.delay)
+            yield token
+
+
+def _provider_from_env() -> LlmProvider:
+    if LLM_PROVIDER == 'openai':
+        return OpenAICompatibleLlmProvider()
+    if LLM_PROVIDER == 'fake':
+        return FakeLlmProvider()
+    return EmergentLlmProvider()
+
+
+class LlmGateway:
+    """
+    The one way the app calls the model. Calls take a slot under a global limit and
+    their feature's own limit; when slots are short, waiters are served by feature
+    priority, then arrival. A full queue is rejected at once and every call has a
+    deadline covering queueing and generation, so callers can fall back instead of
+    timing out together. Identical concurrent `complete` calls share one provider call.
+    """
+
+    def __init__(self, provider: LlmProvider, policies: Dict[str, FeaturePolicy] = LLM_FEATURE_POLICIES,
+                 max_concurrency: int = LLM_GATEWAY_MAX_CONCURRENCY):
+        self.provider = provider
+        self.policies = policies
+        self.max_concurrency = max_concurrency
+        self._heap: List[tuple] = []  # (priority, arrival, feature, future)
+        self._arrival = itertools.count()
+        self._in_flight: Dict[str, int] = {name: 0 for name in policies}
+        self._total_in_flight = 0
+        self._inflight_prompts: Dict[str, asyncio.Future] = {}
+        self.stats = {
+            name: {"completed": 0, "failed": 0, "rejected": 0, "timed_out": 0, "deduplicated": 0}
+            for name in policies
+        }
+
+    def _queued(self, feature: str) -> int:
+        return sum(1 for _, _, name, future in self._heap if name == feature and not future.done())
+
+    def _dispatch(self):
+        """Hand free slots to the best waiters whose feature is under its own limit."""
+        deferred = []
+        while self._heap and self._total_in_flight < self.max_concurrency:
+            entry = heapq.heappop(self._heap)
+            _, _, feature, future = entry
+            if future.done():
+                continue
+            if self._in_flight[feature] >= self.policies[feature].concurrency:
+                deferred.append(entry)
+                continue
+            self._in_flight[feature] += 1
+            self._total_in_flight += 1
+            future.set_result(None)
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+
+    def _release(self, feature: str):
+        self._in_flight[feature] -= 1
+        self._total_in_flight -= 1
+        self._dispatch()
+
+    async def _acquire(self, policy: FeaturePolicy, deadline: float):
+        if self._queued(policy.name) >= policy.max_queue:
+            self.stats[policy.name]["rejected"] += 1
+            raise LlmUnavailable(f"LLM queue for {policy.name} is full")
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (policy.priority, next(self._arrival), policy.name, future))
+        self._dispatch()
+        try:
+            await asyncio.wait_for(future, max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            self.stats[policy.name]["timed_out"] += 1
+            raise LlmUnavailable(f"No LLM slot for {policy.name} before the deadline")
+        except asyncio.CancelledError:
+            # Granted in the same tick the caller went away: hand the slot back
+            if future.done() and not future.cancelled():
+                self._release(policy.name)
+            raise
+
+    async def stream(self, feature: str, system_message: str, message: str, model: str,
+                     session_id: Optional[str] = None, deadline_seconds: Optional[float] = None) -> AsyncIterator[str]:
+        """Completion chunks as the provider produces them; the slot is held until the stream ends."""
+        policy = self.policies[feature]
+        deadline = time.monotonic() + (deadline_seconds or policy.deadline_seconds)
+        await self._acquire(policy, deadline)
+        chunks = self.provider.stream(session_id or f"{feature}-{next(self._arrival)}", system_message, message, model)
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), max(0.0, deadline - time.monotonic()))
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    self.stats[feature]["timed_out"] += 1
+                    raise LlmUnavailable(f"LLM {feature} call passed its deadline")
+                yield chunk
+            self.stats[feature]["completed"] += 1
+        except LlmUnavailable:
+            raise
+        except Exception:
+            self.stats[feature]["failed"] += 1
+            raise
+        finally:
+            await chunks.aclose()
+            self._release(feature)
+
+    async def complete(self, feature: str, system_message: str, message: str, model: str,
+                       deadline_seconds: Optional[float] = None) -> str:
+        """The whole completion; identical concurrent requests share one provider call."""
+        key = hashlib.sha256(json.dumps([feature, model, system_message, message]).encode()).hexdigest()
+        shared = self._inflight_prompts.get(key)
+        if shared is not None:
+            self.stats[feature]["deduplicated"] += 1
+            return await asyncio.shield(shared)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_prompts[key] = future
+        try:
+            text = ''.join([chunk async for chunk in self.stream(
+                feature, system_message, message, model, deadline_seconds=deadline_seconds
+            )])
+            future.set_result(text)
+            return text
+        except asyncio.CancelledError:
+            # Only the caller that owned the call went away; the others can fall back
+            future.set_exception(LlmUnavailable("Shared LLM call was cancelled"))
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._inflight_prompts.pop(key, None)
+
+    def metrics(self) -> dict:
+        features = {
+            name: {
+                "priority": policy.priority,
+                "concurrency": policy.concurrency,
+                "in_flight": self._in_flight[name],
+                "queued": self._queued(name),
+                "max_queue": policy.max_queue,
+                **self.stats[name],
+            }
+            for name, policy in self.policies.items()
+        }
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._total_in_flight,
+            "queued": sum(feature["queued"] for feature in features.values()),
+            "features": features,
+        }
+
+
+_gateway: Optional[LlmGateway] = None
+
+
+def get_llm_gateway() -> LlmGateway:
+    global _gateway
+    if _gateway is None:
+        _gateway = LlmGateway(_provider_from_env())
+    return _gateway
+
+
+def set_llm_gateway(gateway: LlmGateway):
+    """Swap the shared gateway (e.g. for one over a FakeLlmProvider in tests)."""
+    global _gateway
+    _gateway = gateway
+
+
+async def close_llm_gateway():
+    if _gateway is not None:
+        await _gateway.provider.close()
@@ -0,0 +1,82 @@
+import bisect
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# How long a worker trusts its index before re-reading active members (grants on other workers)
+MEMBERSHIP_INDEX_TTL_SECONDS = int(os.environ.get('MEMBERSHIP_INDEX_TTL_SECONDS', '60'))
+
+
+def parse_membership_expiry(value) -> Optional[float]:
+    """membership_expiry (ISO string or datetime) -> epoch seconds, or None if missing/invalid."""
+    if not value:
+        return None
+    try:
+        if isinstance(value, datetime):
+            parsed = value
+        else:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def is_membership_active(is_member, membership_expiry, now: Optional[float] = None) -> bool:
+    """The one definition of an active membership: flagged as a member with an expiry in the future."""
+    if not is_member:
+        return False
+    expiry = parse_membership_expiry(membership_expiry)
+    return expiry is not None and expiry > (time.time() if now is None else now)
+
+
+class MembershipIndex:
+    """
+    Active members keyed by artist id (O(1) `is_active_member`), plus the same entries
+    as a list sorted by expiry so the next lapse is read off the front.
+    """
+
+    def __init__(self, ttl_seconds: int = MEMBERSHIP_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._expiry: Dict[str, float] = {}
+        self._by_expiry: List[Tuple[float, str]] = []
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl_seconds
+
+    def load(self, rows: Iterable[dict]):
+        """Replace the index with profile rows carrying id, is_member and membership_expiry."""
+        expiry = {}
+        now = time.time()
+        for row in rows:
+            if is_membership_active(row.get('is_member', True), row.get('membership_expiry'), now):
+                expiry[row['id']] = parse_membership_expiry(row['membership_expiry'])
+        self._expiry = expiry
+        self._by_expiry = sorted((at, artist_id) for artist_id, at in expiry.items())
+        self.loaded_at = time.monotonic()
+
+    def set(self, artist_id: str, membership_expiry):
+        """Record a grant/renewal (or, with a missing or past expiry, a revocation)."""
+        self.discard(artist_id)
+        expiry = parse_membership_expiry(membership_expiry)
+        if expiry is not None and expiry > time.time():
+            self._expiry[artist_id] = expiry
+            bisect.insort(self._by_expiry, (expiry, artist_id))
+
+    def discard(self, artist_id: str):
+        expiry = self._expiry.pop(artist_id, None)
+        if expiry is not None:
+            i = bisect.bisect_left(self._by_expiry, (expiry, artist_id))
+            if i < len(self._by_expiry) and self._by_expiry[i] == (expiry, artist_id):
+                del self._by_expiry[i]
+
+    def is_active_member(self, artist_id: str, now: Optional[float] = None) -> bool:
+        expiry = self._expiry.get(artist_id)
+        return expiry is not None and expiry > (time.time() if now is None else now)
+
+    def next_expiry(self) -> Optional[float]:
+        return self._by_expiry[0][0] if self._by_expiry else None
@@ -0,0 +1,258 @@
+import hashlib
+import json
+import math
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Weight of the rate-table prior against marketplace prices when calibrating (in samples)
+PRICING_CALIBRATION_RIDGE = float(os.environ.get('PRICING_CALIBRATION_RIDGE', '25'))
+# Fewer approved, sized and priced artworks than this and the rate tables are used as-is
+PRICING_MIN_CALIBRATION_SAMPLES = int(os.environ.get('PRICING_MIN_CALIBRATION_SAMPLES', '30'))
+# Log-price spread assumed before calibration; the range is estimate x exp(+-spread)
+PRICING_DEFAULT_SPREAD = float(os.environ.get('PRICING_DEFAULT_SPREAD', '0.3'))
+
+# Base rate per square inch (INR)
+PRICING_MEDIUM_RATES = {
+    "oil": 120,
+    "acrylic": 80,
+    "mixed media": 70,
+    "watercolor": 60,
+    "charcoal": 40,
+}
+PRICING_DEFAULT_MEDIUM_RATE = 60
+
+# Multipliers on the base rate, relative to the defaults below (which are 1.0), following the
+# advisor guidance: hyperrealism +50-100%, originals +20-30%, professionals 2-3x beginners
+PRICING_MULTIPLIERS = {
+    "realism_level": {"abstract": 0.9, "impressionistic": 0.95, "realism": 1.0, "hyperrealism": 1.6},
+    "detailing_level": {"average": 1.0, "high_accuracy": 1.15, "excellent": 1.3},
+    "uniqueness": {"original": 1.0, "limited_edition": 0.8, "multiple_copies": 0.55},
+    "artist_experience": {"beginner": 0.6, "intermediate": 1.0, "professional": 1.6},
+}
+PRICING_DEFAULTS = {
+    "realism_level": "realism",
+    "detailing_level": "average",
+    "uniqueness": "original",
+    "artist_experience": "intermediate",
+}
+# Price elasticity to area and to hours spent (calibration may move both)
+PRICING_AREA_EXPONENT = 1.0
+PRICING_HOURS_WEIGHT = 0.05
+
+# Artist price vs. suggested max: above max is slightly high, above max * this is overpriced
+PRICING_OVERPRICED_FACTOR = 1.3
+
+_MEDIUMS = list(PRICING_MEDIUM_RATES) + ["other"]
+_FACTORS = list(PRICING_MULTIPLIERS)
+
+CM_PER_INCH = 2.54
+
+
+def _feature_layout() -> Tuple[List[str], Dict[str, int]]:
+    names = ["intercept", "log_area", "log1p_hours"]
+    names += [f"medium={medium}" for medium in _MEDIUMS]
+    for factor, levels in PRICING_MULTIPLIERS.items():
+        names += [f"{factor}={level}" for level in levels]
+    return names, {name: i for i, name in enumerate(names)}
+
+
+FEATURE_NAMES, _FEATURE_INDEX = _feature_layout()
+
+
+def _prior_weights() -> np.ndarray:
+    """Rate tables as log-linear weights: log price = log rate + sum log multipliers + log area."""
+    w = np.zeros(len(FEATURE_NAMES))
+    w[_FEATURE_INDEX["log_area"]] = PRICING_AREA_EXPONENT
+    w[_FEATURE_INDEX["log1p_hours"]] = PRICING_HOURS_WEIGHT
+    for medium in _MEDIUMS:
+        w[_FEATURE_INDEX[f"medium={medium}"]] = math.log(PRICING_MEDIUM_RATES.get(medium, PRICING_DEFAULT_MEDIUM_RATE))
+    for factor, levels in PRICING_MULTIPLIERS.items():
+        for level, multiplier in levels.items():
+            w[_FEATURE_INDEX[f"{factor}={level}"]] = math.log(multiplier)
+    return w
+
+
+def _level(value, factor: str) -> str:
+    level = str(value or '').strip().lower().replace(' ', '_').replace('-', '_')
+    return level if level in PRICING_MULTIPLIERS[factor] else PRICING_DEFAULTS[factor]
+
+
+def _medium(value) -> str:
+    medium = str(value or '').strip().lower().replace('_', ' ')
+    return medium if medium in PRICING_MEDIUM_RATES else "other"
+
+
+def feature_vector(inputs: dict) -> np.ndarray:
+    """Pricing inputs (width/height in inches, medium, levels, hours_spent) -> model features."""
+    x = np.zeros(len(FEATURE_NAMES))
+    area = max(float(inputs.get("width") or 0) * float(inputs.get("height") or 0), 1.0)
+    x[_FEATURE_INDEX["intercept"]] = 1.0
+    x[_FEATURE_INDEX["log_area"]] = math.log(area)
+    x[_FEATURE_INDEX["log1p_hours"]] = math.log1p(max(float(inputs.get("hours_spent") or 0), 0.0))
+    x[_FEATURE_INDEX[f"medium={_medium(inputs.get('medium'))}"]] = 1.0
+    for factor in _FACTORS:
+        x[_FEATURE_INDEX[f"{factor}={_level(inputs.get(factor), factor)}"]] = 1.0
+    return x
+
+
+def pricing_inputs_from_artwork(artwork: dict, artist_experience: Optional[str] = None) -> Optional[dict]:
+    """
+    Pricing inputs from an artworks row: artwork_width/artwork_height, else the
+    `dimensions` JSON (converted from cm). None when the size or price is unknown.
+    """
+    width, height = artwork.get('artwork_width'), artwork.get('artwork_height')
+    if not (width and height):
+        dimensions = artwork.get('dimensions') or {}
+        if isinstance(dimensions, str):
+            try:
+                dimensions = json.loads(dimensions)
+            except ValueError:
+                dimensions = {}
+        if not isinstance(dimensions, dict):
+            dimensions = {}
+        width, height = dimensions.get('width'), dimensions.get('height')
+        in_cm = str(dimensions.get('unit') or '').lower().startswith('cm')
+    else:
+        in_cm = False
+    try:
+        width, height, price = float(width or 0), float(height or 0), float(artwork.get('price') or 0)
+    except (TypeError, ValueError):
+        return None
+    if in_cm:
+        width, height = width / CM_PER_INCH, height / CM_PER_INCH
+    if width <= 0 or height <= 0 or price <= 0:
+        return None
+
+    uniqueness = artwork.get('uniqueness')
+    if not uniqueness and artwork.get('artwork_type'):
+        uniqueness = {'original': 'original', 'limited edition': 'limited_edition', 'open edition': 'multiple_copies'}.get(
+            str(artwork['artwork_type']).strip().lower())
+    return {
+        "width": round(width, 2),
+        "height": round(height, 2),
+        "medium": _medium(artwork.get('medium')),
+        "realism_level": _level(artwork.get('realism_level') or artwork.get('style'), 'realism_level'),
+        "detailing_level": _level(artwork.get('detailing_level'), 'detailing_level'),
+        "uniqueness": _level(uniqueness, 'uniqueness'),
+        "artist_experience": _level(artist_experience, 'artist_experience'),
+        "hours_spent": artwork.get('hours_spent'),
+        "material_cost": artwork.get('material_cost'),
+        "artist_price": price,
+    }
+
+
+def pricing_input_hash(inputs: dict, model_version: Optional[str] = None) -> str:
+    """Content hash of the inputs (and, if given, the model version) that determine a pricing result."""
+    canonical = {key: inputs.get(key) for key in (
+        "width", "height", "medium", "realism_level", "detailing_level", "uniqueness",
+        "artist_experience", "hours_spent", "material_cost", "artist_price",
+    )}
+    if model_version is not None:
+        canonical["model_version"] = model_version
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def evaluate_price(artist_price: float, min_price: float, max_price: float) -> Tuple[str, str]:
+    """(pricing_evaluation, pricing_badge) for a quoted price against the suggested range."""
+    if artist_price < min_price:
+        return "underpriced", "green"
+    if artist_price <= max_price:
+        return "fair", "green"
+    if artist_price <= max_price * PRICING_OVERPRICED_FACTOR:
+        return "slightly_high", "yellow"
+    return "overpriced", "red"
+
+
+class PricingModel:
+    """
+    Log-linear price model: log(price - material cost) = features . weights, where
+    the weights start as the log rate tables and are ridge-calibrated toward
+    approved marketplace prices. Scoring is a dot product (or one matrix-vector
+    product for a batch); the suggested range is the estimate times exp(+-spread),
+    with the spread taken from the calibration residuals.
+    """
+
+    def __init__(self, weights: Optional[np.ndarray] = None, spread: float = PRICING_DEFAULT_SPREAD,
+                 samples: int = 0):
+        self.weights = _prior_weights() if weights is None else weights
+        self.spread = spread
+        self.samples = samples
+        # Changes whenever calibration moves the weights or spread, so stored results can be re-priced
+        self.version = hashlib.sha256(
+            np.round(self.weights, 6).tobytes() + repr(round(spread, 6)).encode()
+        ).hexdigest()[:16]
+
+    @classmethod
+    def calibrate(cls, samples: Iterable[dict], ridge: float = PRICING_CALIBRATION_RIDGE,
+                  min_samples: int = PRICING_MIN_CALIBRATION_SAMPLES) -> "PricingModel":
+        """Fit to pricing inputs whose artist_price is an approved marketplace price."""
+        samples = list(samples)
+        if len(samples) < min_samples:
+            return cls()
+        X = np.stack([feature_vector(s) for s in samples])
+        prices = np.array([float(s["artist_price"]) for s in samples])
+        materials = np.array([float(s.get("material_cost") or 0) for s in samples])
+        y = np.log(np.maximum(prices - materials, prices * 0.5))
+
+        prior = _prior_weights()
+        # Ridge toward the prior: argmin |y - Xw|^2 + ridge * |w - prior|^2
+        gram = X.T @ X + ridge * np.eye(X.shape[1])
+        weights = prior + np.linalg.solve(gram, X.T @ (y - X @ prior))
+        residuals = y - X @ weights
+        spread = float(np.clip(np.std(residuals), 0.15, 0.6))
+        return cls(weights, spread, len(samples))
+
+    def estimate_many(self, inputs: List[dict]) -> np.ndarray:
+        """(n, 3) array of [estimate, min, max] for many pricing inputs at once."""
+        if not inputs:
+            return np.zeros((0, 3))
+        X = np.stack([feature_vector(i) for i in inputs])
+        materials = np.array([float(i.get("material_cost") or 0) for i in inputs])
+        core = np.exp(X @ self.weights)
+        return np.column_stack([
+            core + materials,
+            core * math.exp(-self.spread) + materials,
+            core * math.exp(self.spread) + materials,
+        ])
+
+    def analyze(self, inputs: dict) -> dict:
+        core = math.exp(float(feature_vector(inputs) @ self.weights))
+        material = float(inputs.get("material_cost") or 0)
+        estimate = core + material
+        min_price = core * math.exp(-self.spread) + material
+        max_price = core * math.exp(self.spread) + material
+        evaluation, badge = evaluate_price(float(inputs["artist_price"]), min_price, max_price)
+        return {
+            "estimated_price": int(round(estimate)),
+            "suggested_price_range": {"min": int(min_price), "max": int(max_price)},
+            "pricing_evaluation": evaluation,
+            "pricing_badge": badge,
+        }
+
+    def describe(self) -> dict:
+        return {
+            "calibrated": self.samples > 0,
+            "version": self.version,
+            "samples": self.samples,
+            "spread": round(self.spread, 4),
+            "weights": {name: round(float(w), 4) for name, w in zip(FEATURE_NAMES, self.weights)},
+        }
+
+
+def template_buyer_message(evaluation: str, medium: str) -> str:
+    """Shown until (or instead of) the model-written message."""
+    medium = medium if medium and medium != "other" else "artwork"
+    return {
+        "underpriced": f"This {medium} piece is priced below comparable works of its size and detail.",
+        "fair": f"This {medium} piece is priced in line with comparable works of its size and detail.",
+        "slightly_high": f"This {medium} piece is priced a little above comparable works; the artist may explain the premium.",
+        "overpriced": f"This {medium} piece is priced well above comparable works of its size and detail.",
+    }.get(evaluation, f"Based on size and medium, this artwork is {evaluation}.")
+
+
+def artist_suggestion_for(badge: str) -> Optional[str]:
+    if badge == "green":
+        return None
+    return "Consider providing details about materials, time invested, or unique aspects."
@@ -0,0 +1,301 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Dict, Iterable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Backend selection: "memory" (per process) or "redis" (shared; needs REDIS_URL and the redis package)
+RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND', 'memory')
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', '1000'))
+RESPONSE_CACHE_KEY_PREFIX = os.environ.get('RESPONSE_CACHE_KEY_PREFIX', 'rc:')
+REDIS_URL = os.environ.get('REDIS_URL', '')
+
+
+class _LeaderCancelled(Exception):
+    """The request computing a shared entry went away; its followers compute it themselves."""
+
+
+class InMemoryCacheBackend:
+    """Per-process LRU store. Entries are dicts: body (bytes), etag, fresh_until (epoch seconds)."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, entry, tags)
+        self._tags: Dict[str, set] = {}
+
+    def _drop(self, key: str):
+        """Remove an entry and its key from every tag set it was filed under."""
+        item = self._entries.pop(key, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Optional[dict]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        if item[0] <= time.time():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return item[1]
+
+    async def set(self, key: str, entry: dict, ttl_seconds: int, tags: Iterable[str] = ()):
+        tags = tuple(tags)
+        self._drop(key)
+        self._entries[key] = (time.time() + ttl_seconds, entry, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    async def invalidate_tags(self, tags: Iterable[str]):
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._drop(key)
+
+
+class RedisCacheBackend:
+    """
+    Shared store on any redis.asyncio-compatible client (get/set/sadd/expire/smembers/delete),
+    so a local stand-in can be passed in place of a real server. Tags are Redis sets of keys.
+    """
+
+    def __init__(self, client, prefix: str = RESPONSE_CACHE_KEY_PREFIX):
+        self.client = client
+        self.prefix = prefix
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    async def get(self, key: str) -> Optional[dict]:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        data['body'] = data['body'].encode()
+        return data
+
+    async def set(self, key: str, entry: dict, ttl_seconds: int, tags: Iterable[str] = ()):
+        payload = json.dumps({**entry, 'body': entry['body'].decode()})
+        await self.client.set(self.prefix + key, payload, ex=ttl_seconds)
+        for tag in tags:
+            await self.client.sadd(self._tag_key(tag), self.prefix + key)
+            await self.client.expire(self._tag_key(tag), ttl_seconds)
+
+    async def invalidate_tags(self, tags: Iterable[str]):
+        for tag in tags:
+            keys = await self.client.smembers(self._tag_key(tag))
+            await self.client.delete(self._tag_key(tag), *keys)
+
+
+def _create_backend():
+    if RESPONSE_CACHE_BACKEND == 'redis' and REDIS_URL:
+        try:
+            import redis.asyncio as redis_asyncio
+            return RedisCacheBackend(redis_asyncio.from_url(REDIS_URL, decode_responses=True))
+        except ImportError:
+            print("redis package not installed; falling back to in-memory response cache")
+    return InMemoryCacheBackend()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+_uncacheable: ContextVar[bool] = ContextVar('response_cache_uncacheable', default=False)
+
+
+def mark_uncacheable():
+    """Call from an endpoint (e.g. its error fallback) to serve the response without caching it."""
+    _uncacheable.set(True)
+
+
+class ResponseCache:
+    """
+    Caches JSON responses of read endpoints with a per-route TTL. After the TTL an entry
+    is served stale for up to `stale_ttl` seconds while a single background refresh runs;
+    concurrent misses on the same key share one computation. Entries carry an ETag and
+    are dropped by tag (the tables they read) when a write endpoint changes those tables.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or _create_backend()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_tasks: set = set()
+        self._tag_generations: Dict[str, int] = {}
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "not_modified": 0}
+
+    def use_backend(self, backend):
+        self.backend = backend
+
+    async def invalidate(self, *tags: str):
+        for tag in tags:
+            self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+        try:
+            await self.backend.invalidate_tags(tags)
+        except Exception as e:
+            print(f"Response cache invalidation error: {e}")
+
+    def invalidates(self, *tags: str):
+        """Decorator for write endpoints: drop cached responses with these tags once the write succeeds."""
+
+        def decorator(endpoint):
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                result = await endpoint(*args, **kwargs)
+                await self.invalidate(*tags)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def cached(self, name: str, ttl: int, stale_ttl: Optional[int] = None, tags: Iterable[str] = ()):
+        """Decorator for GET endpoints returning JSON-serialisable data."""
+        tags = tuple(tags)
+        stale_ttl = ttl if stale_ttl is None else stale_ttl
+
+        def decorator(endpoint):
+            signature = inspect.signature(endpoint)
+            request_param = next(
+                (p.name for p in signature.parameters.values() if p.annotation is Request), None
+            )
+            injected_param = request_param is None
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request: Request = kwargs.pop('_cache_request') if injected_param else kwargs[request_param]
+                key = f"{name}?{'&'.join(sorted(f'{k}={v}' for k, v in request.query_params.multi_items()))}"
+
+                async def compute():
+                    return await endpoint(*args, **kwargs)
+
+                try:
+                    entry = await self.backend.get(key)
+                except Exception as e:
+                    print(f"Response cache read error: {e}")
+                    entry = None
+
+                if entry is None:
+                    self.stats["misses"] += 1
+                    entry = await self._single_flight(key, compute, ttl, stale_ttl, tags)
+                    if isinstance(entry, Response):
+                        return entry
+                    cache_status = "MISS"
+                elif entry['fresh_until'] > time.time():
+                    self.stats["hits"] += 1
+                    cache_status = "HIT"
+                else:
+                    self.stats["stale_hits"] += 1
+                    self._refresh_in_background(key, compute, ttl, stale_ttl, tags)
+                    cache_status = "STALE"
+
+                headers = {
+                    "ETag": entry['etag'],
+                    "Cache-Control": f"public, max-age={max(0, int(entry['fresh_until'] - time.time()))}, stale-while-revalidate={stale_ttl}",
+                    "X-Cache": cache_status,
+                }
+                if _etag_matches(request.headers.get('if-none-match'), entry['etag']):
+                    self.stats["not_modified"] += 1
+                    return Response(status_code=304, headers=headers)
+                return Response(content=entry['body'], media_type="application/json", headers=headers)
+
+            if injected_param:
+                wrapper.__signature__ = signature.replace(parameters=[
+                    *signature.parameters.values(),
+                    inspect.Parameter('_cache_request', inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+                ])
+            return wrapper
+
+        return decorator
+
+    async def _single_flight(self, key, compute, ttl, stale_ttl, tags):
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry = await self._compute_and_store(key, compute, ttl, stale_ttl, tags)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            # Only the leader's client went away: let a follower take over the compute
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve the exception so an un-awaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _refresh_in_background(self, key, compute, ttl, stale_ttl, tags):
+        if key in self._inflight:
+            return
+
+        async def refresh():
+            try:
+                await self._single_flight(key, compute, ttl, stale_ttl, tags)
+            except Exception as e:
+                print(f"Response cache refresh error for {key}: {e}")
+
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _compute_and_store(self, key, compute, ttl, stale_ttl, tags):
+        generations = {tag: self._tag_generations.get(tag, 0) for tag in tags}
+        token = _uncacheable.set(False)
+        try:
+            result = await compute()
+            skip_store = _uncacheable.get()
+        finally:
+            _uncacheable.reset(token)
+
+        if isinstance(result, Response):
+            return result
+
+        body = JSONResponse(content=jsonable_encoder(result)).body
+        entry = {
+            "body": body,
+            "etag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            "fresh_until": time.time() + ttl,
+        }
+        # Don't store error fallbacks, or results computed before a concurrent invalidation
+        stale_generation = any(self._tag_generations.get(tag, 0) != gen for tag, gen in generations.items())
+        if not skip_store and not stale_generation:
+            try:
+                await self.backend.set(key, entry, ttl + stale_ttl, tags)
+            except Exception as e:
+                print(f"Response cache write error: {e}")
+        return entry
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,166 @@
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Awaitable, Callable, Optional
+
+from supabase_client import get_async_supabase_client
+
+# Lease length for leader election; the leader renews every half lease
+SCHEDULER_LEASE_TTL_SECONDS = int(os.environ.get('SCHEDULER_LEASE_TTL_SECONDS', '60'))
+
+# Fallback interval when a job has nothing scheduled
+SCHEDULER_IDLE_INTERVAL_SECONDS = int(os.environ.get('SCHEDULER_IDLE_INTERVAL_SECONDS', '3600'))
+
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+class LeaderLease:
+    """
+    Database-backed lease (scheduler_leases table) so only one worker across all
+    processes/hosts runs a given job. The lease row also carries the job's
+    published next_run_at, so any worker can reschedule the leader.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int = SCHEDULER_LEASE_TTL_SECONDS):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.holder = _WORKER_ID
+
+    async def acquire(self, supabase):
+        """Acquire or renew the lease. Returns (is_leader, published_next_run_at)."""
+        result = await supabase.rpc('acquire_scheduler_lease', {
+            "p_name": self.name,
+            "p_holder": self.holder,
+            "p_ttl_seconds": self.ttl_seconds,
+        }).execute()
+        row = (result.data or [{}])[0] if isinstance(result.data, list) else (result.data or {})
+        return bool(row.get('is_leader')), _parse_timestamp(row.get('published_next_run_at'))
+
+    async def publish_next_run(self, supabase, next_run_at: Optional[datetime]):
+        await supabase.table('scheduler_leases').update({
+            "next_run_at": next_run_at.isoformat() if next_run_at else None,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }).eq('name', self.name).execute()
+
+    async def release(self, supabase):
+        await supabase.table('scheduler_leases').update({
+            "lease_expires_at": datetime.now(timezone.utc).isoformat(),
+        }).eq('name', self.name).eq('holder', self.holder).execute()
+
+
+class ScheduledJob:
+    """
+    Runs `run_once(supabase)` on the elected leader whenever the next scheduled
+    boundary is reached. `run_once` returns the next datetime it needs to run
+    (or None to fall back to the idle interval). Between boundaries the leader
+    only renews its lease; it does not touch the job's tables.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run_once: Callable[..., Awaitable[Optional[datetime]]],
+        lease_ttl_seconds: int = SCHEDULER_LEASE_TTL_SECONDS,
+        idle_interval_seconds: int = SCHEDULER_IDLE_INTERVAL_SECONDS,
+    ):
+        self.name = name
+        self.run_once = run_once
+        self.lease = LeaderLease(name, lease_ttl_seconds)
+        self.idle_interval_seconds = idle_interval_seconds
+        self.next_run_at: Optional[datetime] = None
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._run_lock = asyncio.Lock()
+
+    def start(self):
+        if self._task is None and get_async_supabase_client():
+            self._task = asyncio.create_task(self._loop(), name=f"scheduler:{self.name}")
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        supabase = get_async_supabase_client()
+        if supabase and self.is_leader:
+            try:
+                await self.lease.release(supabase)
+            except Exception as e:
+                print(f"[scheduler:{self.name}] lease release error: {e}")
+        self.is_leader = False
+
+    def wake(self):
+        """Ask the local loop to re-check immediately (e.g. after a schedule-changing write)."""
+        self._wake.set()
+
+    async def trigger(self) -> Optional[datetime]:
+        """Run the job now on this worker and publish the new next run time for the leader."""
+        supabase = get_async_supabase_client()
+        if not supabase:
+            return None
+        next_run_at = await self._run(supabase)
+        try:
+            await self.lease.publish_next_run(supabase, next_run_at)
+        except Exception as e:
+            print(f"[scheduler:{self.name}] publish error: {e}")
+        self.wake()
+        return next_run_at
+
+    async def _run(self, supabase) -> Optional[datetime]:
+        async with self._run_lock:
+            next_run_at = await self.run_once(supabase)
+        if next_run_at is None:
+            next_run_at = datetime.now(timezone.utc) + timedelta(seconds=self.idle_interval_seconds)
+        self.next_run_at = next_run_at
+        return next_run_at
+
+    async def _loop(self):
+        renew_every = max(1, self.lease.ttl_seconds // 2)
+        while True:
+            sleep_seconds = renew_every
+            self._wake.clear()
+            supabase = get_async_supabase_client()
+            try:
+                was_leader = self.is_leader
+                self.is_leader, published_next_run = await self.lease.acquire(supabase)
+                if self.is_leader:
+                    if not was_leader:
+                        self.next_run_at = None
+                    elif published_next_run and (self.next_run_at is None or published_next_run < self.next_run_at):
+                        self.next_run_at = published_next_run
+
+                    now = datetime.now(timezone.utc)
+                    if self.next_run_at is None or self.next_run_at <= now:
+                        next_run_at = await self._run(supabase)
+                        await self.lease.publish_next_run(supabase, next_run_at)
+
+                    until_next = (self.next_run_at - datetime.now(timezone.utc)).total_seconds()
+                    sleep_seconds = max(0.0, min(renew_every, until_next))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[scheduler:{self.name}] error: {e}")
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=sleep_seconds)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,230 @@
+import heapq
+import math
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# BM25 parameters
+SEARCH_BM25_K1 = float(os.environ.get('SEARCH_BM25_K1', '1.2'))
+SEARCH_BM25_B = float(os.environ.get('SEARCH_BM25_B', '0.75'))
+# Score multiplier for a query term matched only through a typo correction
+SEARCH_FUZZY_WEIGHT = float(os.environ.get('SEARCH_FUZZY_WEIGHT', '0.7'))
+
+# Term-frequency weight of each indexed field (names and titles outrank body text)
+SEARCH_FIELD_WEIGHTS = {
+    "title": 3.0,
+    "name": 3.0,
+    "category": 2.0,
+    "categories": 2.0,
+    "medium": 2.0,
+    "style": 2.0,
+    "location": 1.5,
+    "description": 1.0,
+    "bio": 1.0,
+}
+
+SEARCH_FACET_FIELDS = ('kind', 'category', 'medium', 'style')
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({'a', 'an', 'and', 'by', 'for', 'in', 'of', 'on', 'or', 'the', 'to', 'with'})
+
+DocKey = Tuple[str, str]  # (kind, id)
+
+
+def _stem(token: str) -> str:
+    """Crude plural folding so "paintings" matches "painting"."""
+    if len(token) > 4 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text) -> List[str]:
+    if text is None:
+        return []
+    if isinstance(text, (list, tuple)):
+        return [token for item in text for token in tokenize(item)]
+    if isinstance(text, dict):
+        return tokenize(list(text.values()))
+    text = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode().lower()
+    return [_stem(token) for token in _TOKEN_RE.findall(text) if token not in _STOPWORDS]
+
+
+def _max_edits(term: str) -> int:
+    """Typo budget for a term: two edits for long words, one otherwise."""
+    return 2 if len(term) >= 8 else 1
+
+
+def _deletes(term: str, distance: int = 1) -> Set[str]:
+    """The term and every variant with up to `distance` characters removed (symmetric-delete spelling index)."""
+    variants = frontier = {term}
+    for _ in range(distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants = variants | frontier
+    return variants
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal-string-alignment distance, giving up (returning limit + 1) once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class _Document:
+    __slots__ = ('key', 'tf', 'length', 'facets', 'payload')
+
+    def __init__(self, key: DocKey, tf: Dict[str, float], length: float, facets: Dict[str, str], payload: dict):
+        self.key = key
+        self.tf = tf
+        self.length = length
+        self.facets = facets
+        self.payload = payload
+
+
+class SearchIndex:
+    """
+    In-process inverted index over weighted fields, ranked with BM25. Documents are
+    keyed by (kind, id) and can be upserted or removed one at a time. Query terms
+    missing from the vocabulary are corrected through a symmetric-delete index
+    (one or, for long words, two edits) and scored at a discount.
+    """
+
+    def __init__(self, field_weights: Optional[Dict[str, float]] = None):
+        self.field_weights = field_weights or SEARCH_FIELD_WEIGHTS
+        self._docs: Dict[DocKey, _Document] = {}
+        self._postings: Dict[str, Dict[DocKey, float]] = {}
+        self._spelling: Dict[str, Set[str]] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def upsert(self, kind: str, doc_id: str, fields: Dict[str, object], facets: Optional[Dict[str, str]] = None,
+               payload: Optional[dict] = None):
+        key = (kind, str(doc_id))
+        self.remove(kind, doc_id)
+
+        tf: Dict[str, float] = {}
+        length = 0.0
+        for field, value in fields.items():
+            weight = self.field_weights.get(field, 1.0)
+            for token in tokenize(value):
+                tf[token] = tf.get(token, 0.0) + weight
+                length += weight
+        if not tf:
+            return
+
+        facets = {'kind': kind, **{k: v for k, v in (facets or {}).items() if v}}
+        self._docs[key] = _Document(key, tf, length, facets, payload or {})
+        self._total_length += length
+        for term, weight in tf.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                for variant in _deletes(term, _max_edits(term)):
+                    self._spelling.setdefault(variant, set()).add(term)
+            postings[key] = weight
+
+    def remove(self, kind: str, doc_id: str):
+        doc = self._docs.pop((kind, str(doc_id)), None)
+        if doc is None:
+            return
+        self._total_length -= doc.length
+        for term in doc.tf:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc.key, None)
+            if not postings:
+                del self._postings[term]
+                for variant in _deletes(term, _max_edits(term)):
+                    terms = self._spelling.get(variant)
+                    if terms is not None:
+                        terms.discard(term)
+                        if not terms:
+                            del self._spelling[variant]
+
+    def _corrections(self, term: str) -> List[str]:
+        if len(term) < 4:
+            return []
+        max_distance = _max_edits(term)
+        candidates = set()
+        for variant in _deletes(term, max_distance):
+            candidates.update(self._spelling.get(variant, ()))
+        return [c for c in candidates if c != term and _edit_distance(term, c, max_distance) <= max_distance]
+
+    def _expand(self, query: str) -> Tuple[List[Tuple[str, float]], Dict[str, List[str]]]:
+        """Query -> [(term, weight)] using exact terms where indexed, corrections otherwise."""
+        expanded: Dict[str, float] = {}
+        corrected: Dict[str, List[str]] = {}
+        for token in dict.fromkeys(tokenize(query)):
+            if token in self._postings:
+                expanded[token] = max(expanded.get(token, 0.0), 1.0)
+                continue
+            corrections = self._corrections(token)
+            if corrections:
+                corrected[token] = sorted(corrections)
+            for term in corrections:
+                expanded[term] = max(expanded.get(term, 0.0), SEARCH_FUZZY_WEIGHT)
+        return list(expanded.items()), corrected
+
+    def search(self, query: str, filters: Optional[Dict[str, Iterable[str]]] = None,
+               offset: int = 0, limit: int = 20) -> dict:
+        """
+        Ranked, paginated results with facet counts. `filters` maps a facet field to
+        allowed values; each facet's counts ignore that facet's own filter, so the UI
+        can offer the other values of a selected facet.
+        """
+        filters = {field: {str(v).lower() for v in values} for field, values in (filters or {}).items() if values}
+        terms, corrected = self._expand(query)
+
+        scores: Dict[DocKey, float] = {}
+        doc_count = len(self._docs)
+        avg_length = (self._total_length / doc_count) if doc_count else 1.0
+        for term, query_weight in terms:
+            postings = self._postings.get(term, {})
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, tf in postings.items():
+                norm = SEARCH_BM25_K1 * (1 - SEARCH_BM25_B + SEARCH_BM25_B * self._docs[key].length / avg_length)
+                scores[key] = scores.get(key, 0.0) + query_weight * idf * tf * (SEARCH_BM25_K1 + 1) / (tf + norm)
+
+        def passes(doc: _Document, skip: Optional[str] = None) -> bool:
+            return all(
+                str(doc.facets.get(field, '')).lower() in allowed
+                for field, allowed in filters.items() if field != skip
+            )
+
+        facets: Dict[str, Dict[str, int]] = {field: {} for field in SEARCH_FACET_FIELDS}
+        matched: List[Tuple[float, DocKey]] = []
+        for key, score in scores.items():
+            doc = self._docs[key]
+            if passes(doc):
+                matched.append((score, key))
+            for field in SEARCH_FACET_FIELDS:
+                value = doc.facets.get(field)
+                if value and passes(doc, skip=field):
+                    facets[field][value] = facets[field].get(value, 0) + 1
+
+        top = heapq.nlargest(offset + limit, matched)[offset:]
+        results = [
+            {"kind": key[0], "id": key[1], "score": round(score, 4), **self._docs[key].payload}
+            for score, key in top
+        ]
+        return {
+            "results": results,
+            "total": len(matched),
+            "facets": {field: dict(sorted(counts.items(), key=lambda kv: -kv[1])) for field, counts in facets.items() if counts},
+            "corrections": corrected,
+        }
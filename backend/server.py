@@ -1,6 +1,7 @@
 
-from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict
@@ -13,7 +14,12 @@ import uuid
 from botocore.config import Config
 import json
 import asyncio
+import functools
 import hashlib
+import heapq
+import itertools
+import base64
+from collections import OrderedDict, deque
 import hmac
 import smtplib
 from email.message import EmailMessage
@@ -62,9 +68,32 @@ from auth_utils import (
     require_admin,
     require_lead_chitrakar,
     require_kalakar,
-    get_current_user
+    get_current_user,
+    invalidate_user_auth_cache,
+    get_auth_cache_stats,
+    start_jwks_refresh,
+    stop_jwks_refresh
+)
+from supabase_client import get_supabase_client, get_async_supabase_client, close_async_supabase_client
+from scheduler import ScheduledJob
+from response_cache import response_cache, mark_uncacheable
+from view_counter import WriteBehindViewCounter
+from membership import MembershipIndex, is_membership_active
+from search_index import SearchIndex
+from autocomplete import PrefixIndex
+from gazetteer import get_gazetteer
+from geocoding import get_geocoder, close_geocoder, GeocoderUnavailable
+from answer_cache import AnswerCache
+from chatbot import CHAT_FALLBACK_RESPONSE, CHAT_LLM_MODEL, CHITRAKAR_SYSTEM_MESSAGE, ReviewPhraseDetector
+from llm_gateway import close_llm_gateway, get_llm_gateway
+from pricing_engine import (
+    PricingModel,
+    artist_suggestion_for,
+    evaluate_price,
+    pricing_input_hash,
+    pricing_inputs_from_artwork,
+    template_buyer_message,
 )
-from supabase_client import get_supabase_client
 
 app = FastAPI(title="ChitraKalakar API")
 security = HTTPBearer()
@@ -310,6 +339,13 @@ class ArtworkPricingRequest(BaseModel):
     artist_price: float  # The price the artist is quoting
 
 
+class PricingBatchRequest(BaseModel):
+    artwork_ids: Optional[List[str]] = None
+    artist_id: Optional[str] = None  # every artwork of this artist (defaults to the caller)
+    artist_experience: Optional[str] = None  # beginner, intermediate, professional
+    force: bool = False  # re-price even when the pricing inputs are unchanged
+
+
 class ArtworkPricingResponse(BaseModel):
     suggested_price_range: dict  # {"min": value, "max": value}
     pricing_evaluation: str  # fair, slightly_high, overpriced, underpriced
@@ -357,6 +393,14 @@ class ChatMessageRequest(BaseModel):
     message: str
     session_id: Optional[str] = None
 
+class ChatFaqCreate(BaseModel):
+    question: str
+    answer: str
+
+class ChatAnswerPromotion(BaseModel):
+    question: Optional[str] = None  # defaults to the user's message
+    answer: Optional[str] = None  # defaults to the admin response, else the bot response
+
 class OrderCreate(BaseModel):
     artwork_id: str
     shipping_address: str
@@ -652,15 +696,79 @@ def _send_commission_admin_email(admin_emails: List[str], subject: str, body: st
         smtp.send_message(msg)
 
 
-def _get_commission_updates(supabase, commission_id: str):
-    updates = (
-        supabase.table("commission_updates")
-        .select("*, profiles!artist_id(full_name, avatar)")
-        .eq("commission_id", commission_id)
-        .order("created_at", desc=False)
-        .execute()
-    )
-    return updates.data or []
+# Max values per in_() filter; keeps PostgREST request URLs well under proxy limits
+IN_QUERY_CHUNK_SIZE = 150
+
+
+async def _fetch_rows_in(supabase, table: str, columns: str, column: str, values, order: Optional[tuple] = None, chunk_size: int = IN_QUERY_CHUNK_SIZE):
+    """Fetch rows where `column` is in `values` with one in_() query per chunk (chunks run concurrently)."""
+    unique_values = list(dict.fromkeys(v for v in values if v))
+    if not unique_values:
+        return []
+
+    async def fetch_chunk(chunk):
+        query = supabase.table(table).select(columns).in_(column, chunk)
+        if order:
+            query = query.order(order[0], desc=order[1])
+        result = await query.execute()
+        return result.data or []
+
+    chunks = [unique_values[i:i + chunk_size] for i in range(0, len(unique_values), chunk_size)]
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    return [row for rows in results for row in rows]
+
+
+async def _fetch_all_rows(supabase, table: str, columns: str, filters: tuple = (), page_size: int = 1000):
+    """Fetch every row matching eq-filters, paging past PostgREST's max-rows cap."""
+    rows = []
+    start = 0
+    while True:
+        query = supabase.table(table).select(columns)
+        for column, value in filters:
+            query = query.eq(column, value)
+        page = (await query.order('id').range(start, start + page_size - 1).execute()).data or []
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        start += page_size
+
+
+def _group_rows(rows: list, key: str) -> Dict[str, list]:
+    grouped: Dict[str, list] = {}
+    for row in rows:
+        grouped.setdefault(row.get(key), []).append(row)
+    return grouped
+
+
+async def _load_commission_relations(supabase, commission_ids: List[str], include_updates: bool = False):
+    """Bulk-load deals, artist requests and (optionally) status updates for a page of commissions."""
+    deals_task = _fetch_rows_in(supabase, "commission_deals", "*", "commission_id", commission_ids, order=("created_at", True))
+    requests_task = _fetch_rows_in(supabase, "artist_requests", "*", "commission_id", commission_ids, order=("sent_at", False))
+    if include_updates:
+        updates_task = _fetch_rows_in(
+            supabase,
+            "commission_updates",
+            "*, profiles!artist_id(full_name, avatar)",
+            "commission_id",
+            commission_ids,
+            order=("created_at", False),
+        )
+    else:
+        updates_task = asyncio.sleep(0, result=[])
+
+    deals, artist_requests, updates = await asyncio.gather(deals_task, requests_task, updates_task)
+    return _group_rows(deals, "commission_id"), _group_rows(artist_requests, "commission_id"), _group_rows(updates, "commission_id")
+
+
+async def _load_profiles_by_id(supabase, profile_ids, columns: str = "id, full_name, avatar, email") -> Dict[str, dict]:
+    rows = await _fetch_rows_in(supabase, "profiles", columns, "id", profile_ids)
+    return {row["id"]: row for row in rows if row.get("id")}
+
+
+def _pick_fields(row: Optional[dict], fields: List[str]) -> Optional[dict]:
+    if not row:
+        return None
+    return {field: row.get(field) for field in fields}
 
 
 def _normalize_exhibition_type(value: str) -> str:
@@ -685,37 +793,179 @@ def _parse_iso_date(value: str):
     return parsed.astimezone(timezone.utc)
 
 
-def _sync_exhibition_statuses(supabase):
+def _compute_exhibition_status(exhibition: dict, now: datetime):
+    """Return (status, next_boundary) for an exhibition; next_boundary is None once expired."""
+    start = _parse_iso_date(exhibition['start_date'])
+    _, plan = _get_exhibition_plan(exhibition.get('exhibition_type'))
+    days_paid = int(exhibition.get('days_paid') or plan['days'])
+
+    active_end = start + timedelta(days=days_paid)
+    archive_end = active_end + timedelta(days=days_paid)
+
+    if now < start:
+        return 'upcoming', start
+    if now < active_end:
+        return 'active', active_end
+    if now < archive_end:
+        return 'archived', archive_end
+    return 'expired', None
+
+
+async def _run_exhibition_lifecycle(supabase) -> Optional[datetime]:
+    """
+    Apply upcoming -> active -> archived -> expired transitions in bulk and
+    return the earliest future boundary, i.e. when this needs to run next.
+    """
     now = datetime.now(timezone.utc)
-    rows = supabase.table('exhibitions').select('id, start_date, days_paid, exhibition_type, status, is_approved').eq('is_approved', True).execute()
+    rows = await (
+        supabase.table('exhibitions')
+        .select('id, start_date, days_paid, exhibition_type, status')
+        .eq('is_approved', True)
+        .or_('status.is.null,status.not.in.(expired,paused,deleted)')
+        .execute()
+    )
+
+    transitions = []
+    next_boundary = None
     for exhibition in (rows.data or []):
         try:
-            if (exhibition.get('status') or '').lower() in ['paused', 'deleted']:
-                continue
-            start = _parse_iso_date(exhibition['start_date'])
+            next_status, boundary = _compute_exhibition_status(exhibition, now)
         except Exception:
             continue
 
-        _, plan = _get_exhibition_plan(exhibition.get('exhibition_type'))
-        days_paid = int(exhibition.get('days_paid') or plan['days'])
+        if exhibition.get('status') != next_status:
+            transitions.append({'id': exhibition['id'], 'status': next_status})
+        if boundary and (next_boundary is None or boundary < next_boundary):
+            next_boundary = boundary
 
-        active_end = start + timedelta(days=days_paid)
-        archive_end = active_end + timedelta(days=days_paid)
+    if transitions:
+        try:
+            await supabase.rpc('apply_exhibition_status_transitions', {"p_transitions": transitions}).execute()
+        except Exception as e:
+            # RPC not migrated yet: one update per target status instead of per row
+            print(f"apply_exhibition_status_transitions unavailable, using grouped updates: {e}")
+            by_status: Dict[str, List[str]] = {}
+            for transition in transitions:
+                by_status.setdefault(transition['status'], []).append(transition['id'])
+            for status, ids in by_status.items():
+                await supabase.table('exhibitions').update({
+                    'status': status,
+                    'updated_at': now.isoformat(),
+                }).in_('id', ids).execute()
+        await response_cache.invalidate('exhibitions')
+        _schedule_search_reindex('exhibition', *(transition['id'] for transition in transitions))
+
+    return next_boundary
+
+
+_exhibition_lifecycle_job = ScheduledJob('exhibition_lifecycle', _run_exhibition_lifecycle)
+
+# Active members (artist id -> expiry) for O(1) membership checks without loading profiles
+_membership_index = MembershipIndex()
+_membership_index_lock = asyncio.Lock()
+
+
+async def _ensure_membership_index(supabase) -> MembershipIndex:
+    """Reload the active-member index when it is older than MEMBERSHIP_INDEX_TTL_SECONDS."""
+    if not _membership_index.is_stale or not supabase:
+        return _membership_index
+    async with _membership_index_lock:
+        if _membership_index.is_stale:
+            try:
+                rows = await (
+                    supabase.table('profiles')
+                    .select('id, is_member, membership_expiry')
+                    .eq('is_member', True)
+                    .gt('membership_expiry', datetime.now(timezone.utc).isoformat())
+                    .execute()
+                )
+                _membership_index.load(rows.data or [])
+            except Exception as e:
+                print(f"Membership index load error: {e}")
+    return _membership_index
 
-        if now < start:
-            next_status = 'upcoming'
-        elif start <= now < active_end:
-            next_status = 'active'
-        elif active_end <= now < archive_end:
-            next_status = 'archived'
-        else:
-            next_status = 'expired'
 
-        if exhibition.get('status') != next_status:
-            supabase.table('exhibitions').update({
-                'status': next_status,
-                'updated_at': datetime.now(timezone.utc).isoformat(),
-            }).eq('id', exhibition['id']).execute()
+async def _is_active_member(supabase, artist_id: str) -> bool:
+    """
+    O(1) check against the index. A miss is confirmed against the profile, since the
+    membership may have been granted on another worker since the index was loaded.
+    """
+    index = await _ensure_membership_index(supabase)
+    if index.is_active_member(artist_id):
+        return True
+    profile = await supabase.table('profiles').select('is_member, membership_expiry').eq('id', artist_id).execute()
+    row = (profile.data or [None])[0]
+    if row and is_membership_active(row.get('is_member'), row.get('membership_expiry')):
+        index.set(artist_id, row['membership_expiry'])
+        return True
+    return False
+
+
+async def _run_membership_expiry(supabase) -> Optional[datetime]:
+    """
+    Flip is_member off for every lapsed membership in one update, then reload the
+    index and return the next expiry (capped by the idle interval, which doubles as a
+    resync for grants made elsewhere) so the scheduler wakes exactly when it lapses.
+    """
+    now = datetime.now(timezone.utc)
+    result = await (
+        supabase.table('profiles')
+        .update({"is_member": False})
+        .eq('is_member', True)
+        .lte('membership_expiry', now.isoformat())
+        .execute()
+    )
+    lapsed = [row['id'] for row in (result.data or [])]
+    if lapsed:
+        print(f"[membership] {len(lapsed)} memberships lapsed")
+        for artist_id in lapsed:
+            _membership_index.discard(artist_id)
+            invalidate_user_auth_cache(artist_id)
+        _trending_snapshot["expires_at"] = 0.0
+        await response_cache.invalidate('profiles', 'featured_artists')
+
+    _membership_index.loaded_at = None
+    await _ensure_membership_index(supabase)
+    resync_at = now + timedelta(seconds=_membership_expiry_job.idle_interval_seconds)
+    next_expiry = _membership_index.next_expiry()
+    if next_expiry is None:
+        return resync_at
+    return min(datetime.fromtimestamp(next_expiry, timezone.utc), resync_at)
+
+
+_membership_expiry_job = ScheduledJob('membership_expiry', _run_membership_expiry)
+
+# Min-heap of (expires_at, featured_artists.id): the leader sleeps until its head
+_featured_expiry_heap: List[tuple] = []
+
+
+async def _run_featured_expiry(supabase) -> Optional[datetime]:
+    """
+    Remove every expired featured artist with one bulk delete and one bulk profile
+    update, rebuild the heap from the remaining expiries, and return the next one.
+    """
+    now = datetime.now(timezone.utc)
+    deleted = await supabase.table('featured_artists').delete().lte('expires_at', now.isoformat()).execute()
+    expired_artist_ids = list({row['artist_id'] for row in (deleted.data or []) if row.get('artist_id')})
+    if expired_artist_ids:
+        await supabase.table('profiles').update({"is_featured": False}).in_('id', expired_artist_ids).execute()
+    if deleted.data:
+        print(f"[featured] {len(deleted.data)} featured artists expired")
+        await response_cache.invalidate('featured_artists', 'profiles')
+
+    upcoming = await supabase.table('featured_artists').select('id, expires_at').gt('expires_at', now.isoformat()).execute()
+    heap = []
+    for row in (upcoming.data or []):
+        try:
+            heap.append((datetime.fromisoformat(row['expires_at'].replace('Z', '+00:00')), row['id']))
+        except (TypeError, ValueError):
+            continue
+    heapq.heapify(heap)
+    _featured_expiry_heap[:] = heap
+    return _featured_expiry_heap[0][0] if _featured_expiry_heap else None
+
+
+_featured_expiry_job = ScheduledJob('featured_expiry', _run_featured_expiry)
 
 
 def _resolve_upload_bucket(bucket_key: Optional[str]):
@@ -775,9 +1025,9 @@ def _commission_public_artist_profile(profile: dict, category_row: dict, artwork
     }
 
 
-def _get_commission_matching_artists_sync(supabase, category: str, budget: float):
+async def _get_commission_matching_artists(supabase, category: str, budget: float):
     matching_categories = (
-        supabase.table("artist_categories")
+        await supabase.table("artist_categories")
         .select("*")
         .eq("category", category)
         .lte("min_price", budget)
@@ -792,7 +1042,7 @@ def _get_commission_matching_artists_sync(supabase, category: str, budget: float
             continue
 
         profile = (
-            supabase.table("profiles")
+            await supabase.table("profiles")
             .select("id, full_name, role, is_approved, is_active, rating, delivery_days, negotiation_allowed, availability_status")
             .eq("id", artist_id)
             .single()
@@ -808,7 +1058,7 @@ def _get_commission_matching_artists_sync(supabase, category: str, budget: float
             continue
 
         artworks = (
-            supabase.table("artworks")
+            await supabase.table("artworks")
             .select("id, title, category, image")
             .eq("artist_id", artist_id)
             .eq("is_approved", True)
@@ -821,149 +1071,183 @@ def _get_commission_matching_artists_sync(supabase, category: str, budget: float
 
     return artists[:10]
 
+# ============ LIFECYCLE ============
+
+# Overall time budget for a single API request (seconds). Individual PostgREST
+# round-trips are bounded separately by DB_REQUEST_TIMEOUT in supabase_client.
+REQUEST_TIMEOUT_BUDGET = float(os.environ.get("REQUEST_TIMEOUT_BUDGET", "30"))
+
+@app.middleware("http")
+async def enforce_request_timeout_budget(request: Request, call_next):
+    try:
+        return await asyncio.wait_for(call_next(request), timeout=REQUEST_TIMEOUT_BUDGET)
+    except asyncio.TimeoutError:
+        return JSONResponse(status_code=504, content={"detail": "Request timed out"})
+
+@app.on_event("startup")
+async def start_background_jobs():
+    await start_jwks_refresh()
+    _exhibition_lifecycle_job.start()
+    _membership_expiry_job.start()
+    _featured_expiry_job.start()
+    _community_count_job.start()
+    _trending_rebase_job.start()
+    _view_counter.start()
+    _index_refresh_tasks.extend([
+        asyncio.create_task(
+            _refresh_periodically("Search index", _rebuild_search_index, SEARCH_INDEX_REFRESH_SECONDS),
+            name="search-index-refresh",
+        ),
+        asyncio.create_task(
+            _refresh_periodically("Autocomplete index", _rebuild_autocomplete_index, AUTOCOMPLETE_REFRESH_SECONDS),
+            name="autocomplete-refresh",
+        ),
+        asyncio.create_task(
+            _refresh_periodically("Chat FAQ", _reload_chat_faq, CHAT_FAQ_REFRESH_SECONDS),
+            name="chat-faq-refresh",
+        ),
+        asyncio.create_task(
+            _refresh_periodically("Pricing model", _calibrate_pricing_model, PRICING_CALIBRATION_SECONDS),
+            name="pricing-calibration",
+        ),
+    ])
+
+@app.on_event("shutdown")
+async def close_database_pool():
+    await _exhibition_lifecycle_job.stop()
+    await _membership_expiry_job.stop()
+    await _featured_expiry_job.stop()
+    await _community_count_job.stop()
+    await _trending_rebase_job.stop()
+    for task in _index_refresh_tasks:
+        task.cancel()
+    await stop_jwks_refresh()
+    await _view_counter.stop()
+    await close_geocoder()
+    await close_llm_gateway()
+    await close_async_supabase_client()
+
 # ============ HEALTH CHECK ============
 
 @app.get("/api/health")
 async def health_check():
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     db_status = "connected" if supabase else "not_configured"
     return {"status": "healthy", "database": db_status}
 
+@app.get("/api/admin/metrics/auth-cache")
+async def get_auth_cache_metrics(admin: dict = Depends(require_admin)):
+    """Hit ratios for the verified-token and profile-role caches"""
+    return get_auth_cache_stats()
+
+@app.get("/api/admin/metrics/response-cache")
+async def get_response_cache_metrics(admin: dict = Depends(require_admin)):
+    """Hit/stale/miss counts for the public response cache"""
+    return response_cache.stats
+
+@app.get("/api/admin/metrics/llm-gateway")
+async def get_llm_gateway_metrics(admin: dict = Depends(require_admin)):
+    """Per-feature in-flight calls, queue depth, rejections and timeouts of the LLM gateway"""
+    return get_llm_gateway().metrics()
+
+@app.get("/api/admin/metrics/chat-answer-cache")
+async def get_chat_answer_cache_metrics(admin: dict = Depends(require_admin)):
+    """Hit rate of the chatbot FAQ/answer cache"""
+    return _answer_cache.metrics()
+
 # ============ LOCATION SERVICES ============
 
 @app.get("/api/locations/search")
 async def search_locations(q: str, country: Optional[str] = None):
-    """Search locations using OpenStreetMap Nominatim API"""
-    import httpx
-
-    def fallback_locations(search_query: str):
-        """Fallback city suggestions when geocoder is blocked/rate-limited."""
-        city_state_pairs = [
-            ("Chennai", "Tamil Nadu"), ("Coimbatore", "Tamil Nadu"), ("Madurai", "Tamil Nadu"),
-            ("Salem", "Tamil Nadu"), ("Trichy", "Tamil Nadu"), ("Erode", "Tamil Nadu"),
-            ("Bengaluru", "Karnataka"), ("Mysuru", "Karnataka"), ("Mangaluru", "Karnataka"),
-            ("Hyderabad", "Telangana"), ("Warangal", "Telangana"), ("Vijayawada", "Andhra Pradesh"),
-            ("Visakhapatnam", "Andhra Pradesh"), ("Mumbai", "Maharashtra"), ("Pune", "Maharashtra"),
-            ("Nagpur", "Maharashtra"), ("Nashik", "Maharashtra"), ("Ahmedabad", "Gujarat"),
-            ("Surat", "Gujarat"), ("Vadodara", "Gujarat"), ("Jaipur", "Rajasthan"),
-            ("Udaipur", "Rajasthan"), ("Delhi", "Delhi"), ("Noida", "Uttar Pradesh"),
-            ("Lucknow", "Uttar Pradesh"), ("Kanpur", "Uttar Pradesh"), ("Kolkata", "West Bengal"),
-            ("Howrah", "West Bengal"), ("Bhubaneswar", "Odisha"), ("Cuttack", "Odisha"),
-            ("Bhopal", "Madhya Pradesh"), ("Indore", "Madhya Pradesh"), ("Patna", "Bihar"),
-            ("Ranchi", "Jharkhand"), ("Kochi", "Kerala"), ("Thiruvananthapuram", "Kerala"),
-            ("Kozhikode", "Kerala"), ("Chandigarh", "Chandigarh"), ("Amritsar", "Punjab"),
-            ("Ludhiana", "Punjab"), ("Guwahati", "Assam"), ("Shillong", "Meghalaya"),
-            ("Panaji", "Goa"), ("Dehradun", "Uttarakhand"),
-        ]
-
-        term = (search_query or "").strip().lower()
-        matches = []
-        for city, state in city_state_pairs:
-            if term in city.lower() or term in state.lower():
-                matches.append({
-                    "display_name": f"{city}, {state}, India",
-                    "city": city,
-                    "state": state,
-                    "country": "India",
-                    "country_code": "IN",
-                    "lat": None,
-                    "lon": None,
-                })
-        return {"locations": matches[:10]}
-    
+    """Search locations: bundled Indian gazetteer first, OpenStreetMap Nominatim for the rest"""
     if len(q) < 2:
         return {"locations": []}
     
+    gazetteer = get_gazetteer()
+    if not country or country.lower() == "in":
+        local_matches = gazetteer.search(q, limit=10)
+        if local_matches:
+            return {"locations": [place.to_location() for place in local_matches]}
+    
     try:
-        params = {
-            "q": q,
-            "format": "json",
-            "addressdetails": 1,
-            "limit": 10
-        }
-        
-        if country:
-            params["countrycodes"] = country.lower()
-        
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            response = await client.get(
-                "https://nominatim.openstreetmap.org/search",
-                params=params,
-                headers={
-                    "User-Agent": "ChitraKalakar/1.0 (support@chitrakalakar.com)",
-                    "Accept": "application/json",
-                }
-            )
-
-            if response.status_code != 200:
-                return fallback_locations(q)
-
-            try:
-                data = response.json()
-            except Exception:
-                return fallback_locations(q)
-
-            if not isinstance(data, list):
-                return fallback_locations(q)
-        
-        locations = []
-        for item in data:
-            address = item.get("address", {})
-            locations.append({
-                "display_name": item.get("display_name"),
-                "city": address.get("city") or address.get("town") or address.get("village"),
-                "state": address.get("state"),
-                "country": address.get("country"),
-                "country_code": address.get("country_code", "").upper(),
-                "lat": item.get("lat"),
-                "lon": item.get("lon")
-            })
-        
+        locations = await get_geocoder().search(q, country)
         if locations:
             return {"locations": locations}
+    except GeocoderUnavailable as e:
+        print(f"Location search error: {e}")
+    
+    # Geocoder blocked/rate-limited or empty: loosest local fuzzy match
+    return {"locations": [place.to_location() for place in gazetteer.fuzzy_search(q, limit=10, threshold=0.3)]}
+
+# ============ PLATFORM COUNTERS ============
+
+# Counters maintained by triggers in platform_counters (scripts/platform_counters_migration.sql):
+# name -> (table, filters) for the count(*) fallback used until the migration has been applied
+PLATFORM_COUNTER_QUERIES = {
+    "total_users": ('profiles', ()),
+    "pending_artists": ('profiles', (('role', 'artist'), ('is_approved', False))),
+    "approved_artists": ('profiles', (('role', 'artist'), ('is_approved', True))),
+    "pending_artworks": ('artworks', (('is_approved', False),)),
+    "approved_artworks": ('artworks', (('is_approved', True),)),
+    "pending_exhibitions": ('exhibitions', (('is_approved', False),)),
+    "approved_exhibitions": ('exhibitions', (('is_approved', True),)),
+    "pending_communities": ('communities', (('is_approved', False),)),
+    "pending_modifications": ('profile_modifications', (('status', 'pending'),)),
+    "pending_screenings": ('video_screenings', (('status', 'pending'),)),
+}
+# Unfiltered counts that may use the planner's row estimate when the caller allows it
+PLATFORM_COUNTER_ESTIMABLE = {"total_users"}
+PLATFORM_COUNTERS_TTL_SECONDS = int(os.environ.get('PLATFORM_COUNTERS_TTL_SECONDS', '15'))
 
-        # Secondary attempt without country restriction
-        if country:
-            try:
-                async with httpx.AsyncClient(timeout=8.0) as client:
-                    response = await client.get(
-                        "https://nominatim.openstreetmap.org/search",
-                        params={"q": q, "format": "json", "addressdetails": 1, "limit": 10},
-                        headers={"User-Agent": "ChitraKalakar/1.0 (support@chitrakalakar.com)", "Accept": "application/json"},
-                    )
-                    if response.status_code == 200:
-                        data = response.json() if response.text else []
-                        if isinstance(data, list):
-                            for item in data:
-                                address = item.get("address", {})
-                                locations.append({
-                                    "display_name": item.get("display_name"),
-                                    "city": address.get("city") or address.get("town") or address.get("village"),
-                                    "state": address.get("state"),
-                                    "country": address.get("country"),
-                                    "country_code": address.get("country_code", "").upper(),
-                                    "lat": item.get("lat"),
-                                    "lon": item.get("lon"),
-                                })
-            except Exception:
-                pass
+_platform_counters_view = {"values": None, "expires_at": 0.0}
 
-        if locations:
-            return {"locations": locations[:10]}
 
-        return fallback_locations(q)
+async def _count_platform_counter(supabase, name: str, estimated: bool = False) -> int:
+    table, filters = PLATFORM_COUNTER_QUERIES[name]
+    count_method = 'estimated' if estimated and name in PLATFORM_COUNTER_ESTIMABLE else 'exact'
+    try:
+        query = supabase.table(table).select('id', count=count_method).limit(1)
+        for column, value in filters:
+            query = query.eq(column, value)
+        return (await query.execute()).count or 0
     except Exception as e:
-        print(f"Location search error: {e}")
-        return fallback_locations(q)
+        print(f"Platform counter fallback error ({name}): {e}")
+        return 0
+
+
+async def _load_platform_counters(supabase, estimated: bool = False) -> Dict[str, int]:
+    """All counters in one query; falls back to concurrent count(*) queries if the table is missing or incomplete."""
+    try:
+        rows = (await supabase.table('platform_counters').select('name, value').execute()).data or []
+        values = {row['name']: int(row['value'] or 0) for row in rows}
+        if all(name in values for name in PLATFORM_COUNTER_QUERIES):
+            _platform_counters_view.update(values=values, expires_at=time.monotonic() + PLATFORM_COUNTERS_TTL_SECONDS)
+            return values
+    except Exception as e:
+        print(f"Platform counters read error, counting directly: {e}")
+
+    names = list(PLATFORM_COUNTER_QUERIES)
+    counts = await asyncio.gather(*(_count_platform_counter(supabase, name, estimated) for name in names))
+    return dict(zip(names, counts))
+
+
+async def _get_platform_counters(supabase) -> Dict[str, int]:
+    """Process-local view of platform_counters, re-read at most every PLATFORM_COUNTERS_TTL_SECONDS."""
+    if _platform_counters_view["values"] is not None and _platform_counters_view["expires_at"] > time.monotonic():
+        return _platform_counters_view["values"]
+    return await _load_platform_counters(supabase)
+
 
 # ============ PUBLIC ROUTES ============
 
 @app.get("/api/public/stats")
+@response_cache.cached("public_stats", ttl=300, tags=('profiles', 'artworks', 'exhibitions'))
 async def get_public_stats():
     """Get platform statistics - optimized for fast loading"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         # Return demo data when Supabase is not configured
         return {
             "total_artists": 0,
@@ -973,42 +1257,16 @@ async def get_public_stats():
         }
     
     try:
-        # Run all counts in parallel for faster loading
-        import asyncio
-        
-        async def get_artist_count():
-            try:
-                return supabase.table('profiles').select('id', count='exact').eq('role', 'artist').eq('is_approved', True).execute().count or 0
-            except:
-                return 0
-                
-        async def get_artwork_count():
-            try:
-                return supabase.table('artworks').select('id', count='exact').eq('is_approved', True).execute().count or 0
-            except:
-                return 0
-                
-        async def get_exhibition_count():
-            try:
-                return supabase.table('exhibitions').select('id', count='exact').eq('is_approved', True).execute().count or 0
-            except:
-                return 0
-        
-        # Execute all queries in parallel
-        artists_count, artworks_count, exhibitions_count = await asyncio.gather(
-            get_artist_count(),
-            get_artwork_count(),
-            get_exhibition_count()
-        )
-        
+        counters = await _get_platform_counters(supabase)
         return {
-            "total_artists": artists_count,
-            "total_artworks": artworks_count,
-            "active_exhibitions": exhibitions_count,
+            "total_artists": counters["approved_artists"],
+            "total_artworks": counters["approved_artworks"],
+            "active_exhibitions": counters["approved_exhibitions"],
             "satisfaction_rate": 98
         }
     except Exception as e:
         print(f"Stats error: {e}")
+        mark_uncacheable()
         return {
             "total_artists": 0,
             "total_artworks": 0,
@@ -1017,70 +1275,62 @@ async def get_public_stats():
         }
 
 @app.get("/api/public/featured-artists")
+@response_cache.cached("public_featured_artists", ttl=120, tags=('featured_artists', 'profiles'))
 async def get_featured_artists():
     """Get featured artists (contemporary and registered with membership)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         return {"contemporary": [], "registered": []}
     
     try:
         # Get contemporary featured artists
-        contemporary = supabase.table('featured_artists').select('*').eq('type', 'contemporary').eq('is_featured', True).execute()
-        
-        # Get registered featured artists (only those with active membership)
-        registered_query = supabase.table('featured_artists').select('*, profiles!artist_id(is_member, membership_expiry)').eq('type', 'registered').eq('is_featured', True).execute()
+        contemporary = await supabase.table('featured_artists').select('*').eq('type', 'contemporary').eq('is_featured', True).execute()
         
-        # Filter registered artists to only include those with active membership
-        registered_with_membership = []
-        now = datetime.now(timezone.utc)
-        for artist in (registered_query.data or []):
-            profile = artist.get('profiles', {})
-            if profile and profile.get('is_member'):
-                expiry = profile.get('membership_expiry')
-                if expiry:
-                    try:
-                        expiry_date = datetime.fromisoformat(expiry.replace('Z', '+00:00'))
-                        if expiry_date > now:
-                            registered_with_membership.append(artist)
-                    except:
-                        pass
+        # Get registered featured artists (only those with active membership, filtered in SQL)
+        registered = await (
+            supabase.table('featured_artists')
+            .select('*, profiles!artist_id!inner(is_member, membership_expiry)')
+            .eq('type', 'registered')
+            .eq('is_featured', True)
+            .eq('profiles.is_member', True)
+            .gt('profiles.membership_expiry', datetime.now(timezone.utc).isoformat())
+            .execute()
+        )
         
         return {
             "contemporary": contemporary.data or [],
-            "registered": registered_with_membership
+            "registered": registered.data or []
         }
     except Exception as e:
         print(f"Featured artists error: {e}")
+        mark_uncacheable()
         return {"contemporary": [], "registered": []}
 
 @app.get("/api/public/artists")
+@response_cache.cached("public_artists", ttl=120, tags=('profiles',))
 async def get_public_artists():
     """Get all approved and registered artists (without contact info for public view)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         return {"artists": []}
     
     try:
         # Get all approved and active artists
-        artists = supabase.table('profiles').select(
+        artists = await supabase.table('profiles').select(
             'id, full_name, bio, categories, location, avatar, created_at, is_member, membership_expiry'
         ).eq('role', 'artist').eq('is_approved', True).eq('is_active', True).execute()
         
         # Return ALL registered artists (not filtered by membership)
         artist_list = []
-        now = datetime.now(timezone.utc)
+        now = time.time()
         
         for artist in (artists.data or []):
             # Check membership status for display purposes
-            is_active_member = False
-            if artist.get('is_member') and artist.get('membership_expiry'):
-                try:
-                    expiry = datetime.fromisoformat(artist['membership_expiry'].replace('Z', '+00:00'))
-                    is_active_member = expiry > now
-                except:
-                    pass
+            is_active_member = is_membership_active(artist.get('is_member'), artist.get('membership_expiry'), now)
             
             # Include ALL registered artists
             artist_list.append({
@@ -1097,19 +1347,20 @@ async def get_public_artists():
         return {"artists": artist_list}
     except Exception as e:
         print(f"Artists error: {e}")
+        mark_uncacheable()
         return {"artists": []}
 
 @app.get("/api/public/artist/{artist_id}")
 async def get_public_artist_detail(artist_id: str):
     """Get artist detail with artworks (without contact info)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
     
     try:
         # Get artist without contact info
-        artist = supabase.table('profiles').select(
+        artist = await supabase.table('profiles').select(
             'id, full_name, bio, categories, location, avatar, created_at'
         ).eq('id', artist_id).eq('role', 'artist').eq('is_approved', True).single().execute()
         
@@ -1117,7 +1368,7 @@ async def get_public_artist_detail(artist_id: str):
             raise HTTPException(status_code=404, detail="Artist not found")
         
         # Get artist's approved artworks
-        artworks = supabase.table('artworks').select('*').eq('artist_id', artist_id).eq('is_approved', True).eq('in_marketplace', True).order('created_at', desc=True).execute()
+        artworks = await supabase.table('artworks').select('*').eq('artist_id', artist_id).eq('is_approved', True).eq('in_marketplace', True).order('created_at', desc=True).execute()
         
         return {
             "artist": artist.data,
@@ -1129,44 +1380,102 @@ async def get_public_artist_detail(artist_id: str):
         print(f"Artist detail error: {e}")
         raise HTTPException(status_code=500, detail="Error fetching artist")
 
+# Columns a marketplace card needs; projection=full returns every artwork column
+PAINTING_CARD_COLUMNS = (
+    'id, artist_id, title, category, medium, style, orientation, suitable_rooms, dimensions, '
+    'year_of_creation, price, price_type, currency, image, images, image_display_settings, '
+    'artwork_type, certificate_of_authenticity, signed_by_artist, framing_status, views, created_at'
+)
+PAINTING_PROJECTIONS = {"card": PAINTING_CARD_COLUMNS, "full": "*"}
+
+
+def _encode_keyset_cursor(row: dict, sort_column: str = 'created_at') -> str:
+    raw = json.dumps([row.get(sort_column), row.get('id')]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_keyset_cursor(cursor: str):
+    """(timestamp, id) from a cursor, re-serialized from parsed values since both are spliced into .or_() filters."""
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at.replace('Z', '+00:00')).isoformat(), str(uuid.UUID(row_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @app.get("/api/public/paintings")
-async def get_public_paintings():
-    """Get all approved artworks for marketplace (without artist contact info)"""
-    supabase = get_supabase_client()
+@response_cache.cached("public_paintings", ttl=60, tags=('artworks', 'profiles'))
+async def get_public_paintings(
+    cursor: Optional[str] = None,
+    limit: int = Query(48, ge=1, le=100),
+    category: Optional[str] = None,
+    medium: Optional[str] = None,
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    orientation: Optional[str] = None,
+    room: Optional[str] = None,
+    projection: str = Query("card", pattern="^(card|full)$"),
+):
+    """Get approved marketplace artworks, newest first, keyset-paginated on (created_at, id)"""
+    supabase = get_async_supabase_client()
     
     if not supabase:
-        return {"paintings": []}
+        mark_uncacheable()
+        return {"paintings": [], "next_cursor": None}
     
     try:
-        # Get all approved artworks that are in marketplace with artist name (but no contact info)
-        artworks = supabase.table('artworks').select(
-            '*, profiles!inner(id, full_name, avatar, location)'
-        ).eq('is_approved', True).eq('in_marketplace', True).eq('is_available', True).order('created_at', desc=True).execute()
+        # Artist name but no contact info
+        query = supabase.table('artworks').select(
+            f"{PAINTING_PROJECTIONS[projection]}, profiles!inner(id, full_name, avatar, location)"
+        ).eq('is_approved', True).eq('in_marketplace', True).eq('is_available', True)
         
-        return {"paintings": artworks.data or []}
+        if category:
+            query = query.eq('category', category)
+        if medium:
+            query = query.eq('medium', medium)
+        if min_price is not None:
+            query = query.gte('price', min_price)
+        if max_price is not None:
+            query = query.lt('price', max_price)
+        if orientation:
+            query = query.eq('orientation', orientation)
+        if room:
+            query = query.contains('suitable_rooms', [room])
+        if cursor:
+            created_at, row_id = _decode_keyset_cursor(cursor)
+            query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{row_id}")')
+        
+        # One extra row tells us whether another page exists
+        artworks = await query.order('created_at', desc=True).order('id', desc=True).limit(limit + 1).execute()
+        rows = artworks.data or []
+        next_cursor = _encode_keyset_cursor(rows[limit - 1]) if len(rows) > limit else None
+        
+        return {"paintings": rows[:limit], "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Paintings error: {e}")
-        return {"paintings": []}
+        mark_uncacheable()
+        return {"paintings": [], "next_cursor": None}
 
 @app.get("/api/public/painting/{painting_id}")
 async def get_painting_detail(painting_id: str):
     """Get painting detail with artist info (without contact)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
     
     try:
-        painting = supabase.table('artworks').select(
+        painting = await supabase.table('artworks').select(
             '*, profiles!inner(id, full_name, avatar, location, bio, categories)'
         ).eq('id', painting_id).single().execute()
         
         if not painting.data:
             raise HTTPException(status_code=404, detail="Painting not found")
         
-        # Increment views
-        current_views = painting.data.get('views', 0)
-        supabase.table('artworks').update({'views': current_views + 1}).eq('id', painting_id).execute()
+        # Counted in memory and flushed in bulk by _view_counter
+        _view_counter.record(painting_id, painting.data.get('artist_id'))
         
         return {"painting": painting.data}
     except HTTPException:
@@ -1178,13 +1487,13 @@ async def get_painting_detail(painting_id: str):
 @app.get("/api/public/featured-artist/{artist_id}")
 async def get_featured_artist_detail(artist_id: str):
     """Get detailed info about a featured artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
     
     try:
-        artist = supabase.table('featured_artists').select('*').eq('id', artist_id).single().execute()
+        artist = await supabase.table('featured_artists').select('*').eq('id', artist_id).single().execute()
         
         if not artist.data:
             raise HTTPException(status_code=404, detail="Artist not found")
@@ -1196,188 +1505,716 @@ async def get_featured_artist_detail(artist_id: str):
         print(f"Featured artist detail error: {e}")
         raise HTTPException(status_code=500, detail="Error fetching artist")
 
-def _enrich_exhibition_with_artworks(supabase, exhibition: dict) -> dict:
-    """Enrich exhibition with artwork data if artwork_ids exist but exhibition_paintings is empty"""
-    enriched = dict(exhibition)
-    
-    # If exhibition_paintings already has data, use it
-    if enriched.get('exhibition_paintings') and len(enriched.get('exhibition_paintings', [])) > 0:
-        return enriched
-    
-    # If exhibition_images already has data, use it as primary
-    if enriched.get('exhibition_images') and len(enriched.get('exhibition_images', [])) > 0:
-        if not enriched.get('primary_exhibition_image'):
-            enriched['primary_exhibition_image'] = enriched['exhibition_images'][0]
-        return enriched
-    
-    # Try to fetch artworks via artwork_ids
-    artwork_ids = enriched.get('artwork_ids', [])
-    if artwork_ids and len(artwork_ids) > 0:
-        try:
-            artworks_result = supabase.table('artworks').select('id, title, image, images, price, description').in_('id', artwork_ids).execute()
-            if artworks_result.data:
-                paintings = []
-                images = []
-                for artwork in artworks_result.data:
-                    img = artwork.get('images', [None])[0] if artwork.get('images') else artwork.get('image')
-                    if img:
-                        images.append(img)
-                        paintings.append({
-                            'image_url': img,
-                            'title': artwork.get('title', ''),
-                            'description': artwork.get('description', ''),
-                            'price': artwork.get('price'),
-                            'artwork_id': artwork.get('id'),
-                            'on_sale': True
-                        })
-                enriched['exhibition_paintings'] = paintings
-                enriched['exhibition_images'] = images
-                if images:
-                    enriched['primary_exhibition_image'] = images[0]
-        except Exception as e:
-            print(f"Error enriching exhibition with artworks: {e}")
-    
-    return enriched
+# Exhibition artwork cards cached per artwork id, versioned by artworks.updated_at
+EXHIBITION_ARTWORK_CACHE_SIZE = int(os.environ.get('EXHIBITION_ARTWORK_CACHE_SIZE', '2048'))
+EXHIBITION_ARTWORK_CACHE_TTL_SECONDS = int(os.environ.get('EXHIBITION_ARTWORK_CACHE_TTL_SECONDS', '60'))
+EXHIBITION_ARTWORK_COLUMNS = 'id, title, image, images, price, description, updated_at'
+
+# artwork_id -> (updated_at, card or None, last_checked monotonic), least recently used first
+_artwork_card_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _build_artwork_card(artwork: dict) -> Optional[dict]:
+    img = artwork.get('images', [None])[0] if artwork.get('images') else artwork.get('image')
+    if not img:
+        return None
+    return {
+        'image_url': img,
+        'title': artwork.get('title', ''),
+        'description': artwork.get('description', ''),
+        'price': artwork.get('price'),
+        'artwork_id': artwork.get('id'),
+        'on_sale': True
+    }
+
+
+def _cache_artwork_card(artwork: dict, checked_at: float):
+    artwork_id = artwork.get('id')
+    _artwork_card_cache[artwork_id] = (artwork.get('updated_at'), _build_artwork_card(artwork), checked_at)
+    _artwork_card_cache.move_to_end(artwork_id)
+    while len(_artwork_card_cache) > EXHIBITION_ARTWORK_CACHE_SIZE:
+        _artwork_card_cache.popitem(last=False)
+
+
+async def _load_artwork_cards(supabase, artwork_ids) -> Dict[str, Optional[dict]]:
+    """
+    Resolve artwork ids to exhibition painting cards. Entries checked within the TTL are
+    served from the cache; older entries are revalidated with an (id, updated_at) query and
+    only refetched when updated_at moved. Unknown ids are fetched in the same round trip.
+    """
+    now = time.monotonic()
+    cards: Dict[str, Optional[dict]] = {}
+    stale_ids, missing_ids = [], []
+    for artwork_id in dict.fromkeys(a for a in artwork_ids if a):
+        entry = _artwork_card_cache.get(artwork_id)
+        if entry is None:
+            missing_ids.append(artwork_id)
+        elif now - entry[2] > EXHIBITION_ARTWORK_CACHE_TTL_SECONDS:
+            stale_ids.append(artwork_id)
+        else:
+            _artwork_card_cache.move_to_end(artwork_id)
+            cards[artwork_id] = entry[1]
+
+    fetched, versions = await asyncio.gather(
+        _fetch_rows_in(supabase, 'artworks', EXHIBITION_ARTWORK_COLUMNS, 'id', missing_ids),
+        _fetch_rows_in(supabase, 'artworks', 'id, updated_at', 'id', stale_ids),
+    )
+
+    changed_ids = []
+    current_versions = {row['id']: row.get('updated_at') for row in versions}
+    for artwork_id in stale_ids:
+        if artwork_id not in current_versions:
+            _artwork_card_cache.pop(artwork_id, None)
+            continue
+        cached_version, card, _ = _artwork_card_cache[artwork_id]
+        if cached_version is not None and cached_version == current_versions[artwork_id]:
+            _artwork_card_cache[artwork_id] = (cached_version, card, now)
+            _artwork_card_cache.move_to_end(artwork_id)
+            cards[artwork_id] = card
+        else:
+            changed_ids.append(artwork_id)
+
+    if changed_ids:
+        fetched = fetched + await _fetch_rows_in(supabase, 'artworks', EXHIBITION_ARTWORK_COLUMNS, 'id', changed_ids)
+
+    for artwork in fetched:
+        _cache_artwork_card(artwork, now)
+        cards[artwork['id']] = _artwork_card_cache[artwork['id']][1]
+    return cards
+
+
+async def _enrich_exhibitions_with_artworks(supabase, exhibitions: list) -> list:
+    """
+    Enrich exhibitions with artwork data where artwork_ids exist but exhibition_paintings
+    and exhibition_images are empty. Artworks for the whole page are loaded in one batch.
+    """
+    enriched_exhibitions = []
+    needs_artworks = []
+    for exhibition in exhibitions:
+        enriched = dict(exhibition)
+        enriched_exhibitions.append(enriched)
+
+        # If exhibition_paintings already has data, use it
+        if enriched.get('exhibition_paintings'):
+            continue
+
+        # If exhibition_images already has data, use it as primary
+        if enriched.get('exhibition_images'):
+            if not enriched.get('primary_exhibition_image'):
+                enriched['primary_exhibition_image'] = enriched['exhibition_images'][0]
+            continue
+
+        if enriched.get('artwork_ids'):
+            needs_artworks.append(enriched)
+
+    if not needs_artworks:
+        return enriched_exhibitions
+
+    try:
+        cards = await _load_artwork_cards(
+            supabase, [artwork_id for ex in needs_artworks for artwork_id in ex['artwork_ids']]
+        )
+    except Exception as e:
+        print(f"Error enriching exhibitions with artworks: {e}")
+        return enriched_exhibitions
+
+    for enriched in needs_artworks:
+        paintings = [cards[a] for a in enriched['artwork_ids'] if cards.get(a)]
+        if not paintings:
+            continue
+        images = [painting['image_url'] for painting in paintings]
+        enriched['exhibition_paintings'] = paintings
+        enriched['exhibition_images'] = images
+        enriched['primary_exhibition_image'] = images[0]
+    return enriched_exhibitions
 
 
 @app.get("/api/public/exhibitions")
+@response_cache.cached("public_exhibitions", ttl=120, tags=('exhibitions', 'artworks'))
 async def get_public_exhibitions():
     """Get all approved exhibitions"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         return {"exhibitions": []}
     
     try:
-        _sync_exhibition_statuses(supabase)
-        exhibitions = supabase.table('exhibitions').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
+        exhibitions = await supabase.table('exhibitions').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
         
-        # Enrich each exhibition with artwork data
-        enriched_exhibitions = []
-        for ex in (exhibitions.data or []):
-            enriched_exhibitions.append(_enrich_exhibition_with_artworks(supabase, ex))
+        enriched_exhibitions = await _enrich_exhibitions_with_artworks(supabase, exhibitions.data or [])
         
         return {"exhibitions": enriched_exhibitions}
     except Exception as e:
         print(f"Exhibitions error: {e}")
+        mark_uncacheable()
         return {"exhibitions": []}
 
 @app.get("/api/public/exhibitions/active")
+@response_cache.cached("public_active_exhibitions", ttl=120, tags=('exhibitions', 'artworks'))
 async def get_active_exhibitions():
     """Get active exhibitions"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         return {"exhibitions": []}
     
     try:
-        _sync_exhibition_statuses(supabase)
-        exhibitions = supabase.table('exhibitions').select('*').eq('is_approved', True).eq('status', 'active').execute()
+        exhibitions = await supabase.table('exhibitions').select('*').eq('is_approved', True).eq('status', 'active').execute()
         
-        # Enrich each exhibition with artwork data
-        enriched_exhibitions = []
-        for ex in (exhibitions.data or []):
-            enriched_exhibitions.append(_enrich_exhibition_with_artworks(supabase, ex))
+        enriched_exhibitions = await _enrich_exhibitions_with_artworks(supabase, exhibitions.data or [])
         
         return {"exhibitions": enriched_exhibitions}
     except Exception as e:
         print(f"Active exhibitions error: {e}")
+        mark_uncacheable()
         return {"exhibitions": []}
 
 
 @app.get("/api/public/active-exhibitions")
-async def get_active_exhibitions_alias():
-    return await get_active_exhibitions()
+async def get_active_exhibitions_alias(request: Request):
+    return await get_active_exhibitions(_cache_request=request)
 
 @app.get("/api/public/exhibitions/archived")
+@response_cache.cached("public_archived_exhibitions", ttl=300, tags=('exhibitions', 'artworks'))
 async def get_archived_exhibitions():
     """Get archived exhibitions"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         return {"exhibitions": []}
     
     try:
-        _sync_exhibition_statuses(supabase)
-        exhibitions = supabase.table('exhibitions').select('*').eq('is_approved', True).eq('status', 'archived').execute()
+        exhibitions = await supabase.table('exhibitions').select('*').eq('is_approved', True).eq('status', 'archived').execute()
         
-        # Enrich each exhibition with artwork data
-        enriched_exhibitions = []
-        for ex in (exhibitions.data or []):
-            enriched_exhibitions.append(_enrich_exhibition_with_artworks(supabase, ex))
+        enriched_exhibitions = await _enrich_exhibitions_with_artworks(supabase, exhibitions.data or [])
         
         return {"exhibitions": enriched_exhibitions}
     except Exception as e:
         print(f"Archived exhibitions error: {e}")
+        mark_uncacheable()
         return {"exhibitions": []}
 
 
 @app.get("/api/public/archived-exhibitions")
-async def get_archived_exhibitions_alias():
-    return await get_archived_exhibitions()
+async def get_archived_exhibitions_alias(request: Request):
+    return await get_archived_exhibitions(_cache_request=request)
+
+# ============ SEARCH ============
+
+SEARCH_INDEX_REFRESH_SECONDS = int(os.environ.get('SEARCH_INDEX_REFRESH_SECONDS', '300'))
+SEARCH_MAX_LIMIT = 50
+
+# kind -> (table, columns, eq-filters selecting the searchable rows)
+SEARCH_SOURCES = {
+    "artwork": ('artworks', 'id, title, description, medium, style, category, price, image, images, artist_id, is_approved',
+                (('is_approved', True),)),
+    "artist": ('profiles', 'id, full_name, bio, categories, location, avatar, role, is_approved, is_active',
+               (('role', 'artist'), ('is_approved', True), ('is_active', True))),
+    "exhibition": ('exhibitions', 'id, name, status, start_date, end_date, exhibition_type, is_approved',
+                   (('is_approved', True),)),
+    "community": ('communities', 'id, name, image, category, member_count, is_approved',
+                  (('is_approved', True),)),
+}
+SEARCH_HIDDEN_EXHIBITION_STATUSES = {'deleted', 'paused', 'expired', 'rejected'}
+
+# "dirty" collects incremental updates made while a full rebuild is loading, to replay after the swap
+_search_state = {"index": SearchIndex(), "built_at": None, "dirty": None}
+_search_build_lock = asyncio.Lock()
+_search_tasks: set = set()
+_index_refresh_tasks: List[asyncio.Task] = []
+
+
+def _search_document(kind: str, row: dict) -> Optional[tuple]:
+    """(fields, facets, payload) for a searchable row, or None if it should not be in the index."""
+    if not all(row.get(column) == value for column, value in SEARCH_SOURCES[kind][2]):
+        return None
+    if kind == "artwork":
+        return (
+            {"title": row.get('title'), "description": row.get('description'), "medium": row.get('medium'),
+             "style": row.get('style'), "category": row.get('category')},
+            {"category": row.get('category'), "medium": row.get('medium'), "style": row.get('style')},
+            {"title": row.get('title'), "image": (row.get('images') or [None])[0] or row.get('image'),
+             "price": row.get('price'), "category": row.get('category'), "artist_id": row.get('artist_id')},
+        )
+    if kind == "artist":
+        return (
+            {"name": row.get('full_name'), "bio": row.get('bio'), "categories": row.get('categories'),
+             "location": row.get('location')},
+            {},
+            {"name": row.get('full_name'), "avatar": row.get('avatar'), "location": row.get('location'),
+             "categories": row.get('categories') or []},
+        )
+    if kind == "exhibition":
+        if (row.get('status') or '').lower() in SEARCH_HIDDEN_EXHIBITION_STATUSES:
+            return None
+        return (
+            {"name": row.get('name')},
+            {},
+            {"name": row.get('name'), "status": row.get('status'), "start_date": row.get('start_date'),
+             "end_date": row.get('end_date'), "exhibition_type": row.get('exhibition_type')},
+        )
+    return (
+        {"name": row.get('name')},
+        {"category": row.get('category')},
+        {"name": row.get('name'), "image": row.get('image'), "category": row.get('category'),
+         "member_count": row.get('member_count')},
+    )
+
+
+def _index_search_row(index: SearchIndex, kind: str, row: dict):
+    document = _search_document(kind, row)
+    if document is None:
+        index.remove(kind, row['id'])
+    else:
+        index.upsert(kind, row['id'], *document)
+
+
+async def _rebuild_search_index(supabase):
+    """Build a fresh index from all searchable rows and swap it in."""
+    async with _search_build_lock:
+        _search_state["dirty"] = set()
+        try:
+            kinds = list(SEARCH_SOURCES)
+            results = await asyncio.gather(*(
+                _fetch_all_rows(supabase, table, columns, filters)
+                for table, columns, filters in (SEARCH_SOURCES[kind] for kind in kinds)
+            ))
+            index = SearchIndex()
+            for kind, rows in zip(kinds, results):
+                for row in rows:
+                    _index_search_row(index, kind, row)
+            _search_state["index"] = index
+            _search_state["built_at"] = time.monotonic()
+        finally:
+            dirty, _search_state["dirty"] = _search_state["dirty"], None
+        by_kind: Dict[str, List[str]] = {}
+        for kind, row_id in dirty:
+            by_kind.setdefault(kind, []).append(row_id)
+        for kind, ids in by_kind.items():
+            _schedule_search_reindex(kind, *ids)
+
+
+async def _reindex_search_rows(kind: str, ids: List[str]):
+    supabase = get_async_supabase_client()
+    if not supabase:
+        return
+    table, columns, _ = SEARCH_SOURCES[kind]
+    rows = {row['id']: row for row in await _fetch_rows_in(supabase, table, columns, 'id', ids)}
+    index = _search_state["index"]
+    for row_id in ids:
+        if row_id in rows:
+            _index_search_row(index, kind, rows[row_id])
+        else:
+            index.remove(kind, row_id)
+
+
+def _schedule_search_reindex(kind: str, *ids: str):
+    """Re-read these rows and update the search index in the background."""
+    ids = [str(row_id) for row_id in ids if row_id]
+    if not ids:
+        return
+    if _search_state["dirty"] is not None:
+        _search_state["dirty"].update((kind, row_id) for row_id in ids)
+
+    async def reindex():
+        try:
+            await _reindex_search_rows(kind, ids)
+        except Exception as e:
+            print(f"Search reindex error ({kind}): {e}")
+
+    task = asyncio.create_task(reindex())
+    _search_tasks.add(task)
+    task.add_done_callback(_search_tasks.discard)
+
+
+def _reindexes_search(kind: str, id_arg: str):
+    """
+    Decorator for write endpoints: once the write succeeds, re-index the row whose id is
+    the endpoint argument `id_arg` ("artwork_id", or an attribute path like "request.artwork_id").
+    """
+
+    def decorator(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            name, *attributes = id_arg.split('.')
+            value = kwargs.get(name)
+            for attribute in attributes:
+                value = getattr(value, attribute, None)
+            _schedule_search_reindex(kind, value)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def _refresh_periodically(label: str, refresh, interval_seconds: int):
+    """Run `refresh(supabase)` now and then every interval (full rebuilds also pick up other workers' writes)."""
+    while True:
+        supabase = get_async_supabase_client()
+        if supabase:
+            try:
+                await refresh(supabase)
+            except Exception as e:
+                print(f"{label} refresh error: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+@app.get("/api/search")
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Optional[str] = Query(None, description="Comma-separated: artwork, artist, exhibition, community"),
+    category: Optional[str] = None,
+    medium: Optional[str] = None,
+    style: Optional[str] = None,
+    offset: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_LIMIT)
+):
+    """Ranked full-text search across artworks, artists, exhibitions and communities"""
+    started = time.perf_counter()
+    if _search_state["built_at"] is None:
+        supabase = get_async_supabase_client()
+        if not supabase:
+            raise HTTPException(status_code=503, detail="Database not configured")
+        if _search_build_lock.locked():
+            async with _search_build_lock:
+                pass
+        else:
+            await _rebuild_search_index(supabase)
+
+    filters = {
+        "kind": [k.strip() for k in kind.split(',') if k.strip()] if kind else None,
+        "category": [category] if category else None,
+        "medium": [medium] if medium else None,
+        "style": [style] if style else None,
+    }
+    result = _search_state["index"].search(q, filters, offset=offset, limit=limit)
+    return {
+        "query": q,
+        **result,
+        "offset": offset,
+        "limit": limit,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2)
+    }
+
+
+AUTOCOMPLETE_REFRESH_SECONDS = int(os.environ.get('AUTOCOMPLETE_REFRESH_SECONDS', '120'))
+AUTOCOMPLETE_MAX_LIMIT = 10
+
+# Lookups read _autocomplete_state["index"] once; refreshes build a new PrefixIndex and replace the reference
+_autocomplete_state = {"index": PrefixIndex(()), "built_at": None}
+
+
+def _autocomplete_suggestions(artworks: list, artists: list) -> list:
+    """(text, kind, id, popularity) rows; popularity is artwork views, summed per artist, category and style."""
+    artist_views: Dict[str, int] = {}
+    category_views: Dict[str, int] = {category: 1 for category in COMMISSION_ART_CATEGORIES}
+    style_views: Dict[str, int] = {}
+    suggestions = []
+    for artwork in artworks:
+        views = artwork.get('views') or 0
+        if artwork.get('title'):
+            suggestions.append((artwork['title'], 'artwork', artwork['id'], views))
+        if artwork.get('artist_id'):
+            artist_views[artwork['artist_id']] = artist_views.get(artwork['artist_id'], 0) + views
+        if artwork.get('category'):
+            category_views[artwork['category']] = category_views.get(artwork['category'], 0) + views + 1
+        if artwork.get('style'):
+            style_views[artwork['style']] = style_views.get(artwork['style'], 0) + views + 1
+    for artist in artists:
+        if artist.get('full_name'):
+            suggestions.append((artist['full_name'], 'artist', artist['id'], artist_views.get(artist['id'], 0)))
+    suggestions.extend((category, 'category', None, views) for category, views in category_views.items())
+    suggestions.extend((style, 'style', None, views) for style, views in style_views.items())
+    return suggestions
+
+
+async def _rebuild_autocomplete_index(supabase):
+    artworks, artists = await asyncio.gather(
+        _fetch_all_rows(supabase, 'artworks', 'id, title, category, style, views, artist_id', (('is_approved', True),)),
+        _fetch_all_rows(supabase, 'profiles', 'id, full_name', SEARCH_SOURCES['artist'][2]),
+    )
+    # Sorting tens of thousands of keys takes a while; keep it off the event loop
+    index = await asyncio.to_thread(PrefixIndex, _autocomplete_suggestions(artworks, artists))
+    _autocomplete_state["index"] = index
+    _autocomplete_state["built_at"] = time.monotonic()
+
+
+@app.get("/api/search/autocomplete")
+async def search_autocomplete(
+    q: str = Query(..., min_length=1, max_length=100),
+    kind: Optional[str] = Query(None, description="Comma-separated: artwork, artist, category, style"),
+    limit: int = Query(8, ge=1, le=AUTOCOMPLETE_MAX_LIMIT)
+):
+    """Search-as-you-type suggestions, most viewed first"""
+    kinds = {k.strip() for k in kind.split(',') if k.strip()} if kind else None
+    suggestions = _autocomplete_state["index"].lookup(q, limit=limit, kinds=kinds)
+    return {
+        "query": q,
+        "suggestions": [{"text": text, "kind": item_kind, "id": item_id} for text, item_kind, item_id, _ in suggestions]
+    }
 
 # ============ COMMUNITIES ============
 
+PROFILE_CARD_COLUMNS = 'id, full_name, avatar, location'
+PROFILE_CARD_CACHE_SIZE = int(os.environ.get('PROFILE_CARD_CACHE_SIZE', '4096'))
+PROFILE_CARD_CACHE_TTL_SECONDS = int(os.environ.get('PROFILE_CARD_CACHE_TTL_SECONDS', '30'))
+COMMUNITY_MEMBER_PREVIEW = 24
+COMMUNITY_MEMBERS_MAX_PAGE = 100
+
+_profile_card_cache: "OrderedDict[str, tuple]" = OrderedDict()  # user id -> (expires_at, card or None)
+
+
+async def _load_profile_cards(supabase, user_ids) -> Dict[str, Optional[dict]]:
+    """Resolve user ids to {id, full_name, avatar, location}: cache hits, then one in_() query for the rest."""
+    now = time.monotonic()
+    cards: Dict[str, Optional[dict]] = {}
+    missing_ids = []
+    for user_id in dict.fromkeys(u for u in user_ids if u):
+        entry = _profile_card_cache.get(user_id)
+        if entry is not None and entry[0] > now:
+            _profile_card_cache.move_to_end(user_id)
+            cards[user_id] = entry[1]
+        else:
+            missing_ids.append(user_id)
+
+    if missing_ids:
+        fetched = {row['id']: row for row in await _fetch_rows_in(supabase, 'profiles', PROFILE_CARD_COLUMNS, 'id', missing_ids)}
+        for user_id in missing_ids:
+            # Unknown ids are cached too, so a deleted creator doesn't cost a query every time
+            cards[user_id] = fetched.get(user_id)
+            _profile_card_cache[user_id] = (now + PROFILE_CARD_CACHE_TTL_SECONDS, cards[user_id])
+            _profile_card_cache.move_to_end(user_id)
+        while len(_profile_card_cache) > PROFILE_CARD_CACHE_SIZE:
+            _profile_card_cache.popitem(last=False)
+    return cards
+
+
+async def _load_community_members(supabase, community_id: str, limit: int, cursor: Optional[str] = None):
+    """One page of members in join order, keyset-paginated on (joined_at, id), with profile cards attached."""
+    if limit <= 0:
+        return [], None
+    query = supabase.table('community_members').select('*').eq('community_id', community_id)
+    if cursor:
+        joined_at, row_id = _decode_keyset_cursor(cursor)
+        query = query.or_(f'joined_at.gt."{joined_at}",and(joined_at.eq."{joined_at}",id.gt."{row_id}")')
+    rows = (await query.order('joined_at').order('id').limit(limit + 1).execute()).data or []
+    next_cursor = _encode_keyset_cursor(rows[limit - 1], 'joined_at') if len(rows) > limit else None
+    rows = rows[:limit]
+
+    profiles = await _load_profile_cards(supabase, [row.get('user_id') for row in rows])
+    return [{**row, "profiles": profiles.get(row.get('user_id'))} for row in rows], next_cursor
+
+
+COMMUNITY_FEED_PAGE_SIZE = 20
+COMMUNITY_FEED_MAX_PAGE = 50
+# Newest posts kept in memory per community, so the first page of a feed needs no query
+COMMUNITY_FEED_WINDOW = int(os.environ.get('COMMUNITY_FEED_WINDOW', '50'))
+COMMUNITY_FEED_WINDOW_COMMUNITIES = int(os.environ.get('COMMUNITY_FEED_WINDOW_COMMUNITIES', '512'))
+# Posts made through other workers show up in this worker's window after at most this long
+COMMUNITY_FEED_WINDOW_TTL_SECONDS = int(os.environ.get('COMMUNITY_FEED_WINDOW_TTL_SECONDS', '60'))
+
+# community id -> {"loaded_at", "posts": deque of rows newest first, "complete": window holds every post}
+_community_feed_windows: "OrderedDict[str, dict]" = OrderedDict()
+
+
+def _post_author_id(post: dict) -> Optional[str]:
+    # Older deployments created community_posts with author_id instead of user_id
+    return post.get('user_id') or post.get('author_id')
+
+
+async def _community_feed_window(supabase, community_id: str) -> Optional[dict]:
+    """The community's hot window, (re)loaded from the newest posts when missing or stale."""
+    window = _community_feed_windows.get(community_id)
+    if window is not None and time.monotonic() - window["loaded_at"] <= COMMUNITY_FEED_WINDOW_TTL_SECONDS:
+        _community_feed_windows.move_to_end(community_id)
+        return window
+
+    try:
+        rows = (await supabase.table('community_posts').select('*').eq('community_id', community_id)
+                .order('created_at', desc=True).order('id', desc=True).limit(COMMUNITY_FEED_WINDOW).execute()).data or []
+    except Exception as e:
+        # community_posts table doesn't exist - that's okay
+        print(f"community_posts query failed (table may not exist): {e}")
+        return None
+    window = {
+        "loaded_at": time.monotonic(),
+        "posts": deque(rows, maxlen=COMMUNITY_FEED_WINDOW),
+        "complete": len(rows) < COMMUNITY_FEED_WINDOW,
+    }
+    _community_feed_windows[community_id] = window
+    _community_feed_windows.move_to_end(community_id)
+    while len(_community_feed_windows) > COMMUNITY_FEED_WINDOW_COMMUNITIES:
+        _community_feed_windows.popitem(last=False)
+    return window
+
+
+def _push_community_post(community_id: str, post: dict):
+    """Prepend a new post to the community's window, if this worker holds one."""
+    window = _community_feed_windows.get(community_id)
+    if window is None:
+        return
+    if len(window["posts"]) == COMMUNITY_FEED_WINDOW:
+        # The oldest post falls out of the ring, so the window no longer covers everything
+        window["complete"] = False
+    window["posts"].appendleft(post)
+
+
+async def _load_community_posts(supabase, community_id: str, limit: int, cursor: Optional[str] = None):
+    """
+    One page of posts newest first, keyset-paginated on (created_at, id), with author
+    profile cards attached. The first page comes from the in-memory window.
+    """
+    if limit <= 0:
+        return [], None
+
+    if cursor is None and limit <= COMMUNITY_FEED_WINDOW:
+        window = await _community_feed_window(supabase, community_id)
+        if window is None:
+            return [], None
+        rows = list(itertools.islice(window["posts"], limit))
+        has_more = len(window["posts"]) > limit or (not window["complete"] and len(rows) == limit)
+        next_cursor = _encode_keyset_cursor(rows[-1]) if has_more and rows else None
+    else:
+        query = supabase.table('community_posts').select('*').eq('community_id', community_id)
+        if cursor:
+            created_at, row_id = _decode_keyset_cursor(cursor)
+            query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{row_id}")')
+        try:
+            rows = (await query.order('created_at', desc=True).order('id', desc=True).limit(limit + 1).execute()).data or []
+        except Exception as e:
+            print(f"community_posts query failed (table may not exist): {e}")
+            return [], None
+        next_cursor = _encode_keyset_cursor(rows[limit - 1]) if len(rows) > limit else None
+        rows = rows[:limit]
+
+    authors = await _load_profile_cards(supabase, [_post_author_id(row) for row in rows])
+    return [{**row, "profiles": authors.get(_post_author_id(row))} for row in rows], next_cursor
+
+
+COMMUNITY_COUNT_RECONCILE_SECONDS = int(os.environ.get('COMMUNITY_COUNT_RECONCILE_SECONDS', '3600'))
+
+
+async def _add_community_member(supabase, community_id: str, user_id: str, role: str = "member") -> bool:
+    """Insert the membership and bump member_count in one atomic RPC. Returns False if already a member."""
+    try:
+        result = await supabase.rpc('add_community_member', {
+            "p_community_id": community_id,
+            "p_user_id": user_id,
+            "p_role": role,
+        }).execute()
+        return bool(result.data)
+    except Exception as e:
+        print(f"add_community_member unavailable, using insert + increment: {e}")
+
+    existing = await supabase.table('community_members').select('id').eq('community_id', community_id).eq('user_id', user_id).execute()
+    if existing.data:
+        return False
+    member_data = {
+        "community_id": community_id,
+        "user_id": user_id,
+        "role": role,
+        "joined_at": datetime.now(timezone.utc).isoformat()
+    }
+    try:
+        await supabase.table('community_members').insert(member_data).execute()
+    except Exception:
+        # Fallback without role
+        member_data.pop("role", None)
+        await supabase.table('community_members').insert(member_data).execute()
+    await supabase.rpc('increment_community_members', {"community_id": community_id}).execute()
+    return True
+
+
+async def _remove_community_member(supabase, community_id: str, user_id: str) -> bool:
+    """Delete the membership and decrement member_count in one atomic RPC. Returns False if not a member."""
+    try:
+        result = await supabase.rpc('remove_community_member', {
+            "p_community_id": community_id,
+            "p_user_id": user_id,
+        }).execute()
+        return bool(result.data)
+    except Exception as e:
+        print(f"remove_community_member unavailable, using delete + decrement: {e}")
+
+    deleted = await supabase.table('community_members').delete().eq('community_id', community_id).eq('user_id', user_id).execute()
+    if not deleted.data:
+        return False
+    try:
+        await supabase.rpc('decrement_community_members', {"community_id": community_id}).execute()
+    except Exception as e:
+        # Counts drift until the next reconciliation
+        print(f"decrement_community_members error: {e}")
+    return True
+
+
+async def _run_community_count_reconciliation(supabase) -> Optional[datetime]:
+    """Recompute every communities.member_count from community_members in one statement."""
+    result = await supabase.rpc('reconcile_community_member_counts', {}).execute()
+    if result.data:
+        print(f"[communities] reconciled {result.data} member counts")
+        await response_cache.invalidate('communities')
+    return datetime.now(timezone.utc) + timedelta(seconds=COMMUNITY_COUNT_RECONCILE_SECONDS)
+
+
+_community_count_job = ScheduledJob('community_member_counts', _run_community_count_reconciliation)
+
+
 @app.get("/api/public/communities")
+@response_cache.cached("public_communities", ttl=120, tags=('communities', 'profiles'))
 async def get_public_communities():
     """Get all approved communities"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         return {"communities": []}
     
     try:
-        communities = supabase.table('communities').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
-
-        enriched = []
-        for community in (communities.data or []):
-            creator_id = community.get('created_by') or community.get('creator_id')
-            creator_profile = None
-            if creator_id:
-                try:
-                    profile = supabase.table('profiles').select('full_name, avatar').eq('id', creator_id).single().execute()
-                    creator_profile = profile.data
-                except Exception:
-                    creator_profile = None
-
-            enriched.append({
-                **community,
-                "profiles": creator_profile,
-            })
+        communities = await supabase.table('communities').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
+        rows = communities.data or []
+
+        # Creator name/avatar for every community in one batched lookup
+        creators = await _load_profile_cards(supabase, [c.get('created_by') or c.get('creator_id') for c in rows])
+        enriched = [
+            {**community, "profiles": creators.get(community.get('created_by') or community.get('creator_id'))}
+            for community in rows
+        ]
 
         return {"communities": enriched}
     except Exception as e:
         print(f"Communities error: {e}")
+        mark_uncacheable()
         return {"communities": []}
 
 @app.get("/api/public/community/{community_id}")
-async def get_community_detail(community_id: str):
-    """Get community details with members"""
-    supabase = get_supabase_client()
+async def get_community_detail(
+    community_id: str,
+    member_preview: int = Query(COMMUNITY_MEMBER_PREVIEW, ge=0, le=COMMUNITY_MEMBERS_MAX_PAGE)
+):
+    """Get community details with the first page of members (see /api/community/{id}/members for more)"""
+    supabase = get_async_supabase_client()
     
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
     
     try:
-        community = supabase.table('communities').select('*').eq('id', community_id).eq('is_approved', True).single().execute()
+        community = await supabase.table('communities').select('*').eq('id', community_id).eq('is_approved', True).single().execute()
         
         if not community.data:
             raise HTTPException(status_code=404, detail="Community not found")
         
-        # Get members with fallback
-        members_data = []
-        try:
-            members = supabase.table('community_members').select('*, profiles!user_id(id, full_name, avatar, location)').eq('community_id', community_id).execute()
-            members_data = members.data or []
-        except Exception:
-            # Fallback without join
-            members = supabase.table('community_members').select('*').eq('community_id', community_id).execute()
-            members_data = members.data or []
+        members_data, members_next_cursor = await _load_community_members(supabase, community_id, member_preview)
         
         return {
             "community": community.data,
             "members": members_data,
-            "member_count": len(members_data)
+            "members_next_cursor": members_next_cursor,
+            "member_count": community.data.get('member_count') or len(members_data)
         }
     except HTTPException:
         raise
@@ -1386,9 +2223,10 @@ async def get_community_detail(community_id: str):
         raise HTTPException(status_code=500, detail="Error fetching community")
 
 @app.post("/api/communities")
+@response_cache.invalidates('communities')
 async def create_community_legacy(data: CommunityCreate, user: dict = Depends(require_artist)):
     """Create a new community (requires artist role)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
@@ -1405,114 +2243,118 @@ async def create_community_legacy(data: CommunityCreate, user: dict = Depends(re
     }
 
     try:
-        result = supabase.table('communities').insert(community_data).execute()
+        result = await supabase.table('communities').insert(community_data).execute()
     except Exception as e:
         msg = str(e)
         fallback = dict(community_data)
         for optional_field in ["category", "image"]:
             if optional_field in fallback:
                 fallback.pop(optional_field, None)
-        result = supabase.table('communities').insert(fallback).execute()
+        result = await supabase.table('communities').insert(fallback).execute()
     
     return {"success": True, "community": result.data[0], "message": "Community created and pending admin approval"}
 
 @app.post("/api/communities/{community_id}/join")
+@response_cache.invalidates('communities')
 async def join_community(community_id: str, user: dict = Depends(require_user)):
     """Join a community"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if community exists and is approved
-    community = supabase.table('communities').select('id').eq('id', community_id).eq('is_approved', True).single().execute()
+    community = await supabase.table('communities').select('id').eq('id', community_id).eq('is_approved', True).single().execute()
     if not community.data:
         raise HTTPException(status_code=404, detail="Community not found")
     
-    # Check if already a member
-    existing = supabase.table('community_members').select('id').eq('community_id', community_id).eq('user_id', user['id']).execute()
-    if existing.data:
+    # Join community (member row and member_count in one round trip)
+    if not await _add_community_member(supabase, community_id, user['id']):
         raise HTTPException(status_code=400, detail="Already a member of this community")
     
-    # Join community
-    member_data = {
-        "community_id": community_id,
-        "user_id": user['id'],
-        "joined_at": datetime.now(timezone.utc).isoformat()
-    }
-    
-    result = supabase.table('community_members').insert(member_data).execute()
-    
     return {"success": True, "message": "Joined community successfully"}
 
 @app.post("/api/communities/{community_id}/leave")
 @app.post("/api/community/{community_id}/leave")
+@response_cache.invalidates('communities')
 async def leave_community(community_id: str, user: dict = Depends(require_user)):
     """Leave a community"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    result = supabase.table('community_members').delete().eq('community_id', community_id).eq('user_id', user['id']).execute()
-    
-    # Update member count
-    try:
-        community = supabase.table('communities').select('member_count').eq('id', community_id).single().execute()
-        if community.data:
-            new_count = max(0, (community.data.get('member_count') or 1) - 1)
-            supabase.table('communities').update({'member_count': new_count}).eq('id', community_id).execute()
-    except:
-        pass
+    await _remove_community_member(supabase, community_id, user['id'])
     
     return {"success": True, "message": "Left community successfully"}
 
 # ============ CHATBOT (CHITRAKAR) ============
 
+_chat_persist_tasks: set = set()
+
+
+def _chat_record(session_id: str, user_id: str, message: str, response: str, needs_admin_review: bool) -> dict:
+    return {
+        "session_id": session_id,
+        "user_id": user_id,
+        "user_message": message,
+        "bot_response": response,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "needs_admin_review": needs_admin_review
+    }
+
+
+def _persist_chat_message_later(chat_data: dict):
+    """Insert the transcript in the background so it never holds up the reply."""
+    async def persist():
+        try:
+            supabase = get_async_supabase_client()
+            await supabase.table('chat_messages').insert(chat_data).execute()
+        except Exception as e:
+            print(f"Chat persist error: {e}")
+
+    task = asyncio.create_task(persist())
+    _chat_persist_tasks.add(task)
+    task.add_done_callback(_chat_persist_tasks.discard)
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+CHAT_FAQ_REFRESH_SECONDS = int(os.environ.get('CHAT_FAQ_REFRESH_SECONDS', '300'))
+
+# Curated/promoted FAQ answers plus recent model answers, matched by question similarity
+_answer_cache = AnswerCache()
+
+
+async def _reload_chat_faq(supabase):
+    rows = await _fetch_all_rows(supabase, 'chat_faq', 'id, question, answer, source', (('is_active', True),))
+    _answer_cache.load_faq(rows)
+
+
 @app.post("/api/chat/message")
 async def chat_with_chitrakar(data: ChatMessageRequest, user: dict = Depends(require_user)):
     """Send message to Chitrakar chatbot"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     session_id = data.session_id or f"chat_{user['id']}_{int(time.time())}"
     
-    try:
-        from emergentintegrations.llm.chat import LlmChat, UserMessage
-        
-        # Initialize chat with system message
-        chat = LlmChat(
-            api_key=os.environ.get("EMERGENT_LLM_KEY"),
-            session_id=session_id,
-            system_message="""You are Chitrakar, a helpful assistant for ChitraKalakar - an Indian art marketplace platform.
-            You help users with:
-            - Finding artists and artworks
-            - Understanding art categories and styles
-            - Explaining the platform features
-            - Answering questions about art classes
-            - Guiding users through purchases and orders
-            - Explaining membership benefits for artists
-            
-            Be friendly, helpful, and knowledgeable about Indian art. If you don't know something specific about a user's order or account, 
-            politely let them know that an admin will respond within 24 hours. Keep responses concise but helpful."""
-        )
-        
-        chat.with_model("openai", "gpt-4o-mini")
-        
-        # Create message
-        user_message = UserMessage(text=data.message)
-        
-        # Get response
-        response = await chat.send_message(user_message)
-        
-        # Store in database for admin review
-        chat_data = {
+    cached = _answer_cache.lookup(data.message)
+    if cached:
+        _persist_chat_message_later(_chat_record(session_id, user['id'], data.message, cached["answer"], False))
+        return {
+            "success": True,
+            "response": cached["answer"],
             "session_id": session_id,
-            "user_id": user['id'],
-            "user_message": data.message,
-            "bot_response": response,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "needs_admin_review": False
+            "cached": True
         }
+    
+    try:
+        # Identical questions asked at the same moment share one model call
+        response = await get_llm_gateway().complete('chat', CHITRAKAR_SYSTEM_MESSAGE, data.message, CHAT_LLM_MODEL)
+        detector = ReviewPhraseDetector()
+        detector.feed(response)
         
-        # Check if bot couldn't answer - mark for admin review
-        if any(phrase in response.lower() for phrase in ["i don't know", "admin will", "cannot help", "contact support"]):
-            chat_data["needs_admin_review"] = True
-        
-        supabase.table('chat_messages').insert(chat_data).execute()
+        # Store in database for admin review; mark it if the bot couldn't answer
+        chat_data = _chat_record(session_id, user['id'], data.message, response, detector.matched is not None)
+        await supabase.table('chat_messages').insert(chat_data).execute()
+        if detector.matched is None:
+            _answer_cache.learn(data.message, response)
         
         return {
             "success": True,
@@ -1523,34 +2365,79 @@ async def chat_with_chitrakar(data: ChatMessageRequest, user: dict = Depends(req
     except Exception as e:
         print(f"Chat error: {e}")
         # Fallback response and store for admin
-        fallback_response = "Thank you for your message! Our team will review and respond within 24 hours. In the meantime, feel free to browse our artists and artworks."
-        
-        chat_data = {
-            "session_id": session_id,
-            "user_id": user['id'],
-            "user_message": data.message,
-            "bot_response": fallback_response,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "needs_admin_review": True
-        }
+        chat_data = _chat_record(session_id, user['id'], data.message, CHAT_FALLBACK_RESPONSE, True)
         
         try:
-            supabase.table('chat_messages').insert(chat_data).execute()
+            await supabase.table('chat_messages').insert(chat_data).execute()
         except:
             pass
         
         return {
             "success": True,
-            "response": fallback_response,
+            "response": CHAT_FALLBACK_RESPONSE,
             "session_id": session_id
         }
 
+@app.post("/api/chat/stream")
+async def stream_chat_with_chitrakar(data: ChatMessageRequest, user: dict = Depends(require_user)):
+    """
+    Chitrakar reply as Server-Sent Events: `session`, then `token` events as the model
+    produces text, `review` as soon as the reply is flagged for an admin, and `done`.
+    The transcript is stored after the stream closes, including when the client leaves early.
+    """
+    session_id = data.session_id or f"chat_{user['id']}_{int(time.time())}"
+    cached = _answer_cache.lookup(data.message)
+    
+    async def reply_chunks():
+        if cached:
+            yield cached["answer"]
+            return
+        async for chunk in get_llm_gateway().stream('chat', CHITRAKAR_SYSTEM_MESSAGE, data.message, CHAT_LLM_MODEL, session_id=session_id):
+            yield chunk
+    
+    async def events():
+        detector = ReviewPhraseDetector()
+        chunks = []
+        completed = failed = False
+        try:
+            yield _sse_event('session', {"session_id": session_id})
+            try:
+                async for chunk in reply_chunks():
+                    chunks.append(chunk)
+                    if detector.feed(chunk):
+                        yield _sse_event('review', {"needs_admin_review": True})
+                    yield _sse_event('token', {"text": chunk})
+            except Exception as e:
+                print(f"Chat stream error: {e}")
+                failed = True
+                if not chunks:
+                    chunks.append(CHAT_FALLBACK_RESPONSE)
+                    yield _sse_event('token', {"text": CHAT_FALLBACK_RESPONSE})
+            completed = True
+            if not cached and not failed and detector.matched is None:
+                _answer_cache.learn(data.message, ''.join(chunks))
+            yield _sse_event('done', {
+                "session_id": session_id,
+                "needs_admin_review": failed or detector.matched is not None,
+                "cached": bool(cached)
+            })
+        finally:
+            # A reply cut short (error or disconnect) also goes to an admin
+            needs_review = failed or not completed or detector.matched is not None
+            _persist_chat_message_later(_chat_record(session_id, user['id'], data.message, ''.join(chunks), needs_review))
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/api/chat/history")
 async def get_chat_history(user: dict = Depends(require_user)):
     """Get user's chat history"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    messages = supabase.table('chat_messages').select('*').eq('user_id', user['id']).order('created_at', desc=True).limit(50).execute()
+    messages = await supabase.table('chat_messages').select('*').eq('user_id', user['id']).order('created_at', desc=True).limit(50).execute()
     
     return {"messages": messages.data or []}
 
@@ -1618,7 +2505,7 @@ async def create_membership_order(data: MembershipPlanRequest, user: dict = Depe
         })
         
         # Store order in database
-        supabase = get_supabase_client()
+        supabase = get_async_supabase_client()
         order_data = {
             "razorpay_order_id": order['id'],
             "user_id": user['id'],
@@ -1627,7 +2514,7 @@ async def create_membership_order(data: MembershipPlanRequest, user: dict = Depe
             "status": "created",
             "created_at": datetime.now(timezone.utc).isoformat()
         }
-        supabase.table('membership_orders').insert(order_data).execute()
+        await supabase.table('membership_orders').insert(order_data).execute()
         
         return {
             "success": True,
@@ -1641,6 +2528,7 @@ async def create_membership_order(data: MembershipPlanRequest, user: dict = Depe
         raise HTTPException(status_code=500, detail="Failed to create payment order")
 
 @app.post("/api/membership/verify-payment")
+@response_cache.invalidates('profiles')
 async def verify_membership_payment(
     razorpay_order_id: str,
     razorpay_payment_id: str,
@@ -1662,8 +2550,8 @@ async def verify_membership_payment(
         })
         
         # Get order details
-        supabase = get_supabase_client()
-        order = supabase.table('membership_orders').select('*').eq('razorpay_order_id', razorpay_order_id).eq('user_id', user['id']).single().execute()
+        supabase = get_async_supabase_client()
+        order = await supabase.table('membership_orders').select('*').eq('razorpay_order_id', razorpay_order_id).eq('user_id', user['id']).single().execute()
         
         if not order.data:
             raise HTTPException(status_code=404, detail="Order not found")
@@ -1672,18 +2560,19 @@ async def verify_membership_payment(
         expiry_date = datetime.now(timezone.utc) + timedelta(days=plan['duration_days'])
         
         # Update order status
-        supabase.table('membership_orders').update({
+        await supabase.table('membership_orders').update({
             "status": "completed",
             "razorpay_payment_id": razorpay_payment_id,
             "completed_at": datetime.now(timezone.utc).isoformat()
         }).eq('razorpay_order_id', razorpay_order_id).execute()
         
         # Activate membership
-        supabase.table('profiles').update({
+        await supabase.table('profiles').update({
             "is_member": True,
             "membership_type": order.data['plan_type'],
             "membership_expiry": expiry_date.isoformat()
         }).eq('id', user['id']).execute()
+        _membership_index.set(user['id'], expiry_date)
         
         return {
             "success": True,
@@ -1698,20 +2587,17 @@ async def verify_membership_payment(
 @app.get("/api/membership/status")
 async def get_membership_status(user: dict = Depends(require_artist)):
     """Get current membership status"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    profile = supabase.table('profiles').select('is_member, membership_type, membership_expiry').eq('id', user['id']).single().execute()
+    profile = await supabase.table('profiles').select('is_member, membership_type, membership_expiry').eq('id', user['id']).single().execute()
     
     if not profile.data:
         return {"is_member": False}
     
-    is_active = False
-    if profile.data.get('membership_expiry'):
-        expiry = datetime.fromisoformat(profile.data['membership_expiry'].replace('Z', '+00:00'))
-        is_active = expiry > datetime.now(timezone.utc)
+    is_active = is_membership_active(True, profile.data.get('membership_expiry'))
     
     return {
-        "is_member": profile.data.get('is_member', False) and is_active,
+        "is_member": bool(profile.data.get('is_member')) and is_active,
         "membership_type": profile.data.get('membership_type'),
         "membership_expiry": profile.data.get('membership_expiry'),
         "is_active": is_active
@@ -1722,10 +2608,10 @@ async def get_membership_status(user: dict = Depends(require_artist)):
 @app.post("/api/video-screening/request")
 async def request_video_screening(data: VideoScreeningRequest, user: dict = Depends(require_user)):
     """Request video screening for a painting"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if painting exists
-    painting = supabase.table('artworks').select('id, title, artist_id').eq('id', data.painting_id).single().execute()
+    painting = await supabase.table('artworks').select('id, title, artist_id').eq('id', data.painting_id).single().execute()
     if not painting.data:
         raise HTTPException(status_code=404, detail="Painting not found")
     
@@ -1739,16 +2625,16 @@ async def request_video_screening(data: VideoScreeningRequest, user: dict = Depe
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     
-    result = supabase.table('video_screenings').insert(screening_data).execute()
+    result = await supabase.table('video_screenings').insert(screening_data).execute()
     
     return {"success": True, "screening_id": result.data[0]['id'], "message": "Video screening request submitted. Admin will accommodate your request."}
 
 @app.get("/api/video-screening/my-requests")
 async def get_my_video_screenings(user: dict = Depends(require_user)):
     """Get user's video screening requests"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    screenings = supabase.table('video_screenings').select('*, artworks!painting_id(title, image, images)').eq('user_id', user['id']).order('created_at', desc=True).execute()
+    screenings = await supabase.table('video_screenings').select('*, artworks!painting_id(title, image, images)').eq('user_id', user['id']).order('created_at', desc=True).execute()
     
     return {"screenings": screenings.data or []}
 
@@ -1757,23 +2643,23 @@ async def get_my_video_screenings(user: dict = Depends(require_user)):
 @app.post("/api/cart/add")
 async def add_to_cart(data: CartItemRequest, user: dict = Depends(require_user)):
     """Add item to cart"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
 
     try:
         # Check if artwork exists and is available
-        artwork = supabase.table('artworks').select('*').eq('id', data.artwork_id).eq('is_available', True).single().execute()
+        artwork = await supabase.table('artworks').select('*').eq('id', data.artwork_id).eq('is_available', True).single().execute()
         if not artwork.data:
             raise HTTPException(status_code=404, detail="Artwork not found or not available")
 
         # Check if already in cart
-        existing = supabase.table('cart_items').select('id, quantity').eq('user_id', user['id']).eq('artwork_id', data.artwork_id).execute()
+        existing = await supabase.table('cart_items').select('id, quantity').eq('user_id', user['id']).eq('artwork_id', data.artwork_id).execute()
 
         if existing.data:
             # Update quantity
             new_quantity = existing.data[0]['quantity'] + data.quantity
-            supabase.table('cart_items').update({"quantity": new_quantity}).eq('id', existing.data[0]['id']).execute()
+            await supabase.table('cart_items').update({"quantity": new_quantity}).eq('id', existing.data[0]['id']).execute()
         else:
             # Add new item - try with added_at first, fallback without it
             cart_data = {
@@ -1783,11 +2669,11 @@ async def add_to_cart(data: CartItemRequest, user: dict = Depends(require_user))
             }
             try:
                 cart_data["added_at"] = datetime.now(timezone.utc).isoformat()
-                supabase.table('cart_items').insert(cart_data).execute()
+                await supabase.table('cart_items').insert(cart_data).execute()
             except Exception:
                 # Fallback without added_at column
                 cart_data.pop("added_at", None)
-                supabase.table('cart_items').insert(cart_data).execute()
+                await supabase.table('cart_items').insert(cart_data).execute()
 
         return {"success": True, "message": "Added to cart"}
     except HTTPException:
@@ -1799,11 +2685,11 @@ async def add_to_cart(data: CartItemRequest, user: dict = Depends(require_user))
 @app.get("/api/cart")
 async def get_cart(user: dict = Depends(require_user)):
     """Get user's cart"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         return {"items": [], "total": 0, "item_count": 0}
     
-    cart_items = supabase.table('cart_items').select('*, artworks!artwork_id(*)').eq('user_id', user['id']).execute()
+    cart_items = await supabase.table('cart_items').select('*, artworks!artwork_id(*)').eq('user_id', user['id']).execute()
     
     total = sum(item['artworks']['price'] * item['quantity'] for item in (cart_items.data or []) if item.get('artworks'))
     
@@ -1816,27 +2702,27 @@ async def get_cart(user: dict = Depends(require_user)):
 @app.delete("/api/cart/{item_id}")
 async def remove_from_cart(item_id: str, user: dict = Depends(require_user)):
     """Remove item from cart"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
     
-    supabase.table('cart_items').delete().eq('id', item_id).eq('user_id', user['id']).execute()
+    await supabase.table('cart_items').delete().eq('id', item_id).eq('user_id', user['id']).execute()
     
     return {"success": True, "message": "Removed from cart"}
 
 @app.post("/api/orders/create")
 async def create_order(data: OrderCreate, user: dict = Depends(require_user)):
     """Create an order for an artwork"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get artwork details
-    artwork = supabase.table('artworks').select('*, profiles!artist_id(id, full_name)').eq('id', data.artwork_id).eq('is_available', True).single().execute()
+    artwork = await supabase.table('artworks').select('*, profiles!artist_id(id, full_name)').eq('id', data.artwork_id).eq('is_available', True).single().execute()
     
     if not artwork.data:
         raise HTTPException(status_code=404, detail="Artwork not found or not available")
     
     # Get user profile
-    user_profile = supabase.table('profiles').select('full_name, email').eq('id', user['id']).single().execute()
+    user_profile = await supabase.table('profiles').select('full_name, email').eq('id', user['id']).single().execute()
     
     order_number = f"ORD-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
     
@@ -1856,7 +2742,8 @@ async def create_order(data: OrderCreate, user: dict = Depends(require_user)):
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     
-    result = supabase.table('orders').insert(order_data).execute()
+    result = await supabase.table('orders').insert(order_data).execute()
+    await _bump_trending_score(supabase, artwork.data['artist_id'], sales=1)
     
     # Create notification for real-time display
     notification_data = {
@@ -1866,16 +2753,16 @@ async def create_order(data: OrderCreate, user: dict = Depends(require_user)):
         "artwork_title": artwork.data['title'],
         "created_at": datetime.now(timezone.utc).isoformat()
     }
-    supabase.table('notifications').insert(notification_data).execute()
+    await supabase.table('notifications').insert(notification_data).execute()
     
     return {"success": True, "order": result.data[0], "order_number": order_number}
 
 @app.get("/api/orders/my-orders")
 async def get_my_orders(user: dict = Depends(require_user)):
     """Get user's orders"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    orders = supabase.table('orders').select('*').eq('user_id', user['id']).order('created_at', desc=True).execute()
+    orders = await supabase.table('orders').select('*').eq('user_id', user['id']).order('created_at', desc=True).execute()
     
     return {"orders": orders.data or []}
 
@@ -1884,7 +2771,7 @@ async def get_my_orders(user: dict = Depends(require_user)):
 @app.get("/api/notifications/recent")
 async def get_recent_notifications():
     """Get recent purchase/order notifications for display"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         return {"notifications": []}
 
@@ -1892,7 +2779,7 @@ async def get_recent_notifications():
         # Get notifications from last 24 hours
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
         notifications = (
-            supabase.table('notifications')
+            await supabase.table('notifications')
             .select('*')
             .gte('created_at', cutoff)
             .order('created_at', desc=True)
@@ -1940,10 +2827,10 @@ COURIER_TRACKING_URLS = {
 @app.post("/api/orders/{order_id}/update-awb")
 async def update_awb(order_id: str, data: AWBUpdateRequest, artist: dict = Depends(require_artist)):
     """Update AWB tracking for an order"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Verify artist owns this order
-    order = supabase.table('orders').select('*').eq('id', order_id).eq('artist_id', artist['id']).single().execute()
+    order = await supabase.table('orders').select('*').eq('id', order_id).eq('artist_id', artist['id']).single().execute()
     
     if not order.data:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -1965,16 +2852,16 @@ async def update_awb(order_id: str, data: AWBUpdateRequest, artist: dict = Depen
         "shipped_at": datetime.now(timezone.utc).isoformat()
     }
     
-    supabase.table('orders').update(update_data).eq('id', order_id).execute()
+    await supabase.table('orders').update(update_data).eq('id', order_id).execute()
     
     return {"success": True, "tracking_url": tracking_url}
 
 @app.get("/api/orders/{order_id}/track")
 async def track_order(order_id: str, user: dict = Depends(require_user)):
     """Get tracking info for an order"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    order = supabase.table('orders').select('awb_number, courier_partner, tracking_url, status, shipped_at').eq('id', order_id).single().execute()
+    order = await supabase.table('orders').select('awb_number, courier_partner, tracking_url, status, shipped_at').eq('id', order_id).single().execute()
     
     if not order.data:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -1986,12 +2873,12 @@ async def track_order(order_id: str, user: dict = Depends(require_user)):
 @app.post("/api/public/art-class-enquiry")
 async def create_art_class_enquiry(enquiry_data: ArtClassEnquiryCreate, user: dict = Depends(require_user)):
     """Submit art class enquiry - one per month per user"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if user already has an active enquiry in the last 30 days
     thirty_days_ago = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
     
-    existing = supabase.table('art_class_enquiries').select('id').eq('user_id', user['id']).gte('created_at', thirty_days_ago).execute()
+    existing = await supabase.table('art_class_enquiries').select('id').eq('user_id', user['id']).gte('created_at', thirty_days_ago).execute()
     
     if existing.data:
         raise HTTPException(status_code=400, detail="You can only submit one enquiry per month")
@@ -2030,11 +2917,11 @@ async def create_art_class_enquiry(enquiry_data: ArtClassEnquiryCreate, user: di
     if enquiry_data.art_type:
         query = query.contains('categories', [enquiry_data.art_type])
     
-    matching_artists = query.order('teaching_rate').limit(3).execute()
+    matching_artists = await query.order('teaching_rate').limit(3).execute()
     matched_ids = [artist['id'] for artist in (matching_artists.data or [])]
     
     # Get user info
-    user_profile = supabase.table('profiles').select('full_name, email, location').eq('id', user['id']).single().execute()
+    user_profile = await supabase.table('profiles').select('full_name, email, location').eq('id', user['id']).single().execute()
     
     # Create enquiry
     enquiry = {
@@ -2053,7 +2940,7 @@ async def create_art_class_enquiry(enquiry_data: ArtClassEnquiryCreate, user: di
     }
     
     try:
-        result = supabase.table('art_class_enquiries').insert(enquiry).execute()
+        result = await supabase.table('art_class_enquiries').insert(enquiry).execute()
     except Exception as e:
         print(f"Art class enquiry error: {e}")
         # Try with minimal fields
@@ -2064,7 +2951,7 @@ async def create_art_class_enquiry(enquiry_data: ArtClassEnquiryCreate, user: di
             "status": "pending"
         }
         try:
-            result = supabase.table('art_class_enquiries').insert(minimal_enquiry).execute()
+            result = await supabase.table('art_class_enquiries').insert(minimal_enquiry).execute()
         except Exception as final_error:
             print(f"Art class enquiry final error: {final_error}")
             raise HTTPException(status_code=500, detail="Failed to create enquiry. Please contact support.")
@@ -2079,9 +2966,9 @@ async def create_art_class_enquiry(enquiry_data: ArtClassEnquiryCreate, user: di
 @app.get("/api/public/art-class-matches/{enquiry_id}")
 async def get_art_class_matches(enquiry_id: str, user: dict = Depends(require_user)):
     """Get matching artists for an enquiry"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    enquiry = supabase.table('art_class_enquiries').select('*').eq('id', enquiry_id).eq('user_id', user['id']).single().execute()
+    enquiry = await supabase.table('art_class_enquiries').select('*').eq('id', enquiry_id).eq('user_id', user['id']).single().execute()
     
     if not enquiry.data:
         raise HTTPException(status_code=404, detail="Enquiry not found")
@@ -2090,16 +2977,16 @@ async def get_art_class_matches(enquiry_id: str, user: dict = Depends(require_us
     if enquiry.data.get('expires_at'):
         expires_at = datetime.fromisoformat(enquiry.data['expires_at'].replace('Z', '+00:00'))
         if datetime.now(timezone.utc) > expires_at:
-            supabase.table('art_class_enquiries').update({"status": "expired"}).eq('id', enquiry_id).execute()
+            await supabase.table('art_class_enquiries').update({"status": "expired"}).eq('id', enquiry_id).execute()
             raise HTTPException(status_code=400, detail="This enquiry has expired")
     
     # Get matched artists
     matched_artists = []
     for artist_id in (enquiry.data.get('matched_artists') or []):
-        artist = supabase.table('profiles').select('*').eq('id', artist_id).single().execute()
+        artist = await supabase.table('profiles').select('*').eq('id', artist_id).single().execute()
         if artist.data:
             # Get sample artworks
-            artworks = supabase.table('artworks').select('*').eq('artist_id', artist_id).eq('is_approved', True).order('views', desc=True).limit(3).execute()
+            artworks = await supabase.table('artworks').select('*').eq('artist_id', artist_id).eq('is_approved', True).order('views', desc=True).limit(3).execute()
             artist.data['sample_artworks'] = artworks.data or []
             
             # Hide contact if not revealed
@@ -2125,9 +3012,9 @@ async def get_art_class_matches(enquiry_id: str, user: dict = Depends(require_us
 @app.post("/api/public/reveal-contact")
 async def reveal_artist_contact(request: RevealContactRequest, user: dict = Depends(require_user)):
     """Reveal artist contact - limited to 3 per enquiry"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    enquiry = supabase.table('art_class_enquiries').select('*').eq('id', request.enquiry_id).eq('user_id', user['id']).single().execute()
+    enquiry = await supabase.table('art_class_enquiries').select('*').eq('id', request.enquiry_id).eq('user_id', user['id']).single().execute()
     
     if not enquiry.data:
         raise HTTPException(status_code=404, detail="Enquiry not found")
@@ -2144,10 +3031,10 @@ async def reveal_artist_contact(request: RevealContactRequest, user: dict = Depe
     
     # Reveal contact
     contacts_revealed.append(request.artist_id)
-    supabase.table('art_class_enquiries').update({"contacts_revealed": contacts_revealed}).eq('id', request.enquiry_id).execute()
+    await supabase.table('art_class_enquiries').update({"contacts_revealed": contacts_revealed}).eq('id', request.enquiry_id).execute()
     
     # Get artist contact
-    artist = supabase.table('profiles').select('phone, email, full_name').eq('id', request.artist_id).single().execute()
+    artist = await supabase.table('profiles').select('phone, email, full_name').eq('id', request.artist_id).single().execute()
     
     return {
         "success": True,
@@ -2174,11 +3061,11 @@ async def get_matching_artists(category: str, budget: float):
     if category not in COMMISSION_ART_CATEGORIES:
         raise HTTPException(status_code=400, detail="Invalid artwork category")
 
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         return {"artists": []}
 
-    artists = _get_commission_matching_artists_sync(supabase, category, budget)
+    artists = await _get_commission_matching_artists(supabase, category, budget)
     return {"artists": artists}
 
 
@@ -2189,7 +3076,7 @@ async def create_commission_request(
     user: dict = Depends(require_user),
 ):
     """Create commission request and send to up to 3 selected/matched artists."""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Supabase not configured")
 
@@ -2201,7 +3088,7 @@ async def create_commission_request(
     estimate = calculate_commission_estimate(payload)
 
     requester_profile = (
-        supabase.table("profiles")
+        await supabase.table("profiles")
         .select("full_name, email, phone")
         .eq("id", user["id"])
         .single()
@@ -2247,7 +3134,7 @@ async def create_commission_request(
         "updated_at": datetime.now(timezone.utc).isoformat(),
     }
 
-    created = supabase.table("commission_requests").insert(commission_doc).execute()
+    created = await supabase.table("commission_requests").insert(commission_doc).execute()
     if not created.data:
         raise HTTPException(status_code=500, detail="Failed to create commission request")
 
@@ -2255,12 +3142,12 @@ async def create_commission_request(
 
     artists_to_notify = payload.selected_artist_ids
     if not artists_to_notify:
-        matches = _get_commission_matching_artists_sync(supabase, payload.art_category, payload.budget)
+        matches = await _get_commission_matching_artists(supabase, payload.art_category, payload.budget)
         artists_to_notify = [artist["id"] for artist in matches[:3]]
 
     for artist_id in artists_to_notify[:3]:
         existing = (
-            supabase.table("artist_requests")
+            await supabase.table("artist_requests")
             .select("id")
             .eq("commission_id", commission["id"])
             .eq("artist_id", artist_id)
@@ -2269,7 +3156,7 @@ async def create_commission_request(
         if existing.data:
             continue
 
-        supabase.table("artist_requests").insert(
+        await supabase.table("artist_requests").insert(
             {
                 "commission_id": commission["id"],
                 "artist_id": artist_id,
@@ -2280,7 +3167,7 @@ async def create_commission_request(
             }
         ).execute()
 
-    supabase.table("commission_updates").insert(
+    await supabase.table("commission_updates").insert(
         {
             "commission_id": commission["id"],
             "artist_id": artists_to_notify[0] if artists_to_notify else None,
@@ -2292,7 +3179,7 @@ async def create_commission_request(
     ).execute()
 
     admin_emails_res = (
-        supabase.table("profiles")
+        await supabase.table("profiles")
         .select("email")
         .eq("role", "admin")
         .eq("is_active", True)
@@ -2327,54 +3214,51 @@ async def create_commission_request(
 
 
 @app.get("/api/user/commissions")
-async def get_user_commissions(user: dict = Depends(require_user)):
-    supabase = get_supabase_client()
+async def get_user_commissions(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    include_updates: bool = False,
+    user: dict = Depends(require_user),
+):
+    supabase = get_async_supabase_client()
     if not supabase:
-        return {"commissions": []}
+        return {"commissions": [], "next_cursor": None}
 
-    commissions = (
+    query = (
         supabase.table("commission_requests")
         .select("*")
         .eq("user_id", user["id"])
-        .order("created_at", desc=True)
-        .execute()
+    )
+    if cursor:
+        created_at, row_id = _decode_keyset_cursor(cursor)
+        query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{row_id}")')
+    commissions = await query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+    commission_rows = commissions.data or []
+    next_cursor = _encode_keyset_cursor(commission_rows[limit - 1]) if len(commission_rows) > limit else None
+    commission_rows = commission_rows[:limit]
+
+    deals_by_commission, requests_by_commission, updates_by_commission = await _load_commission_relations(
+        supabase, [c["id"] for c in commission_rows], include_updates
     )
 
-    enriched = []
-    for commission in (commissions.data or []):
-        deal = (
-            supabase.table("commission_deals")
-            .select("*")
-            .eq("commission_id", commission["id"])
-            .order("created_at", desc=True)
-            .limit(1)
-            .execute()
-        )
-        deal_row = deal.data[0] if deal.data else None
-
+    active_artist_ids = {}
+    for commission in commission_rows:
+        deals = deals_by_commission.get(commission["id"]) or []
+        deal_row = deals[0] if deals else None
         active_artist_id = deal_row.get("artist_id") if deal_row else None
         if not active_artist_id:
-            first_request = (
-                supabase.table("artist_requests")
-                .select("artist_id")
-                .eq("commission_id", commission["id"])
-                .in_("status", ["accepted", "pending"])
-                .order("sent_at", desc=False)
-                .limit(1)
-                .execute()
-            )
-            active_artist_id = first_request.data[0]["artist_id"] if first_request.data else None
-
-        artist_profile = None
-        if active_artist_id:
-            artist_profile = (
-                supabase.table("profiles")
-                .select("id, full_name, avatar")
-                .eq("id", active_artist_id)
-                .single()
-                .execute()
+            first_request = next(
+                (r for r in (requests_by_commission.get(commission["id"]) or []) if r.get("status") in ["accepted", "pending"]),
+                None,
             )
+            active_artist_id = first_request.get("artist_id") if first_request else None
+        active_artist_ids[commission["id"]] = (deal_row, active_artist_id)
 
+    profiles = await _load_profiles_by_id(supabase, [artist_id for _, artist_id in active_artist_ids.values()])
+
+    enriched = []
+    for commission in commission_rows:
+        deal_row, active_artist_id = active_artist_ids[commission["id"]]
         item = {
             "id": commission.get("id"),
             "art_category": commission.get("category"),
@@ -2384,62 +3268,62 @@ async def get_user_commissions(user: dict = Depends(require_user)):
             "price_min": commission.get("price_min"),
             "price_max": commission.get("price_max"),
             "status": _compute_commission_display_status(commission, deal_row),
-            "artist": artist_profile.data if artist_profile and artist_profile.data else None,
+            "artist": _pick_fields(profiles.get(active_artist_id), ["id", "full_name", "avatar"]),
             "reference_image_urls": commission.get("reference_images") or [],
             "special_instructions": commission.get("description"),
             "deadline": commission.get("deadline"),
-            "updates": _get_commission_updates(supabase, commission["id"]),
         }
+        if include_updates:
+            item["updates"] = updates_by_commission.get(commission["id"]) or []
         enriched.append(item)
 
-    return {"commissions": enriched}
+    return {"commissions": enriched, "next_cursor": next_cursor}
 
 
 @app.get("/api/artist/commissions")
-async def get_artist_commissions(artist: dict = Depends(require_artist)):
-    supabase = get_supabase_client()
+async def get_artist_commissions(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    include_updates: bool = False,
+    artist: dict = Depends(require_artist),
+):
+    supabase = get_async_supabase_client()
     if not supabase:
-        return {"commissions": []}
+        return {"commissions": [], "next_cursor": None}
 
-    artist_requests = (
+    query = (
         supabase.table("artist_requests")
         .select("*")
         .eq("artist_id", artist["id"])
-        .order("sent_at", desc=True)
-        .execute()
+    )
+    if cursor:
+        sent_at, row_id = _decode_keyset_cursor(cursor)
+        query = query.or_(f'sent_at.lt."{sent_at}",and(sent_at.eq."{sent_at}",id.lt."{row_id}")')
+    artist_requests = await query.order("sent_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+    request_rows = artist_requests.data or []
+    next_cursor = _encode_keyset_cursor(request_rows[limit - 1], 'sent_at') if len(request_rows) > limit else None
+    request_rows = request_rows[:limit]
+
+    commission_rows = await _fetch_rows_in(
+        supabase, "commission_requests", "*", "id", [r["commission_id"] for r in request_rows]
+    )
+    commissions_by_id = {c["id"]: c for c in commission_rows}
+
+    (deals_by_commission, _, updates_by_commission), profiles = await asyncio.gather(
+        _load_commission_relations(supabase, list(commissions_by_id.keys()), include_updates),
+        _load_profiles_by_id(supabase, [c.get("user_id") for c in commission_rows], "id, full_name"),
     )
 
     enriched = []
-    for request_row in (artist_requests.data or []):
-        commission_res = (
-            supabase.table("commission_requests")
-            .select("*")
-            .eq("id", request_row["commission_id"])
-            .single()
-            .execute()
-        )
-        if not commission_res.data:
+    for request_row in request_rows:
+        commission = commissions_by_id.get(request_row["commission_id"])
+        if not commission:
             continue
-        commission = commission_res.data
-
-        requester_profile = (
-            supabase.table("profiles")
-            .select("id, full_name")
-            .eq("id", commission["user_id"])
-            .single()
-            .execute()
-        )
 
-        deal = (
-            supabase.table("commission_deals")
-            .select("*")
-            .eq("commission_id", commission["id"])
-            .eq("artist_id", artist["id"])
-            .order("created_at", desc=True)
-            .limit(1)
-            .execute()
+        deal_row = next(
+            (d for d in (deals_by_commission.get(commission["id"]) or []) if d.get("artist_id") == artist["id"]),
+            None,
         )
-        deal_row = deal.data[0] if deal.data else None
 
         item = {
             "id": commission.get("id"),
@@ -2452,67 +3336,59 @@ async def get_artist_commissions(artist: dict = Depends(require_artist)):
             "price_min": commission.get("price_min"),
             "price_max": commission.get("price_max"),
             "status": _compute_commission_display_status(commission, deal_row),
-            "requester": requester_profile.data if requester_profile else None,
+            "requester": profiles.get(commission.get("user_id")),
             "special_instructions": commission.get("description"),
             "deadline": commission.get("deadline"),
-            "updates": _get_commission_updates(supabase, commission["id"]),
         }
+        if include_updates:
+            item["updates"] = updates_by_commission.get(commission["id"]) or []
         enriched.append(item)
 
-    return {"commissions": enriched}
+    return {"commissions": enriched, "next_cursor": next_cursor}
 
 
 @app.get("/api/admin/commissions")
-async def get_admin_commissions(admin: dict = Depends(require_lead_chitrakar)):
-    supabase = get_supabase_client()
-    if not supabase:
-        return {"commissions": []}
-
-    commissions = (
-        supabase.table("commission_requests")
-        .select("*")
-        .order("created_at", desc=True)
-        .execute()
-    )
-
-    enriched = []
-    for commission in (commissions.data or []):
-        user_profile = (
-            supabase.table("profiles")
-            .select("id, full_name, email")
-            .eq("id", commission["user_id"])
-            .single()
-            .execute()
-        )
+async def get_admin_commissions(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    include_updates: bool = False,
+    admin: dict = Depends(require_lead_chitrakar),
+):
+    supabase = get_async_supabase_client()
+    if not supabase:
+        return {"commissions": [], "next_cursor": None}
+
+    query = supabase.table("commission_requests").select("*")
+    if cursor:
+        created_at, row_id = _decode_keyset_cursor(cursor)
+        query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{row_id}")')
+    commissions = await query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+    commission_rows = commissions.data or []
+    next_cursor = _encode_keyset_cursor(commission_rows[limit - 1]) if len(commission_rows) > limit else None
+    commission_rows = commission_rows[:limit]
+
+    deals_by_commission, requests_by_commission, updates_by_commission = await _load_commission_relations(
+        supabase, [c["id"] for c in commission_rows], include_updates
+    )
 
-        artist_profile = None
-        artist_requests = (
-            supabase.table("artist_requests")
-            .select("artist_id, status")
-            .eq("commission_id", commission["id"])
-            .execute()
+    accepted_artist_ids = {}
+    for commission in commission_rows:
+        accepted_request = next(
+            (r for r in (requests_by_commission.get(commission["id"]) or []) if r.get("status") == "accepted"),
+            None,
         )
+        accepted_artist_ids[commission["id"]] = accepted_request.get("artist_id") if accepted_request else None
 
-        accepted_request = next((r for r in (artist_requests.data or []) if r.get("status") == "accepted"), None)
-        active_artist_id = accepted_request.get("artist_id") if accepted_request else None
-        if active_artist_id:
-            artist_profile = (
-                supabase.table("profiles")
-                .select("id, full_name, email")
-                .eq("id", active_artist_id)
-                .single()
-                .execute()
-            )
+    profiles = await _load_profiles_by_id(
+        supabase,
+        [c.get("user_id") for c in commission_rows] + list(accepted_artist_ids.values()),
+        "id, full_name, email",
+    )
 
-        deal = (
-            supabase.table("commission_deals")
-            .select("*")
-            .eq("commission_id", commission["id"])
-            .order("created_at", desc=True)
-            .limit(1)
-            .execute()
-        )
-        deal_row = deal.data[0] if deal.data else None
+    enriched = []
+    for commission in commission_rows:
+        deals = deals_by_commission.get(commission["id"]) or []
+        deal_row = deals[0] if deals else None
 
         item = {
             "id": commission.get("id"),
@@ -2521,14 +3397,18 @@ async def get_admin_commissions(admin: dict = Depends(require_lead_chitrakar)):
             "budget": commission.get("budget"),
             "deadline": commission.get("deadline"),
             "status": _compute_commission_display_status(commission, deal_row),
-            "user": user_profile.data if user_profile else None,
-            "artist": artist_profile.data if artist_profile else None,
-            "artist_requests": artist_requests.data or [],
-            "updates": _get_commission_updates(supabase, commission["id"]),
+            "user": profiles.get(commission.get("user_id")),
+            "artist": profiles.get(accepted_artist_ids[commission["id"]]),
+            "artist_requests": [
+                {"artist_id": r.get("artist_id"), "status": r.get("status")}
+                for r in (requests_by_commission.get(commission["id"]) or [])
+            ],
         }
+        if include_updates:
+            item["updates"] = updates_by_commission.get(commission["id"]) or []
         enriched.append(item)
 
-    return {"commissions": enriched}
+    return {"commissions": enriched, "next_cursor": next_cursor}
 
 
 @app.post("/api/artist/commissions/{commission_id}/update")
@@ -2537,12 +3417,12 @@ async def update_commission_by_artist(
     payload: CommissionArtistUpdate,
     artist: dict = Depends(require_artist),
 ):
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Supabase not configured")
 
     deal_res = (
-        supabase.table("commission_deals")
+        await supabase.table("commission_deals")
         .select("*")
         .eq("artist_id", artist["id"])
         .eq("commission_id", commission_id)
@@ -2555,7 +3435,7 @@ async def update_commission_by_artist(
         raise HTTPException(status_code=404, detail="Commission deal not found for this artist")
 
     commission_res = (
-        supabase.table("commission_requests")
+        await supabase.table("commission_requests")
         .select("*")
         .eq("id", commission_id)
         .single()
@@ -2581,7 +3461,7 @@ async def update_commission_by_artist(
     if payload.note:
         update_doc["latest_update_note"] = payload.note
 
-    supabase.table("commission_deals").update(update_doc).eq("id", deal_res.data[0]["id"]).execute()
+    await supabase.table("commission_deals").update(update_doc).eq("id", deal_res.data[0]["id"]).execute()
 
     request_update = {
         "updated_at": datetime.now(timezone.utc).isoformat(),
@@ -2590,7 +3470,7 @@ async def update_commission_by_artist(
         request_update["status"] = "closed"
     elif payload.status in ["Accepted", "In Progress", "WIP Shared", "Completed"]:
         request_update["status"] = "locked"
-    supabase.table("commission_requests").update(request_update).eq("id", commission_id).execute()
+    await supabase.table("commission_requests").update(request_update).eq("id", commission_id).execute()
 
     status_update = {
         "commission_id": commission_id,
@@ -2601,7 +3481,7 @@ async def update_commission_by_artist(
         "new_status": payload.status,
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
-    inserted_update = supabase.table("commission_updates").insert(status_update).execute()
+    inserted_update = await supabase.table("commission_updates").insert(status_update).execute()
 
     return {
         "success": True,
@@ -2615,12 +3495,12 @@ async def admin_action_on_commission(
     payload: CommissionAdminAction,
     admin: dict = Depends(require_lead_chitrakar),
 ):
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Supabase not configured")
 
     commission_res = (
-        supabase.table("commission_requests")
+        await supabase.table("commission_requests")
         .select("*")
         .eq("id", payload.commission_id)
         .single()
@@ -2633,7 +3513,7 @@ async def admin_action_on_commission(
 
     if payload.artist_id:
         artist = (
-            supabase.table("profiles")
+            await supabase.table("profiles")
             .select("id, role")
             .eq("id", payload.artist_id)
             .single()
@@ -2643,14 +3523,14 @@ async def admin_action_on_commission(
             raise HTTPException(status_code=404, detail="Artist not found")
 
         existing_artist_request = (
-            supabase.table("artist_requests")
+            await supabase.table("artist_requests")
             .select("id")
             .eq("commission_id", payload.commission_id)
             .eq("artist_id", payload.artist_id)
             .execute()
         )
         if not existing_artist_request.data:
-            supabase.table("artist_requests").insert(
+            await supabase.table("artist_requests").insert(
                 {
                     "commission_id": payload.commission_id,
                     "artist_id": payload.artist_id,
@@ -2668,11 +3548,11 @@ async def admin_action_on_commission(
     if payload.admin_note:
         request_update["admin_note"] = payload.admin_note
 
-    supabase.table("commission_requests").update(request_update).eq("id", payload.commission_id).execute()
+    await supabase.table("commission_requests").update(request_update).eq("id", payload.commission_id).execute()
 
     if payload.status and payload.artist_id:
         existing_deal = (
-            supabase.table("commission_deals")
+            await supabase.table("commission_deals")
             .select("id")
             .eq("commission_id", payload.commission_id)
             .eq("artist_id", payload.artist_id)
@@ -2686,13 +3566,13 @@ async def admin_action_on_commission(
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
         if existing_deal.data:
-            supabase.table("commission_deals").update(deal_payload).eq("id", existing_deal.data[0]["id"]).execute()
+            await supabase.table("commission_deals").update(deal_payload).eq("id", existing_deal.data[0]["id"]).execute()
         else:
             deal_payload["created_at"] = datetime.now(timezone.utc).isoformat()
-            supabase.table("commission_deals").insert(deal_payload).execute()
+            await supabase.table("commission_deals").insert(deal_payload).execute()
 
     if payload.status:
-        supabase.table("commission_updates").insert(
+        await supabase.table("commission_updates").insert(
             {
                 "commission_id": payload.commission_id,
                 "artist_id": payload.artist_id,
@@ -2713,7 +3593,7 @@ async def respond_to_artist_request(
     artist: dict = Depends(require_artist),
 ):
     """Artist can accept/counter/reject an incoming commission request."""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Supabase not configured")
 
@@ -2721,7 +3601,7 @@ async def respond_to_artist_request(
         raise HTTPException(status_code=400, detail="Invalid action")
 
     request_res = (
-        supabase.table("artist_requests")
+        await supabase.table("artist_requests")
         .select("*")
         .eq("id", artist_request_id)
         .eq("artist_id", artist["id"])
@@ -2735,20 +3615,20 @@ async def respond_to_artist_request(
     commission_id = artist_request["commission_id"]
 
     if payload.action == "reject":
-        supabase.table("artist_requests").update({"status": "rejected"}).eq("id", artist_request_id).execute()
+        await supabase.table("artist_requests").update({"status": "rejected"}).eq("id", artist_request_id).execute()
         return {"success": True, "message": "Request rejected"}
 
     if payload.action == "counter_offer":
         if not payload.counter_offer or payload.counter_offer <= 0:
             raise HTTPException(status_code=400, detail="counter_offer is required")
-        supabase.table("artist_requests").update(
+        await supabase.table("artist_requests").update(
             {"status": "pending", "counter_offer": payload.counter_offer}
         ).eq("id", artist_request_id).execute()
         return {"success": True, "message": "Counter offer sent"}
 
     # accept_offer flow
     existing_accepted = (
-        supabase.table("artist_requests")
+        await supabase.table("artist_requests")
         .select("id")
         .eq("commission_id", commission_id)
         .eq("status", "accepted")
@@ -2758,18 +3638,18 @@ async def respond_to_artist_request(
         raise HTTPException(status_code=400, detail="Another artist already accepted this commission")
 
     now_iso = datetime.now(timezone.utc).isoformat()
-    supabase.table("artist_requests").update(
+    await supabase.table("artist_requests").update(
         {"status": "accepted", "accepted_at": now_iso}
     ).eq("id", artist_request_id).execute()
 
-    supabase.table("artist_requests").update(
+    await supabase.table("artist_requests").update(
         {"status": "expired"}
     ).eq("commission_id", commission_id).neq("id", artist_request_id).eq("status", "pending").execute()
 
     final_price = payload.counter_offer or artist_request.get("offer_price")
     if not final_price:
         commission_req = (
-            supabase.table("commission_requests")
+            await supabase.table("commission_requests")
             .select("estimated_price")
             .eq("id", commission_id)
             .single()
@@ -2778,7 +3658,7 @@ async def respond_to_artist_request(
         final_price = (commission_req.data or {}).get("estimated_price")
 
     existing_deal = (
-        supabase.table("commission_deals")
+        await supabase.table("commission_deals")
         .select("id")
         .eq("commission_id", commission_id)
         .execute()
@@ -2792,14 +3672,14 @@ async def respond_to_artist_request(
         "updated_at": now_iso,
     }
     if existing_deal.data:
-        supabase.table("commission_deals").update(deal_payload).eq("id", existing_deal.data[0]["id"]).execute()
+        await supabase.table("commission_deals").update(deal_payload).eq("id", existing_deal.data[0]["id"]).execute()
     else:
         deal_payload["created_at"] = now_iso
-        supabase.table("commission_deals").insert(deal_payload).execute()
+        await supabase.table("commission_deals").insert(deal_payload).execute()
 
-    supabase.table("commission_requests").update({"status": "locked", "updated_at": now_iso}).eq("id", commission_id).execute()
+    await supabase.table("commission_requests").update({"status": "locked", "updated_at": now_iso}).eq("id", commission_id).execute()
 
-    supabase.table("commission_updates").insert(
+    await supabase.table("commission_updates").insert(
         {
             "commission_id": commission_id,
             "artist_id": artist["id"],
@@ -2817,18 +3697,18 @@ async def respond_to_artist_request(
 @app.get("/api/user/my-enquiries")
 async def get_my_art_class_enquiries(user: dict = Depends(require_user)):
     """Get user's art class enquiries"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    enquiries = supabase.table('art_class_enquiries').select('*').eq('user_id', user['id']).order('created_at', desc=True).execute()
+    enquiries = await supabase.table('art_class_enquiries').select('*').eq('user_id', user['id']).order('created_at', desc=True).execute()
     
     return {"enquiries": enquiries.data or []}
 
 @app.get("/api/user/profile")
 async def get_user_profile(user: dict = Depends(require_user)):
     """Get current user profile"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    profile = supabase.table('profiles').select('*').eq('id', user['id']).single().execute()
+    profile = await supabase.table('profiles').select('*').eq('id', user['id']).single().execute()
     
     if not profile.data:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -2840,7 +3720,7 @@ async def get_user_profile(user: dict = Depends(require_user)):
 @app.post("/api/profile/request-modification")
 async def request_profile_modification(data: ProfileModificationRequest, user: dict = Depends(require_user)):
     """Request profile modification - requires admin approval"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     modification_data = {
         "user_id": user['id'],
@@ -2849,71 +3729,71 @@ async def request_profile_modification(data: ProfileModificationRequest, user: d
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     
-    result = supabase.table('profile_modifications').insert(modification_data).execute()
+    result = await supabase.table('profile_modifications').insert(modification_data).execute()
     
     return {"success": True, "modification_id": result.data[0]['id'], "message": "Profile modification request submitted for admin approval"}
 
 @app.get("/api/profile/pending-modifications")
 async def get_pending_modifications(user: dict = Depends(require_user)):
     """Get user's pending profile modifications"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    modifications = supabase.table('profile_modifications').select('*').eq('user_id', user['id']).order('created_at', desc=True).execute()
+    modifications = await supabase.table('profile_modifications').select('*').eq('user_id', user['id']).order('created_at', desc=True).execute()
     
     return {"modifications": modifications.data or []}
 
 # ============ ADMIN ROUTES ============
 
 @app.get("/api/admin/dashboard")
-async def get_admin_dashboard(admin: dict = Depends(require_lead_chitrakar)):
-    """Get admin dashboard statistics"""
-    supabase = get_supabase_client()
-    
-    pending_artists = supabase.table('profiles').select('id', count='exact').eq('role', 'artist').eq('is_approved', False).execute()
-    pending_artworks = supabase.table('artworks').select('id', count='exact').eq('is_approved', False).execute()
-    pending_exhibitions = supabase.table('exhibitions').select('id', count='exact').eq('is_approved', False).execute()
-    total_users = supabase.table('profiles').select('id', count='exact').execute()
-    pending_communities = supabase.table('communities').select('id', count='exact').eq('is_approved', False).execute()
-    pending_modifications = supabase.table('profile_modifications').select('id', count='exact').eq('status', 'pending').execute()
-    pending_screenings = supabase.table('video_screenings').select('id', count='exact').eq('status', 'pending').execute()
+async def get_admin_dashboard(
+    estimated: bool = False,
+    admin: dict = Depends(require_lead_chitrakar)
+):
+    """Get admin dashboard statistics (estimated=true allows approximate totals when counting directly)"""
+    supabase = get_async_supabase_client()
+    
+    counters = await _load_platform_counters(supabase, estimated=estimated)
     
     return {
-        "pending_artists": pending_artists.count or 0,
-        "pending_artworks": pending_artworks.count or 0,
-        "pending_exhibitions": pending_exhibitions.count or 0,
-        "total_users": total_users.count or 0,
-        "pending_communities": pending_communities.count or 0,
-        "pending_modifications": pending_modifications.count or 0,
-        "pending_screenings": pending_screenings.count or 0
+        "pending_artists": counters["pending_artists"],
+        "pending_artworks": counters["pending_artworks"],
+        "pending_exhibitions": counters["pending_exhibitions"],
+        "total_users": counters["total_users"],
+        "pending_communities": counters["pending_communities"],
+        "pending_modifications": counters["pending_modifications"],
+        "pending_screenings": counters["pending_screenings"]
     }
 
 @app.get("/api/admin/pending-artists")
 async def get_pending_artists(admin: dict = Depends(require_lead_chitrakar)):
     """Get artists awaiting approval"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    artists = supabase.table('profiles').select('*').eq('role', 'artist').eq('is_approved', False).execute()
+    artists = await supabase.table('profiles').select('*').eq('role', 'artist').eq('is_approved', False).execute()
     
     return {"artists": artists.data or []}
 
 @app.post("/api/admin/approve-artist")
+@response_cache.invalidates('profiles')
+@_reindexes_search('artist', 'artist_id')
 async def approve_artist(artist_id: str, approved: bool, admin: dict = Depends(require_lead_chitrakar)):
     """Approve or reject an artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if approved:
-        result = supabase.table('profiles').update({"is_approved": True, "is_active": True}).eq('id', artist_id).execute()
+        result = await supabase.table('profiles').update({"is_approved": True, "is_active": True}).eq('id', artist_id).execute()
     else:
-        result = supabase.table('profiles').delete().eq('id', artist_id).execute()
+        result = await supabase.table('profiles').delete().eq('id', artist_id).execute()
+    invalidate_user_auth_cache(artist_id)
     
     return {"success": True, "message": f"Artist {'approved' if approved else 'rejected'}"}
 
 @app.get("/api/admin/pending-artworks")
 async def get_pending_artworks(admin: dict = Depends(require_lead_chitrakar)):
     """Get artworks awaiting approval"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    artworks = supabase.table('artworks').select('*, profiles!artist_id(full_name, email)').eq('is_approved', False).execute()
+    artworks = await supabase.table('artworks').select('*, profiles!artist_id(full_name, email)').eq('is_approved', False).execute()
     
     # Transform for frontend
     result = []
@@ -2927,28 +3807,30 @@ async def get_pending_artworks(admin: dict = Depends(require_lead_chitrakar)):
     return {"artworks": result}
 
 @app.post("/api/admin/approve-artwork")
+@response_cache.invalidates('artworks')
+@_reindexes_search('artwork', 'request.artwork_id')
 async def approve_artwork(request: ArtworkApprovalRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Approve or reject an artwork"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if request.approved:
-        result = supabase.table('artworks').update({"is_approved": True}).eq('id', request.artwork_id).execute()
+        result = await supabase.table('artworks').update({"is_approved": True}).eq('id', request.artwork_id).execute()
     else:
-        result = supabase.table('artworks').delete().eq('id', request.artwork_id).execute()
+        result = await supabase.table('artworks').delete().eq('id', request.artwork_id).execute()
     
     return {"success": True, "message": f"Artwork {'approved' if request.approved else 'rejected'}"}
 
 @app.get("/api/admin/pending-exhibitions")
 async def get_pending_exhibitions(admin: dict = Depends(require_lead_chitrakar)):
     """Get exhibitions awaiting approval"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
 
-    pending_approval = supabase.table('exhibitions').select('*, profiles!artist_id(full_name)').eq('is_approved', False).execute()
+    pending_approval = await supabase.table('exhibitions').select('*, profiles!artist_id(full_name)').eq('is_approved', False).execute()
     
     # Try to get pending artist actions, but handle missing column gracefully
     pending_actions_data = []
     try:
-        pending_actions = supabase.table('exhibitions').select('*, profiles!artist_id(full_name)').eq('artist_action_status', 'pending').execute()
+        pending_actions = await supabase.table('exhibitions').select('*, profiles!artist_id(full_name)').eq('artist_action_status', 'pending').execute()
         pending_actions_data = pending_actions.data or []
     except Exception as e:
         # Column might not exist - skip this query
@@ -2963,9 +3845,11 @@ async def get_pending_exhibitions(admin: dict = Depends(require_lead_chitrakar))
     return {"exhibitions": list(merged.values())}
 
 @app.post("/api/admin/approve-exhibition")
+@response_cache.invalidates('exhibitions')
+@_reindexes_search('exhibition', 'request.exhibition_id')
 async def approve_exhibition(request: ExhibitionApprovalRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Approve or reject an exhibition"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if request.approved:
         update_payload = {
@@ -2976,17 +3860,17 @@ async def approve_exhibition(request: ExhibitionApprovalRequest, admin: dict = D
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
         try:
-            result = supabase.table('exhibitions').update(update_payload).eq('id', request.exhibition_id).execute()
+            result = await supabase.table('exhibitions').update(update_payload).eq('id', request.exhibition_id).execute()
         except Exception as e:
             msg = str(e)
             fallback = dict(update_payload)
             for optional_field in ["payment_status", "request_status", "updated_at"]:
                 if optional_field in fallback and (optional_field in msg or "column" in msg.lower()):
                     fallback.pop(optional_field, None)
-            result = supabase.table('exhibitions').update(fallback).eq('id', request.exhibition_id).execute()
+            result = await supabase.table('exhibitions').update(fallback).eq('id', request.exhibition_id).execute()
 
         try:
-            _sync_exhibition_statuses(supabase)
+            await _exhibition_lifecycle_job.trigger()
         except Exception:
             pass
     else:
@@ -2997,23 +3881,25 @@ async def approve_exhibition(request: ExhibitionApprovalRequest, admin: dict = D
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
         try:
-            result = supabase.table('exhibitions').update(reject_payload).eq('id', request.exhibition_id).execute()
+            result = await supabase.table('exhibitions').update(reject_payload).eq('id', request.exhibition_id).execute()
         except Exception as e:
             msg = str(e)
             fallback = {"is_approved": False, "status": "rejected"}
             if "request_status" in msg.lower():
                 fallback.pop("request_status", None)
-            result = supabase.table('exhibitions').update(fallback).eq('id', request.exhibition_id).execute()
+            result = await supabase.table('exhibitions').update(fallback).eq('id', request.exhibition_id).execute()
     
     return {"success": True, "message": f"Exhibition {'approved' if request.approved else 'rejected'}"}
 
 
 @app.post("/api/admin/exhibitions/review-action")
+@response_cache.invalidates('exhibitions')
+@_reindexes_search('exhibition', 'request.exhibition_id')
 async def review_exhibition_action(request: AdminExhibitionActionReviewRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Admin reviews artist pause/delete request for exhibitions."""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
 
-    exhibition = supabase.table('exhibitions').select('*').eq('id', request.exhibition_id).single().execute()
+    exhibition = await supabase.table('exhibitions').select('*').eq('id', request.exhibition_id).single().execute()
     if not exhibition.data:
         raise HTTPException(status_code=404, detail="Exhibition not found")
 
@@ -3037,38 +3923,38 @@ async def review_exhibition_action(request: AdminExhibitionActionReviewRequest,
         }
 
     try:
-        supabase.table('exhibitions').update(update_payload).eq('id', request.exhibition_id).execute()
+        await supabase.table('exhibitions').update(update_payload).eq('id', request.exhibition_id).execute()
     except Exception:
         fallback = {k: v for k, v in update_payload.items() if k in ['status', 'artist_action_status']}
-        supabase.table('exhibitions').update(fallback).eq('id', request.exhibition_id).execute()
+        await supabase.table('exhibitions').update(fallback).eq('id', request.exhibition_id).execute()
 
     return {"success": True, "message": "Exhibition action reviewed"}
 
 @app.get("/api/admin/all-users")
 async def get_all_users(admin: dict = Depends(require_lead_chitrakar)):
     """Get all users"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    users = supabase.table('profiles').select('*').execute()
+    users = await supabase.table('profiles').select('*').execute()
     
     return {"users": users.data or []}
 
 @app.get("/api/admin/approved-artists")
 async def get_approved_artists(admin: dict = Depends(require_lead_chitrakar)):
     """Get approved artists for featuring"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    artists = supabase.table('profiles').select('*').eq('role', 'artist').eq('is_approved', True).execute()
+    artists = await supabase.table('profiles').select('*').eq('role', 'artist').eq('is_approved', True).execute()
     
     return {"artists": artists.data or []}
 
 @app.get("/api/admin/featured-artists")
 async def get_admin_featured_artists(admin: dict = Depends(require_lead_chitrakar)):
     """Get all featured artists for admin"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get all featured artists
-    all_featured = supabase.table('featured_artists').select('*').execute()
+    all_featured = await supabase.table('featured_artists').select('*').execute()
     
     contemporary = [a for a in (all_featured.data or []) if a.get('type') == 'contemporary']
     registered = [a for a in (all_featured.data or []) if a.get('type') == 'registered']
@@ -3082,9 +3968,10 @@ async def get_admin_featured_artists(admin: dict = Depends(require_lead_chitraka
     }
 
 @app.post("/api/admin/feature-contemporary-artist")
+@response_cache.invalidates('featured_artists')
 async def feature_contemporary_artist(artist_data: FeaturedArtistCreate, admin: dict = Depends(require_lead_chitrakar)):
     """Add a contemporary featured artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     featured_artist = {
         "name": artist_data.name,
@@ -3097,25 +3984,32 @@ async def feature_contemporary_artist(artist_data: FeaturedArtistCreate, admin:
         "is_featured": True
     }
     
-    result = supabase.table('featured_artists').insert(featured_artist).execute()
+    result = await supabase.table('featured_artists').insert(featured_artist).execute()
+    
+    try:
+        await _featured_expiry_job.trigger()
+    except Exception:
+        pass
     
     return {"success": True, "artist": result.data[0]}
 
 @app.delete("/api/admin/feature-contemporary-artist/{artist_id}")
 @app.delete("/api/admin/featured-artist/{artist_id}")
+@response_cache.invalidates('featured_artists')
 async def delete_contemporary_artist(artist_id: str, admin: dict = Depends(require_lead_chitrakar)):
     """Remove a contemporary featured artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    result = supabase.table('featured_artists').delete().eq('id', artist_id).execute()
+    result = await supabase.table('featured_artists').delete().eq('id', artist_id).execute()
     
     return {"success": True, "message": "Featured artist removed"}
 
 
 @app.put("/api/admin/featured-artist/{artist_id}")
+@response_cache.invalidates('featured_artists')
 async def update_featured_artist(artist_id: str, updates: dict, admin: dict = Depends(require_lead_chitrakar)):
     """Update featured artist settings (timeline, active status)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     allowed_fields = ['is_featured', 'is_active', 'featured_until', 'bio', 'artworks']
     update_data = {k: v for k, v in updates.items() if k in allowed_fields}
@@ -3124,7 +4018,7 @@ async def update_featured_artist(artist_id: str, updates: dict, admin: dict = De
         return {"success": False, "message": "No valid fields to update"}
     
     try:
-        supabase.table('featured_artists').update(update_data).eq('id', artist_id).execute()
+        await supabase.table('featured_artists').update(update_data).eq('id', artist_id).execute()
     except Exception as e:
         print(f"Featured artist update error: {e}")
         raise HTTPException(status_code=500, detail="Failed to update featured artist")
@@ -3132,19 +4026,20 @@ async def update_featured_artist(artist_id: str, updates: dict, admin: dict = De
     return {"success": True, "message": "Featured artist updated"}
 
 @app.post("/api/admin/feature-registered-artist")
+@response_cache.invalidates('featured_artists', 'profiles')
 async def feature_registered_artist(request: FeatureRegisteredArtistRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Feature or unfeature a registered artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if request.featured:
         # Get artist details
-        artist = supabase.table('profiles').select('*').eq('id', request.artist_id).single().execute()
+        artist = await supabase.table('profiles').select('*').eq('id', request.artist_id).single().execute()
         
         if not artist.data:
             raise HTTPException(status_code=404, detail="Artist not found")
         
         # Get artist's artworks
-        artworks = supabase.table('artworks').select('*').eq('artist_id', request.artist_id).eq('is_approved', True).order('views', desc=True).limit(10).execute()
+        artworks = await supabase.table('artworks').select('*').eq('artist_id', request.artist_id).eq('is_approved', True).order('views', desc=True).limit(10).execute()
         
         # Create featured entry
         featured_artist = {
@@ -3159,16 +4054,21 @@ async def feature_registered_artist(request: FeatureRegisteredArtistRequest, adm
             "is_featured": True
         }
         
-        result = supabase.table('featured_artists').insert(featured_artist).execute()
+        result = await supabase.table('featured_artists').insert(featured_artist).execute()
         
         # Also update the profiles table
-        supabase.table('profiles').update({"is_featured": True}).eq('id', request.artist_id).execute()
+        await supabase.table('profiles').update({"is_featured": True}).eq('id', request.artist_id).execute()
     else:
         # Remove from featured
-        result = supabase.table('featured_artists').delete().eq('artist_id', request.artist_id).execute()
+        result = await supabase.table('featured_artists').delete().eq('artist_id', request.artist_id).execute()
         
         # Also update the profiles table
-        supabase.table('profiles').update({"is_featured": False}).eq('id', request.artist_id).execute()
+        await supabase.table('profiles').update({"is_featured": False}).eq('id', request.artist_id).execute()
+    
+    try:
+        await _featured_expiry_job.trigger()
+    except Exception:
+        pass
     
     return {"success": True, "message": f"Artist {'featured' if request.featured else 'unfeatured'}"}
 
@@ -3177,15 +4077,15 @@ async def feature_registered_artist(request: FeatureRegisteredArtistRequest, adm
 @app.post("/api/artist/request-featured")
 async def request_featured(request: FeaturedRequest, user: dict = Depends(require_user)):
     """Artist requests to be featured (after payment)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if artist already has a pending request
-    existing = supabase.table('featured_requests').select('*').eq('artist_id', user['id']).eq('status', 'pending').execute()
+    existing = await supabase.table('featured_requests').select('*').eq('artist_id', user['id']).eq('status', 'pending').execute()
     if existing.data:
         raise HTTPException(status_code=400, detail="You already have a pending featured request")
     
     # Check if already featured
-    featured = supabase.table('featured_artists').select('id').eq('artist_id', user['id']).execute()
+    featured = await supabase.table('featured_artists').select('id').eq('artist_id', user['id']).execute()
     if featured.data:
         raise HTTPException(status_code=400, detail="You are already a featured artist")
     
@@ -3199,19 +4099,19 @@ async def request_featured(request: FeaturedRequest, user: dict = Depends(requir
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
     
-    result = supabase.table('featured_requests').insert(request_data).execute()
+    result = await supabase.table('featured_requests').insert(request_data).execute()
     
     return {"success": True, "message": "Featured request submitted. Admin will review shortly.", "request_id": result.data[0]['id'] if result.data else None}
 
 @app.get("/api/artist/featured-request-status")
 async def get_featured_request_status(user: dict = Depends(require_user)):
     """Get artist's featured request status"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    request = supabase.table('featured_requests').select('*').eq('artist_id', user['id']).order('created_at', desc=True).limit(1).execute()
+    request = await supabase.table('featured_requests').select('*').eq('artist_id', user['id']).order('created_at', desc=True).limit(1).execute()
     
     # Check if currently featured
-    featured = supabase.table('featured_artists').select('id, created_at, expires_at').eq('artist_id', user['id']).execute()
+    featured = await supabase.table('featured_artists').select('id, created_at, expires_at').eq('artist_id', user['id']).execute()
     
     return {
         "request": request.data[0] if request.data else None,
@@ -3222,16 +4122,16 @@ async def get_featured_request_status(user: dict = Depends(require_user)):
 @app.get("/api/admin/featured-requests")
 async def get_featured_requests(admin: dict = Depends(require_lead_chitrakar)):
     """Admin gets all pending featured requests"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     try:
         # Try with foreign key join first
-        requests = supabase.table('featured_requests').select('*, profiles(full_name, avatar, email)').eq('status', 'pending').order('created_at', desc=True).execute()
+        requests = await supabase.table('featured_requests').select('*, profiles(full_name, avatar, email)').eq('status', 'pending').order('created_at', desc=True).execute()
         return {"requests": requests.data or []}
     except Exception as e:
         # Fallback: fetch without join, then manually add profile data
         print(f"featured_requests join failed, using fallback: {e}")
-        requests = supabase.table('featured_requests').select('*').eq('status', 'pending').order('created_at', desc=True).execute()
+        requests = await supabase.table('featured_requests').select('*').eq('status', 'pending').order('created_at', desc=True).execute()
         
         result = []
         for req in (requests.data or []):
@@ -3239,7 +4139,7 @@ async def get_featured_requests(admin: dict = Depends(require_lead_chitrakar)):
             profile_data = None
             if artist_id:
                 try:
-                    profile = supabase.table('profiles').select('full_name, avatar, email').eq('id', artist_id).single().execute()
+                    profile = await supabase.table('profiles').select('full_name, avatar, email').eq('id', artist_id).single().execute()
                     profile_data = profile.data
                 except:
                     pass
@@ -3248,23 +4148,24 @@ async def get_featured_requests(admin: dict = Depends(require_lead_chitrakar)):
         return {"requests": result}
 
 @app.post("/api/admin/approve-featured-request")
+@response_cache.invalidates('featured_artists', 'profiles')
 async def approve_featured_request(request: FeaturedRequestApproval, admin: dict = Depends(require_lead_chitrakar)):
     """Admin approves or rejects featured request"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get the request
-    req = supabase.table('featured_requests').select('*').eq('id', request.request_id).single().execute()
+    req = await supabase.table('featured_requests').select('*').eq('id', request.request_id).single().execute()
     if not req.data:
         raise HTTPException(status_code=404, detail="Request not found")
     
     if request.approved:
         # Get artist details
-        artist = supabase.table('profiles').select('*').eq('id', req.data['artist_id']).single().execute()
+        artist = await supabase.table('profiles').select('*').eq('id', req.data['artist_id']).single().execute()
         if not artist.data:
             raise HTTPException(status_code=404, detail="Artist not found")
         
         # Get artist's artworks
-        artworks = supabase.table('artworks').select('*').eq('artist_id', req.data['artist_id']).eq('is_approved', True).order('views', desc=True).limit(10).execute()
+        artworks = await supabase.table('artworks').select('*').eq('artist_id', req.data['artist_id']).eq('is_approved', True).order('views', desc=True).limit(10).execute()
         
         # Calculate expiry (5 days from now)
         expires_at = (datetime.now(timezone.utc) + timedelta(days=req.data.get('duration_days', 5))).isoformat()
@@ -3284,23 +4185,29 @@ async def approve_featured_request(request: FeaturedRequestApproval, admin: dict
             "paid_amount": req.data.get('amount', 100),
         }
         
-        supabase.table('featured_artists').insert(featured_artist).execute()
+        await supabase.table('featured_artists').insert(featured_artist).execute()
         
         # Update profiles
-        supabase.table('profiles').update({"is_featured": True}).eq('id', req.data['artist_id']).execute()
+        await supabase.table('profiles').update({"is_featured": True}).eq('id', req.data['artist_id']).execute()
         
         # Update request status
-        supabase.table('featured_requests').update({
+        await supabase.table('featured_requests').update({
             "status": "approved",
             "approved_at": datetime.now(timezone.utc).isoformat(),
             "approved_by": admin['id'],
             "expires_at": expires_at,
         }).eq('id', request.request_id).execute()
         
+        # Reschedule the expiry job in case this is now the earliest expiry
+        try:
+            await _featured_expiry_job.trigger()
+        except Exception:
+            pass
+        
         return {"success": True, "message": "Featured request approved", "expires_at": expires_at}
     else:
         # Reject request
-        supabase.table('featured_requests').update({
+        await supabase.table('featured_requests').update({
             "status": "rejected",
             "rejected_at": datetime.now(timezone.utc).isoformat(),
             "rejection_reason": request.rejection_reason,
@@ -3309,24 +4216,25 @@ async def approve_featured_request(request: FeaturedRequestApproval, admin: dict
         return {"success": True, "message": "Featured request rejected"}
 
 @app.delete("/api/admin/remove-featured/{artist_id}")
+@response_cache.invalidates('featured_artists', 'profiles')
 async def admin_remove_featured(artist_id: str, admin: dict = Depends(require_lead_chitrakar)):
     """Admin manually removes featured artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
         raise HTTPException(status_code=500, detail="Database not configured")
     
     try:
         # Try to remove by artist_id first (for registered artists)
-        result = supabase.table('featured_artists').delete().eq('artist_id', artist_id).execute()
+        result = await supabase.table('featured_artists').delete().eq('artist_id', artist_id).execute()
         
         # If nothing was deleted, try by id (for contemporary artists)
         if not result.data or len(result.data) == 0:
-            result = supabase.table('featured_artists').delete().eq('id', artist_id).execute()
+            result = await supabase.table('featured_artists').delete().eq('id', artist_id).execute()
         
         # Update profiles if artist_id exists
         try:
-            supabase.table('profiles').update({"is_featured": False}).eq('id', artist_id).execute()
+            await supabase.table('profiles').update({"is_featured": False}).eq('id', artist_id).execute()
         except:
             pass  # Ignore if profile doesn't exist (contemporary artists)
         
@@ -3334,36 +4242,15 @@ async def admin_remove_featured(artist_id: str, admin: dict = Depends(require_le
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to remove featured artist: {str(e)}")
 
-# Background task to auto-expire featured artists (called via cron or on each request)
-@app.get("/api/system/cleanup-expired-featured")
-async def cleanup_expired_featured():
-    """Remove expired featured artists"""
-    supabase = get_supabase_client()
-    if not supabase:
-        return {"cleaned": 0}
-    
-    now = datetime.now(timezone.utc).isoformat()
-    
-    # Find expired featured artists
-    expired = supabase.table('featured_artists').select('id, artist_id').lt('expires_at', now).execute()
-    
-    if expired.data:
-        for artist in expired.data:
-            # Remove from featured
-            supabase.table('featured_artists').delete().eq('id', artist['id']).execute()
-            # Update profile
-            supabase.table('profiles').update({"is_featured": False}).eq('id', artist['artist_id']).execute()
-    
-    return {"cleaned": len(expired.data) if expired.data else 0}
-
 @app.post("/api/admin/create-sub-admin")
+@response_cache.invalidates('profiles')
 async def create_sub_admin(request: CreateSubAdminRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Admin can create sub-admin users"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     try:
-        # Create user in Supabase Auth
-        auth_response = supabase.auth.admin.create_user({
+        # Create user in Supabase Auth (GoTrue admin API is only on the sync client)
+        auth_response = await asyncio.to_thread(get_supabase_client().auth.admin.create_user, {
             "email": request.email,
             "password": request.password,
             "email_confirm": True,
@@ -3372,7 +4259,7 @@ async def create_sub_admin(request: CreateSubAdminRequest, admin: dict = Depends
         
         if auth_response.user:
             # Update profile
-            supabase.table('profiles').update({
+            await supabase.table('profiles').update({
                 "full_name": request.name,
                 "role": request.role,
                 "location": request.location,
@@ -3388,9 +4275,9 @@ async def create_sub_admin(request: CreateSubAdminRequest, admin: dict = Depends
 @app.get("/api/admin/sub-admins")
 async def get_sub_admins(admin: dict = Depends(require_lead_chitrakar)):
     """Get all sub-admin users"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    sub_admins = supabase.table('profiles').select('*').in_('role', ['lead_chitrakar', 'kalakar']).execute()
+    sub_admins = await supabase.table('profiles').select('*').in_('role', ['lead_chitrakar', 'kalakar']).execute()
     
     return {"sub_admins": sub_admins.data or []}
 
@@ -3398,11 +4285,11 @@ async def get_sub_admins(admin: dict = Depends(require_lead_chitrakar)):
 @app.get("/api/admin/pending-communities")
 async def get_pending_communities(admin: dict = Depends(require_lead_chitrakar)):
     """Get pending communities for approval (admin or lead_chitrakar)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     print(f"[DEBUG] Fetching pending communities for user: {admin.get('id')} role: {admin.get('role')}")
 
-    communities = supabase.table('communities').select('*').eq('is_approved', False).order('created_at', desc=True).execute()
+    communities = await supabase.table('communities').select('*').eq('is_approved', False).order('created_at', desc=True).execute()
     
     print(f"[DEBUG] Found {len(communities.data or [])} pending communities")
 
@@ -3412,7 +4299,7 @@ async def get_pending_communities(admin: dict = Depends(require_lead_chitrakar))
         creator_name = None
         if creator_id:
             try:
-                profile = supabase.table('profiles').select('full_name').eq('id', creator_id).single().execute()
+                profile = await supabase.table('profiles').select('full_name').eq('id', creator_id).single().execute()
                 creator_name = (profile.data or {}).get('full_name')
             except Exception:
                 creator_name = None
@@ -3425,14 +4312,16 @@ async def get_pending_communities(admin: dict = Depends(require_lead_chitrakar))
     return {"communities": result}
 
 @app.post("/api/admin/approve-community")
+@response_cache.invalidates('communities')
+@_reindexes_search('community', 'community_id')
 async def approve_community(community_id: str, approved: bool, admin: dict = Depends(require_lead_chitrakar)):
     """Approve or reject a community (admin or lead_chitrakar)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if approved:
-        supabase.table('communities').update({"is_approved": True}).eq('id', community_id).execute()
+        await supabase.table('communities').update({"is_approved": True}).eq('id', community_id).execute()
     else:
-        supabase.table('communities').delete().eq('id', community_id).execute()
+        await supabase.table('communities').delete().eq('id', community_id).execute()
     
     return {"success": True, "message": f"Community {'approved' if approved else 'rejected'}"}
 
@@ -3440,28 +4329,32 @@ async def approve_community(community_id: str, approved: bool, admin: dict = Dep
 @app.get("/api/admin/pending-profile-modifications")
 async def get_pending_profile_modifications(admin: dict = Depends(require_lead_chitrakar)):
     """Get pending profile modification requests"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    modifications = supabase.table('profile_modifications').select('*, profiles!user_id(full_name, email, phone)').eq('status', 'pending').execute()
+    modifications = await supabase.table('profile_modifications').select('*, profiles!user_id(full_name, email, phone)').eq('status', 'pending').execute()
     
     return {"modifications": modifications.data or []}
 
 @app.post("/api/admin/approve-profile-modification")
+@response_cache.invalidates('profiles')
 async def approve_profile_modification(modification_id: str, approved: bool, admin: dict = Depends(require_lead_chitrakar)):
     """Approve or reject profile modification"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    modification = supabase.table('profile_modifications').select('*').eq('id', modification_id).single().execute()
+    modification = await supabase.table('profile_modifications').select('*').eq('id', modification_id).single().execute()
     
     if not modification.data:
         raise HTTPException(status_code=404, detail="Modification not found")
     
     if approved:
         # Apply changes to profile
-        supabase.table('profiles').update(modification.data['requested_changes']).eq('id', modification.data['user_id']).execute()
-        supabase.table('profile_modifications').update({"status": "approved", "processed_at": datetime.now(timezone.utc).isoformat()}).eq('id', modification_id).execute()
+        await supabase.table('profiles').update(modification.data['requested_changes']).eq('id', modification.data['user_id']).execute()
+        invalidate_user_auth_cache(modification.data['user_id'])
+        _profile_card_cache.pop(modification.data['user_id'], None)
+        _schedule_search_reindex('artist', modification.data['user_id'])
+        await supabase.table('profile_modifications').update({"status": "approved", "processed_at": datetime.now(timezone.utc).isoformat()}).eq('id', modification_id).execute()
     else:
-        supabase.table('profile_modifications').update({"status": "rejected", "processed_at": datetime.now(timezone.utc).isoformat()}).eq('id', modification_id).execute()
+        await supabase.table('profile_modifications').update({"status": "rejected", "processed_at": datetime.now(timezone.utc).isoformat()}).eq('id', modification_id).execute()
     
     return {"success": True, "message": f"Profile modification {'approved' if approved else 'rejected'}"}
 
@@ -3470,24 +4363,21 @@ async def approve_profile_modification(modification_id: str, approved: bool, adm
 @app.get("/api/admin/artists-by-membership")
 async def get_artists_by_membership(admin: dict = Depends(require_lead_chitrakar)):
     """Get all artists separated by membership status"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get all approved artists
-    artists = supabase.table('profiles').select('*').eq('role', 'artist').eq('is_approved', True).execute()
+    artists = await supabase.table('profiles').select(
+        'id, full_name, email, phone, bio, categories, location, avatar, is_member, '
+        'membership_expiry, membership_plan, created_at, role, is_active'
+    ).eq('role', 'artist').eq('is_approved', True).execute()
     
     members = []
     non_members = []
-    now = datetime.now(timezone.utc)
+    now = time.time()
     
     for artist in (artists.data or []):
         # Check membership status
-        is_active_member = False
-        if artist.get('is_member') and artist.get('membership_expiry'):
-            try:
-                expiry = datetime.fromisoformat(artist['membership_expiry'].replace('Z', '+00:00'))
-                is_active_member = expiry > now
-            except:
-                pass
+        is_active_member = is_membership_active(artist.get('is_member'), artist.get('membership_expiry'), now)
         
         artist_data = {
             "id": artist.get("id"),
@@ -3523,9 +4413,11 @@ class UpdateUserRoleRequest(BaseModel):
     new_role: str  # 'user', 'artist', 'admin', 'lead_chitrakar', 'kalakar'
 
 @app.post("/api/admin/update-user-role")
+@response_cache.invalidates('profiles')
+@_reindexes_search('artist', 'request.user_id')
 async def update_user_role(request: UpdateUserRoleRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Admin can change user roles"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     valid_roles = ['user', 'artist', 'admin', 'lead_chitrakar', 'kalakar']
     if request.new_role not in valid_roles:
@@ -3535,11 +4427,13 @@ async def update_user_role(request: UpdateUserRoleRequest, admin: dict = Depends
     if request.user_id == admin['id'] and request.new_role != 'admin':
         raise HTTPException(status_code=400, detail="Cannot change your own admin role")
     
-    result = supabase.table('profiles').update({
+    result = await supabase.table('profiles').update({
         "role": request.new_role,
         "is_approved": True if request.new_role in ['admin', 'lead_chitrakar', 'kalakar'] else None
     }).eq('id', request.user_id).execute()
     
+    invalidate_user_auth_cache(request.user_id)
+    
     if not result.data:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -3551,13 +4445,14 @@ class GrantMembershipRequest(BaseModel):
     duration_days: int = 30
 
 @app.post("/api/admin/grant-membership")
+@response_cache.invalidates('profiles')
 async def admin_grant_membership(request: GrantMembershipRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Admin can grant membership to an artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     expiry_date = datetime.now(timezone.utc) + timedelta(days=request.duration_days)
     
-    result = supabase.table('profiles').update({
+    result = await supabase.table('profiles').update({
         "is_member": True,
         "membership_plan": request.plan,
         "membership_started_at": datetime.now(timezone.utc).isoformat(),
@@ -3567,14 +4462,17 @@ async def admin_grant_membership(request: GrantMembershipRequest, admin: dict =
     if not result.data:
         raise HTTPException(status_code=404, detail="Artist not found")
     
+    _membership_index.set(request.artist_id, expiry_date)
+    
     return {"success": True, "message": f"Membership granted until {expiry_date.strftime('%Y-%m-%d')}"}
 
 @app.post("/api/admin/revoke-membership")
+@response_cache.invalidates('profiles')
 async def admin_revoke_membership(artist_id: str, admin: dict = Depends(require_lead_chitrakar)):
     """Admin can revoke membership from an artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    result = supabase.table('profiles').update({
+    result = await supabase.table('profiles').update({
         "is_member": False,
         "membership_expiry": None
     }).eq('id', artist_id).execute()
@@ -3582,22 +4480,27 @@ async def admin_revoke_membership(artist_id: str, admin: dict = Depends(require_
     if not result.data:
         raise HTTPException(status_code=404, detail="Artist not found")
     
+    _membership_index.discard(artist_id)
+    
     return {"success": True, "message": "Membership revoked"}
 
 @app.post("/api/admin/toggle-user-status")
+@response_cache.invalidates('profiles')
+@_reindexes_search('artist', 'user_id')
 async def toggle_user_status(user_id: str, admin: dict = Depends(require_lead_chitrakar)):
     """Admin can activate/deactivate users"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get current status
-    user = supabase.table('profiles').select('is_active').eq('id', user_id).single().execute()
+    user = await supabase.table('profiles').select('is_active').eq('id', user_id).single().execute()
     
     if not user.data:
         raise HTTPException(status_code=404, detail="User not found")
     
     new_status = not user.data.get('is_active', True)
     
-    supabase.table('profiles').update({"is_active": new_status}).eq('id', user_id).execute()
+    await supabase.table('profiles').update({"is_active": new_status}).eq('id', user_id).execute()
+    invalidate_user_auth_cache(user_id)
     
     return {"success": True, "message": f"User {'activated' if new_status else 'deactivated'}", "is_active": new_status}
 
@@ -3606,10 +4509,10 @@ async def toggle_user_status(user_id: str, admin: dict = Depends(require_lead_ch
 @app.get("/api/admin/membership-plans")
 async def get_membership_plans(admin: dict = Depends(require_lead_chitrakar)):
     """Get all membership plans"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     try:
-        plans = supabase.table('membership_plans').select('*').order('price').execute()
+        plans = await supabase.table('membership_plans').select('*').order('price').execute()
         return {"plans": plans.data or []}
     except:
         # Return default plans if table doesn't exist
@@ -3622,7 +4525,7 @@ async def get_membership_plans(admin: dict = Depends(require_lead_chitrakar)):
 @app.post("/api/admin/update-membership-plan")
 async def update_membership_plan(plan: MembershipPlanUpdate, admin: dict = Depends(require_lead_chitrakar)):
     """Update a membership plan"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     plan_data = {
         "id": plan.plan_id,
@@ -3636,17 +4539,17 @@ async def update_membership_plan(plan: MembershipPlanUpdate, admin: dict = Depen
     }
     
     # Upsert the plan
-    result = supabase.table('membership_plans').upsert(plan_data).execute()
+    result = await supabase.table('membership_plans').upsert(plan_data).execute()
     
     return {"success": True, "message": f"Plan {plan.name} updated successfully", "plan": result.data[0] if result.data else plan_data}
 
 @app.get("/api/admin/vouchers")
 async def get_vouchers(admin: dict = Depends(require_lead_chitrakar)):
     """Get all vouchers"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     try:
-        vouchers = supabase.table('vouchers').select('*').order('created_at', desc=True).execute()
+        vouchers = await supabase.table('vouchers').select('*').order('created_at', desc=True).execute()
         return {"vouchers": vouchers.data or []}
     except:
         return {"vouchers": []}
@@ -3654,7 +4557,7 @@ async def get_vouchers(admin: dict = Depends(require_lead_chitrakar)):
 @app.post("/api/admin/create-voucher")
 async def create_voucher(voucher: VoucherCreate, admin: dict = Depends(require_lead_chitrakar)):
     """Create a new voucher"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     voucher_data = {
         "code": voucher.code.upper(),
@@ -3671,41 +4574,41 @@ async def create_voucher(voucher: VoucherCreate, admin: dict = Depends(require_l
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     
-    result = supabase.table('vouchers').insert(voucher_data).execute()
+    result = await supabase.table('vouchers').insert(voucher_data).execute()
     
     return {"success": True, "message": f"Voucher {voucher.code} created", "voucher": result.data[0] if result.data else voucher_data}
 
 @app.delete("/api/admin/voucher/{voucher_id}")
 async def delete_voucher(voucher_id: str, admin: dict = Depends(require_lead_chitrakar)):
     """Delete a voucher"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    supabase.table('vouchers').delete().eq('id', voucher_id).execute()
+    await supabase.table('vouchers').delete().eq('id', voucher_id).execute()
     
     return {"success": True, "message": "Voucher deleted"}
 
 @app.post("/api/admin/toggle-voucher/{voucher_id}")
 async def toggle_voucher(voucher_id: str, admin: dict = Depends(require_lead_chitrakar)):
     """Toggle voucher active status"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    voucher = supabase.table('vouchers').select('is_active').eq('id', voucher_id).single().execute()
+    voucher = await supabase.table('vouchers').select('is_active').eq('id', voucher_id).single().execute()
     
     if not voucher.data:
         raise HTTPException(status_code=404, detail="Voucher not found")
     
     new_status = not voucher.data.get('is_active', True)
-    supabase.table('vouchers').update({"is_active": new_status}).eq('id', voucher_id).execute()
+    await supabase.table('vouchers').update({"is_active": new_status}).eq('id', voucher_id).execute()
     
     return {"success": True, "is_active": new_status}
 
 @app.post("/api/public/apply-voucher")
 async def apply_voucher(request: VoucherApply):
     """Apply a voucher code and get discount"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Find voucher
-    voucher = supabase.table('vouchers').select('*').eq('code', request.voucher_code.upper()).eq('is_active', True).single().execute()
+    voucher = await supabase.table('vouchers').select('*').eq('code', request.voucher_code.upper()).eq('is_active', True).single().execute()
     
     if not voucher.data:
         raise HTTPException(status_code=404, detail="Invalid or expired voucher code")
@@ -3737,90 +4640,152 @@ async def apply_voucher(request: VoucherApply):
 
 # ============ TRENDING ARTISTS ============
 
+# Forward-decay parameters. Growth is computed in SQL against trending_state.epoch
+# (scripts/trending_epoch_migration.sql); TRENDING_EPOCH is only the seed used until
+# that row has been read. The half-life must match trending_state.half_life_days.
+TRENDING_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+TRENDING_HALF_LIFE_DAYS = 3.5
+TRENDING_VIEW_WEIGHT = 1
+TRENDING_SALE_WEIGHT = 10
+TRENDING_TOP_N = 6
+TRENDING_SNAPSHOT_TTL_SECONDS = 60
+# Rebase once growth reaches 2^64, far below the float range (~2^1024)
+TRENDING_REBASE_HALF_LIVES = 64
+TRENDING_REBASE_CHECK_SECONDS = int(os.environ.get('TRENDING_REBASE_CHECK_SECONDS', '86400'))
+
+_trending_snapshot = {"payload": None, "expires_at": 0.0}
+_trending_state = {"epoch": TRENDING_EPOCH}
+
+
+def _trending_growth(epoch: datetime, at: Optional[datetime] = None) -> float:
+    """2^((at - epoch) / half_life): divide stored scores by this for their current value."""
+    at = at or datetime.now(timezone.utc)
+    half_lives = (at - epoch).total_seconds() / (TRENDING_HALF_LIFE_DAYS * 86400)
+    return 2.0 ** half_lives
+
+
+async def _bump_trending_score(supabase, artist_id: Optional[str], views: int = 0, sales: int = 0):
+    """Incrementally add views/sales to an artist's trending score. Never fails the caller."""
+    if not supabase or not artist_id or (views <= 0 and sales <= 0):
+        return
+    try:
+        await supabase.rpc('bump_trending_score', {
+            "p_artist_id": artist_id,
+            "p_weight": views * TRENDING_VIEW_WEIGHT + sales * TRENDING_SALE_WEIGHT,
+            "p_views": views,
+            "p_sales": sales,
+        }).execute()
+    except Exception as e:
+        print(f"Trending score update error: {e}")
+
+
+async def _flush_artwork_views(views_by_artwork: Dict[str, int], views_by_artist: Dict[str, int]):
+    """Apply buffered views to artworks.views and trending_scores in one atomic RPC."""
+    supabase = get_async_supabase_client()
+    if not supabase:
+        return
+    await supabase.rpc('flush_artwork_views', {
+        "p_artwork_views": [{"id": artwork_id, "views": views} for artwork_id, views in views_by_artwork.items()],
+        "p_artist_views": [
+            {"artist_id": artist_id, "views": views, "weight": views * TRENDING_VIEW_WEIGHT}
+            for artist_id, views in views_by_artist.items()
+        ],
+    }).execute()
+
+
+async def _run_trending_rebase(supabase) -> Optional[datetime]:
+    """Move the forward-decay epoch forward (scaling stored scores to match) before growth can overflow."""
+    result = await supabase.rpc('rebase_trending_epoch', {"p_min_half_lives": TRENDING_REBASE_HALF_LIVES}).execute()
+    if result.data:
+        epoch = datetime.fromisoformat(str(result.data).replace('Z', '+00:00'))
+        if epoch != _trending_state["epoch"]:
+            print(f"[trending] forward-decay epoch is now {epoch.isoformat()}")
+            _trending_state["epoch"] = epoch
+            _trending_snapshot["payload"] = None
+    return datetime.now(timezone.utc) + timedelta(seconds=TRENDING_REBASE_CHECK_SECONDS)
+
+
+_trending_rebase_job = ScheduledJob('trending_epoch_rebase', _run_trending_rebase)
+
+_view_counter = WriteBehindViewCounter(_flush_artwork_views)
+
+
+async def _load_trending_snapshot(supabase) -> dict:
+    """Top-N active members by decayed score, with their approved artworks, in one query."""
+    now = datetime.now(timezone.utc)
+    # A rebase landing between these two reads skews one snapshot; rebases are months apart
+    state = await supabase.table('trending_state').select('epoch').limit(1).execute()
+    if state.data:
+        _trending_state["epoch"] = datetime.fromisoformat(state.data[0]['epoch'].replace('Z', '+00:00'))
+    rows = await (
+        supabase.table('trending_scores')
+        .select(
+            'artist_id, decay_score, total_views, sales_count, '
+            'profiles!inner(id, full_name, bio, categories, location, avatar, '
+            'artworks!artist_id(id, views, title, image, images, price, is_approved))',
+            count='exact',
+        )
+        .eq('profiles.role', 'artist')
+        .eq('profiles.is_approved', True)
+        .eq('profiles.is_active', True)
+        .eq('profiles.is_member', True)
+        .gt('profiles.membership_expiry', now.isoformat())
+        .eq('profiles.artworks.is_approved', True)
+        .gt('decay_score', 0)
+        .order('decay_score', desc=True)
+        .limit(TRENDING_TOP_N)
+        .execute()
+    )
+
+    growth = _trending_growth(_trending_state["epoch"], now)
+    trending_artists = []
+    for row in (rows.data or []):
+        artist = row.get('profiles') or {}
+        artworks = artist.get('artworks') or []
+        top_artwork = max(artworks, key=lambda a: a.get('views') or 0) if artworks else None
+        bio = artist.get('bio')
+
+        trending_artists.append({
+            "id": row['artist_id'],
+            "name": artist.get('full_name'),
+            "avatar": artist.get('avatar'),
+            "location": artist.get('location'),
+            "categories": artist.get('categories', []),
+            "bio": bio[:150] + '...' if bio and len(bio) > 150 else bio,
+            "total_views": row.get('total_views') or 0,
+            "sales_count": row.get('sales_count') or 0,
+            "artwork_count": len(artworks),
+            "trending_score": round((row.get('decay_score') or 0) / growth, 2),
+            "top_artwork": {
+                "title": top_artwork.get('title'),
+                "image": (top_artwork.get('images') or [None])[0] or top_artwork.get('image'),
+                "price": top_artwork.get('price')
+            } if top_artwork else None
+        })
+
+    return {
+        "artists": trending_artists,
+        "period": "This Week",
+        "total_trending": rows.count if rows.count is not None else len(trending_artists)
+    }
+
+
 @app.get("/api/public/trending-artists")
 async def get_trending_artists():
-    """Get trending artists based on artwork views and sales"""
-    supabase = get_supabase_client()
+    """Get trending artists from the precomputed, time-decayed leaderboard"""
+    supabase = get_async_supabase_client()
     
     if not supabase:
         return {"artists": [], "period": "This Week"}
     
+    if _trending_snapshot["payload"] is not None and time.monotonic() < _trending_snapshot["expires_at"]:
+        return _trending_snapshot["payload"]
+    
     try:
-        # Get artists with their artwork stats
-        # Calculate trending score based on views and sales
-        artists_query = supabase.table('profiles').select(
-            'id, full_name, bio, categories, location, avatar, is_member, membership_expiry'
-        ).eq('role', 'artist').eq('is_approved', True).eq('is_active', True).execute()
-        
-        if not artists_query.data:
-            return {"artists": [], "period": "This Week"}
-        
-        trending_artists = []
-        now = datetime.now(timezone.utc)
-        
-        for artist in artists_query.data:
-            # Only include artists with active membership
-            is_active_member = False
-            if artist.get('is_member') and artist.get('membership_expiry'):
-                try:
-                    expiry = datetime.fromisoformat(artist['membership_expiry'].replace('Z', '+00:00'))
-                    is_active_member = expiry > now
-                except:
-                    pass
-            
-            if not is_active_member:
-                continue
-            
-            # Get artwork stats for this artist
-            artworks = supabase.table('artworks').select(
-                'id, views, title, image, images, price'
-            ).eq('artist_id', artist['id']).eq('is_approved', True).execute()
-            
-            total_views = sum(a.get('views', 0) for a in (artworks.data or []))
-            artwork_count = len(artworks.data or [])
-            
-            # Get sales count from orders
-            orders = supabase.table('orders').select('id').eq('artist_id', artist['id']).execute()
-            sales_count = len(orders.data or [])
-            
-            # Calculate trending score (views * 1 + sales * 10)
-            trending_score = total_views + (sales_count * 10)
-            
-            if trending_score > 0 or artwork_count > 0:
-                # Get top artwork for display
-                top_artwork = None
-                if artworks.data:
-                    sorted_artworks = sorted(artworks.data, key=lambda x: x.get('views', 0), reverse=True)
-                    top_artwork = sorted_artworks[0] if sorted_artworks else None
-                
-                trending_artists.append({
-                    "id": artist['id'],
-                    "name": artist.get('full_name'),
-                    "avatar": artist.get('avatar'),
-                    "location": artist.get('location'),
-                    "categories": artist.get('categories', []),
-                    "bio": artist.get('bio', '')[:150] + '...' if artist.get('bio') and len(artist.get('bio', '')) > 150 else artist.get('bio'),
-                    "total_views": total_views,
-                    "sales_count": sales_count,
-                    "artwork_count": artwork_count,
-                    "trending_score": trending_score,
-                    "top_artwork": {
-                        "title": top_artwork.get('title'),
-                        "image": top_artwork.get('images', [None])[0] or top_artwork.get('image'),
-                        "price": top_artwork.get('price')
-                    } if top_artwork else None
-                })
-        
-        # Sort by trending score and get top 6
-        trending_artists.sort(key=lambda x: x['trending_score'], reverse=True)
-        top_trending = trending_artists[:6]
-        
-        return {
-            "artists": top_trending,
-            "period": "This Week",
-            "total_trending": len(trending_artists)
-        }
-        
+        payload = await _load_trending_snapshot(supabase)
+        _trending_snapshot["payload"] = payload
+        _trending_snapshot["expires_at"] = time.monotonic() + TRENDING_SNAPSHOT_TTL_SECONDS
+        return payload
     except Exception as e:
         print(f"Trending artists error: {e}")
         return {"artists": [], "period": "This Week"}
@@ -3828,16 +4793,18 @@ async def get_trending_artists():
 # ============ CONTEMPORARY ARTIST OF THE DAY ============
 
 @app.get("/api/public/artist-of-the-day")
+@response_cache.cached("public_artist_of_the_day", ttl=300, tags=('featured_artists',))
 async def get_artist_of_the_day():
     """Get the contemporary artist of the day (rotates daily)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if not supabase:
+        mark_uncacheable()
         return {"artist": None}
     
     try:
         # Get all contemporary featured artists
-        artists = supabase.table('featured_artists').select('*').eq('type', 'contemporary').eq('is_featured', True).execute()
+        artists = await supabase.table('featured_artists').select('*').eq('type', 'contemporary').eq('is_featured', True).execute()
         
         if not artists.data:
             return {"artist": None}
@@ -3858,21 +4825,21 @@ async def get_artist_of_the_day():
         }
     except Exception as e:
         print(f"Artist of the day error: {e}")
+        mark_uncacheable()
         return {"artist": None}
 
 # ============ COMMUNITY MANAGEMENT ============
 
 @app.post("/api/community/create")
+@response_cache.invalidates('communities')
 async def create_community_managed(community: CommunityCreate, artist: dict = Depends(require_artist)):
     """Create a new community (requires membership)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
     
     # Check if artist has membership
-    profile = supabase.table('profiles').select('is_member, membership_expiry').eq('id', artist['id']).single().execute()
-    
-    if not profile.data.get('is_member'):
+    if not await _is_active_member(supabase, artist['id']):
         raise HTTPException(status_code=403, detail="Active membership required to create communities")
     
     # Use only columns that exist in the DB schema
@@ -3889,7 +4856,7 @@ async def create_community_managed(community: CommunityCreate, artist: dict = De
     # Keep backward compatibility with older table schemas
     result = None
     try:
-        result = supabase.table('communities').insert(community_data).execute()
+        result = await supabase.table('communities').insert(community_data).execute()
     except Exception as e:
         msg = str(e)
         fallback_data = dict(community_data)
@@ -3899,7 +4866,7 @@ async def create_community_managed(community: CommunityCreate, artist: dict = De
                 fallback_data.pop(optional_field, None)
 
         try:
-            result = supabase.table('communities').insert(fallback_data).execute()
+            result = await supabase.table('communities').insert(fallback_data).execute()
         except Exception as final_error:
             print(f"create_community schema mismatch: {final_error}")
             raise HTTPException(status_code=500, detail="Community table schema mismatch. Please sync columns and retry.")
@@ -3914,12 +4881,12 @@ async def create_community_managed(community: CommunityCreate, artist: dict = De
         try:
             # Try with role column
             member_payload["role"] = "owner"
-            supabase.table('community_members').insert(member_payload).execute()
+            await supabase.table('community_members').insert(member_payload).execute()
         except Exception as member_error:
             # Fallback without role column
             member_payload.pop("role", None)
             try:
-                supabase.table('community_members').insert(member_payload).execute()
+                await supabase.table('community_members').insert(member_payload).execute()
             except Exception as e:
                 print(f"Failed to add creator as member: {e}")
     
@@ -3929,18 +4896,18 @@ async def create_community_managed(community: CommunityCreate, artist: dict = De
 @app.get("/api/artist/my-communities")
 async def get_my_communities(artist: dict = Depends(require_artist)):
     """Get communities created by or joined by the artist"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get communities created by the artist
-    created = supabase.table('communities').select('*').eq('created_by', artist['id']).order('created_at', desc=True).execute()
+    created = await supabase.table('communities').select('*').eq('created_by', artist['id']).order('created_at', desc=True).execute()
     
     # Get communities the artist is a member of
-    memberships = supabase.table('community_members').select('community_id').eq('user_id', artist['id']).execute()
+    memberships = await supabase.table('community_members').select('community_id').eq('user_id', artist['id']).execute()
     joined_ids = [m['community_id'] for m in (memberships.data or [])]
     
     joined = []
     if joined_ids:
-        joined_result = supabase.table('communities').select('*').in_('id', joined_ids).eq('is_approved', True).execute()
+        joined_result = await supabase.table('communities').select('*').in_('id', joined_ids).eq('is_approved', True).execute()
         # Exclude communities the artist created
         created_ids = [c['id'] for c in (created.data or [])]
         joined = [c for c in (joined_result.data or []) if c['id'] not in created_ids]
@@ -3953,140 +4920,140 @@ async def get_my_communities(artist: dict = Depends(require_artist)):
 @app.get("/api/communities")
 async def get_communities():
     """Get all approved communities"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    communities = supabase.table('communities').select('*, profiles!created_by(full_name, avatar)').eq('is_approved', True).order('member_count', desc=True).execute()
+    communities = await supabase.table('communities').select('*, profiles!created_by(full_name, avatar)').eq('is_approved', True).order('member_count', desc=True).execute()
     
     return {"communities": communities.data or []}
 
 @app.get("/api/community/{community_id}")
-async def get_community_details(community_id: str):
-    """Get community details with recent posts"""
-    supabase = get_supabase_client()
+async def get_community_details(
+    community_id: str,
+    member_preview: int = Query(COMMUNITY_MEMBER_PREVIEW, ge=0, le=COMMUNITY_MEMBERS_MAX_PAGE),
+    viewer_id: Optional[str] = None
+):
+    """Get community details with a member preview and recent posts (viewer_id adds that user's membership row)"""
+    supabase = get_async_supabase_client()
     
-    # Get community with creator info
-    try:
-        community = supabase.table('communities').select('*, profiles!created_by(full_name, avatar)').eq('id', community_id).single().execute()
-    except Exception:
-        # Fallback without join
-        community = supabase.table('communities').select('*').eq('id', community_id).single().execute()
+    community = await supabase.table('communities').select('*').eq('id', community_id).single().execute()
     
     if not community.data:
         raise HTTPException(status_code=404, detail="Community not found")
     
-    # Get members
-    try:
-        members = supabase.table('community_members').select('*, profiles!user_id(full_name, avatar, location)').eq('community_id', community_id).order('joined_at').execute()
-    except Exception:
-        # Fallback without join
-        members = supabase.table('community_members').select('*').eq('community_id', community_id).execute()
+    creator_id = community.data.get('created_by')
+    creators, (members_data, members_next_cursor) = await asyncio.gather(
+        _load_profile_cards(supabase, [creator_id]),
+        _load_community_members(supabase, community_id, member_preview),
+    )
+    community_data = {**community.data, "profiles": creators.get(creator_id)}
     
-    # Get recent posts (table may not exist)
-    posts_data = []
-    try:
-        posts = supabase.table('community_posts').select('*, profiles!author_id(full_name, avatar)').eq('community_id', community_id).order('created_at', desc=True).limit(20).execute()
-        posts_data = posts.data or []
-    except Exception as e:
-        # community_posts table doesn't exist - that's okay
-        print(f"community_posts query failed (table may not exist): {e}")
+    # The preview may not include the viewer, so look their membership up directly
+    viewer_membership = next((m for m in members_data if m.get('user_id') == viewer_id), None) if viewer_id else None
+    if viewer_id and viewer_membership is None:
+        viewer_rows = await supabase.table('community_members').select('*').eq('community_id', community_id).eq('user_id', viewer_id).execute()
+        viewer_membership = (viewer_rows.data or [None])[0]
+    
+    posts_data, posts_next_cursor = await _load_community_posts(supabase, community_id, COMMUNITY_FEED_PAGE_SIZE)
     
     return {
-        "community": community.data,
-        "members": members.data or [],
-        "posts": posts_data
+        "community": community_data,
+        "members": members_data,
+        "members_next_cursor": members_next_cursor,
+        "member_count": community.data.get('member_count') or len(members_data),
+        "viewer_membership": viewer_membership,
+        "posts": posts_data,
+        "posts_next_cursor": posts_next_cursor
     }
 
+
+@app.get("/api/community/{community_id}/members")
+async def get_community_members(
+    community_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=COMMUNITY_MEMBERS_MAX_PAGE)
+):
+    """Community members in join order, cursor-paginated"""
+    supabase = get_async_supabase_client()
+    if not supabase:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    
+    members, next_cursor = await _load_community_members(supabase, community_id, limit, cursor)
+    return {"members": members, "next_cursor": next_cursor}
+
+
+@app.get("/api/community/{community_id}/posts")
+async def get_community_posts(
+    community_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(COMMUNITY_FEED_PAGE_SIZE, ge=1, le=COMMUNITY_FEED_MAX_PAGE)
+):
+    """Community post feed, newest first, cursor-paginated"""
+    supabase = get_async_supabase_client()
+    if not supabase:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    
+    posts, next_cursor = await _load_community_posts(supabase, community_id, limit, cursor)
+    return {"posts": posts, "next_cursor": next_cursor}
+
 @app.post("/api/community/{community_id}/join")
+@response_cache.invalidates('communities')
 async def request_to_join_community(community_id: str, artist: dict = Depends(require_artist)):
     """Request to join a community - direct join for approved communities"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if community exists and is approved
-    community = supabase.table('communities').select('id, name, is_approved').eq('id', community_id).single().execute()
+    community = await supabase.table('communities').select('id, name, is_approved').eq('id', community_id).single().execute()
     if not community.data:
         raise HTTPException(status_code=404, detail="Community not found")
     
     if not community.data.get('is_approved'):
         raise HTTPException(status_code=400, detail="Community is not yet approved")
     
-    # Check if already a member
-    existing = supabase.table('community_members').select('id').eq('community_id', community_id).eq('user_id', artist['id']).execute()
-    
-    if existing.data:
-        raise HTTPException(status_code=400, detail="Already a member of this community")
-    
     # Direct join (no approval needed for approved communities)
-    member_data = {
-        "community_id": community_id,
-        "user_id": artist['id'],
-        "joined_at": datetime.now(timezone.utc).isoformat()
-    }
-    
-    # Try to add role column if it exists
-    try:
-        member_data["role"] = "member"
-        supabase.table('community_members').insert(member_data).execute()
-    except Exception:
-        # Fallback without role
-        member_data.pop("role", None)
-        supabase.table('community_members').insert(member_data).execute()
-    
-    # Update member count
-    try:
-        current = supabase.table('communities').select('member_count').eq('id', community_id).single().execute()
-        new_count = (current.data.get('member_count') or 0) + 1
-        supabase.table('communities').update({'member_count': new_count}).eq('id', community_id).execute()
-    except:
-        pass
+    if not await _add_community_member(supabase, community_id, artist['id']):
+        raise HTTPException(status_code=400, detail="Already a member of this community")
     
     return {"success": True, "message": f"Successfully joined {community.data.get('name')}"}
 
 @app.get("/api/community/{community_id}/join-requests")
 async def get_join_requests(community_id: str, artist: dict = Depends(require_artist)):
     """Get pending join requests for community (admin/creator only)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if user is admin of community
-    member = supabase.table('community_members').select('role').eq('community_id', community_id).eq('user_id', artist['id']).single().execute()
+    member = await supabase.table('community_members').select('role').eq('community_id', community_id).eq('user_id', artist['id']).single().execute()
     
     if not member.data or member.data['role'] != 'admin':
         raise HTTPException(status_code=403, detail="Only community admins can view join requests")
     
-    requests = supabase.table('community_join_requests').select('*, profiles!user_id(full_name, avatar, location, categories)').eq('community_id', community_id).eq('status', 'pending').execute()
+    requests = await supabase.table('community_join_requests').select('*, profiles!user_id(full_name, avatar, location, categories)').eq('community_id', community_id).eq('status', 'pending').execute()
     
     return {"requests": requests.data or []}
 
 @app.post("/api/community/{community_id}/approve-join/{request_id}")
+@response_cache.invalidates('communities')
 async def approve_join_request(community_id: str, request_id: str, approved: bool, artist: dict = Depends(require_artist)):
     """Approve or reject a join request"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if user is admin of community
-    member = supabase.table('community_members').select('role').eq('community_id', community_id).eq('user_id', artist['id']).single().execute()
+    member = await supabase.table('community_members').select('role').eq('community_id', community_id).eq('user_id', artist['id']).single().execute()
     
     if not member.data or member.data['role'] != 'admin':
         raise HTTPException(status_code=403, detail="Only community admins can approve requests")
     
     # Get request
-    join_request = supabase.table('community_join_requests').select('*').eq('id', request_id).single().execute()
+    join_request = await supabase.table('community_join_requests').select('*').eq('id', request_id).single().execute()
     
     if not join_request.data:
         raise HTTPException(status_code=404, detail="Join request not found")
     
     if approved:
-        # Add member
-        supabase.table('community_members').insert({
-            "community_id": community_id,
-            "user_id": join_request.data['user_id'],
-            "role": "member",
-            "joined_at": datetime.now(timezone.utc).isoformat()
-        }).execute()
-        
-        # Update member count
-        supabase.rpc('increment_community_members', {"community_id": community_id}).execute()
+        # Add member and update member count
+        await _add_community_member(supabase, community_id, join_request.data['user_id'])
     
     # Update request status
-    supabase.table('community_join_requests').update({
+    await supabase.table('community_join_requests').update({
         "status": "approved" if approved else "rejected",
         "processed_at": datetime.now(timezone.utc).isoformat(),
         "processed_by": artist['id']
@@ -4097,10 +5064,10 @@ async def approve_join_request(community_id: str, request_id: str, approved: boo
 @app.post("/api/community/{community_id}/invite")
 async def invite_to_community(community_id: str, invite: CommunityInvite, artist: dict = Depends(require_artist)):
     """Invite artists to join community"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check if user is admin of community
-    member = supabase.table('community_members').select('role').eq('community_id', community_id).eq('user_id', artist['id']).single().execute()
+    member = await supabase.table('community_members').select('role').eq('community_id', community_id).eq('user_id', artist['id']).single().execute()
     
     if not member.data or member.data['role'] != 'admin':
         raise HTTPException(status_code=403, detail="Only community admins can send invites")
@@ -4108,11 +5075,11 @@ async def invite_to_community(community_id: str, invite: CommunityInvite, artist
     invited = 0
     for artist_id in invite.artist_ids:
         # Check if already member
-        existing = supabase.table('community_members').select('id').eq('community_id', community_id).eq('user_id', artist_id).execute()
+        existing = await supabase.table('community_members').select('id').eq('community_id', community_id).eq('user_id', artist_id).execute()
         
         if not existing.data:
             # Create invite
-            supabase.table('community_invites').insert({
+            await supabase.table('community_invites').insert({
                 "community_id": community_id,
                 "user_id": artist_id,
                 "invited_by": artist['id'],
@@ -4127,10 +5094,10 @@ async def invite_to_community(community_id: str, invite: CommunityInvite, artist
 @app.post("/api/community/{community_id}/post")
 async def create_community_post(community_id: str, post: CommunityPostCreate, artist: dict = Depends(require_artist)):
     """Create a post in a community"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check membership
-    member = supabase.table('community_members').select('id').eq('community_id', community_id).eq('user_id', artist['id']).execute()
+    member = await supabase.table('community_members').select('id').eq('community_id', community_id).eq('user_id', artist['id']).execute()
     
     if not member.data:
         raise HTTPException(status_code=403, detail="Must be a community member to post")
@@ -4146,26 +5113,28 @@ async def create_community_post(community_id: str, post: CommunityPostCreate, ar
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     
-    result = supabase.table('community_posts').insert(post_data).execute()
+    result = await supabase.table('community_posts').insert(post_data).execute()
+    if result.data:
+        _push_community_post(community_id, result.data[0])
     
     return {"success": True, "post": result.data[0] if result.data else None}
 
 @app.get("/api/community/my-communities")
 async def get_my_communities(artist: dict = Depends(require_artist)):
     """Get communities the artist is a member of"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    memberships = supabase.table('community_members').select('community_id, role, communities!community_id(*)').eq('user_id', artist['id']).execute()
+    memberships = await supabase.table('community_members').select('community_id, role, communities!community_id(*)').eq('user_id', artist['id']).execute()
     
     return {"communities": memberships.data or []}
 
 @app.get("/api/community/invites")
 async def get_my_invites(artist: dict = Depends(require_artist)):
     """Get pending community invites"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     try:
-        invites = supabase.table('community_invites').select('*, communities!community_id(name, image, description)').eq('invitee_id', artist['id']).eq('status', 'pending').execute()
+        invites = await supabase.table('community_invites').select('*, communities!community_id(name, image, description)').eq('invitee_id', artist['id']).eq('status', 'pending').execute()
         return {"invites": invites.data or []}
     except Exception as e:
         # Table might not exist
@@ -4173,29 +5142,22 @@ async def get_my_invites(artist: dict = Depends(require_artist)):
         return {"invites": []}
 
 @app.post("/api/community/respond-invite/{invite_id}")
+@response_cache.invalidates('communities')
 async def respond_to_invite(invite_id: str, accept: bool, artist: dict = Depends(require_artist)):
     """Accept or decline a community invite"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    invite = supabase.table('community_invites').select('*').eq('id', invite_id).eq('user_id', artist['id']).single().execute()
+    invite = await supabase.table('community_invites').select('*').eq('id', invite_id).eq('user_id', artist['id']).single().execute()
     
     if not invite.data:
         raise HTTPException(status_code=404, detail="Invite not found")
     
     if accept:
-        # Add as member
-        supabase.table('community_members').insert({
-            "community_id": invite.data['community_id'],
-            "user_id": artist['id'],
-            "role": "member",
-            "joined_at": datetime.now(timezone.utc).isoformat()
-        }).execute()
-        
-        # Update member count
-        supabase.rpc('increment_community_members', {"community_id": invite.data['community_id']}).execute()
+        # Add as member and update member count
+        await _add_community_member(supabase, invite.data['community_id'], artist['id'])
     
     # Update invite status
-    supabase.table('community_invites').update({
+    await supabase.table('community_invites').update({
         "status": "accepted" if accept else "declined",
         "responded_at": datetime.now(timezone.utc).isoformat()
     }).eq('id', invite_id).execute()
@@ -4206,18 +5168,18 @@ async def respond_to_invite(invite_id: str, accept: bool, artist: dict = Depends
 @app.get("/api/admin/pending-video-screenings")
 async def get_pending_video_screenings(admin: dict = Depends(require_lead_chitrakar)):
     """Get pending video screening requests"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    screenings = supabase.table('video_screenings').select('*, artworks!painting_id(title), profiles!user_id(full_name, email)').eq('status', 'pending').execute()
+    screenings = await supabase.table('video_screenings').select('*, artworks!painting_id(title), profiles!user_id(full_name, email)').eq('status', 'pending').execute()
     
     return {"screenings": screenings.data or []}
 
 @app.post("/api/admin/accommodate-video-screening")
 async def accommodate_video_screening(screening_id: str, scheduled_date: str, admin: dict = Depends(require_lead_chitrakar)):
     """Accommodate a video screening request"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    supabase.table('video_screenings').update({
+    await supabase.table('video_screenings').update({
         "status": "scheduled",
         "scheduled_date": scheduled_date,
         "processed_at": datetime.now(timezone.utc).isoformat()
@@ -4229,18 +5191,81 @@ async def accommodate_video_screening(screening_id: str, scheduled_date: str, ad
 @app.get("/api/admin/chat-messages")
 async def get_admin_chat_messages(admin: dict = Depends(require_lead_chitrakar)):
     """Get chat messages needing admin response"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    messages = supabase.table('chat_messages').select('*, profiles!user_id(full_name, email)').eq('needs_admin_review', True).order('created_at', desc=True).execute()
+    messages = await supabase.table('chat_messages').select('*, profiles!user_id(full_name, email)').eq('needs_admin_review', True).order('created_at', desc=True).execute()
     
     return {"messages": messages.data or []}
 
+@app.post("/api/admin/chat-messages/{message_id}/promote")
+async def promote_chat_answer(message_id: str, promotion: ChatAnswerPromotion, admin: dict = Depends(require_lead_chitrakar)):
+    """Add a chat exchange to the chatbot FAQ so similar questions are answered from it"""
+    supabase = get_async_supabase_client()
+    
+    message = await supabase.table('chat_messages').select('*').eq('id', message_id).single().execute()
+    if not message.data:
+        raise HTTPException(status_code=404, detail="Chat message not found")
+    
+    question = promotion.question or message.data.get('user_message')
+    answer = promotion.answer or message.data.get('admin_response') or message.data.get('bot_response')
+    if not question or not answer:
+        raise HTTPException(status_code=400, detail="Nothing to promote: question or answer is empty")
+    
+    result = await supabase.table('chat_faq').insert({
+        "question": question,
+        "answer": answer,
+        "source": "promoted",
+        "source_message_id": message_id,
+        "created_by": admin['id'],
+        "is_active": True
+    }).execute()
+    faq = result.data[0]
+    _answer_cache.upsert_faq(faq)
+    
+    return {"success": True, "faq": faq}
+
+@app.get("/api/admin/chat-faq")
+async def get_chat_faq(admin: dict = Depends(require_lead_chitrakar)):
+    """Curated and promoted chatbot FAQ entries"""
+    supabase = get_async_supabase_client()
+    
+    faq = await supabase.table('chat_faq').select('*').eq('is_active', True).order('created_at', desc=True).execute()
+    
+    return {"faq": faq.data or [], "metrics": _answer_cache.metrics()}
+
+@app.post("/api/admin/chat-faq")
+async def create_chat_faq(entry: ChatFaqCreate, admin: dict = Depends(require_lead_chitrakar)):
+    """Add a curated chatbot FAQ entry"""
+    supabase = get_async_supabase_client()
+    
+    result = await supabase.table('chat_faq').insert({
+        "question": entry.question,
+        "answer": entry.answer,
+        "source": "curated",
+        "created_by": admin['id'],
+        "is_active": True
+    }).execute()
+    faq = result.data[0]
+    _answer_cache.upsert_faq(faq)
+    
+    return {"success": True, "faq": faq}
+
+@app.delete("/api/admin/chat-faq/{faq_id}")
+async def delete_chat_faq(faq_id: str, admin: dict = Depends(require_lead_chitrakar)):
+    """Retire a chatbot FAQ entry"""
+    supabase = get_async_supabase_client()
+    
+    await supabase.table('chat_faq').update({"is_active": False}).eq('id', faq_id).execute()
+    _answer_cache.remove(f"faq:{faq_id}")
+    
+    return {"success": True}
+
 @app.post("/api/admin/respond-to-chat")
 async def respond_to_chat(message_id: str, response: str, admin: dict = Depends(require_lead_chitrakar)):
     """Admin responds to a chat message"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    supabase.table('chat_messages').update({
+    await supabase.table('chat_messages').update({
         "admin_response": response,
         "needs_admin_review": False,
         "responded_at": datetime.now(timezone.utc).isoformat()
@@ -4251,14 +5276,16 @@ async def respond_to_chat(message_id: str, response: str, admin: dict = Depends(
 # ============ LEAD CHITRAKAR ROUTES ============
 
 @app.post("/api/admin/lead-chitrakar/approve-artwork")
+@response_cache.invalidates('artworks')
+@_reindexes_search('artwork', 'request.artwork_id')
 async def lead_chitrakar_approve_artwork(request: ArtworkApprovalRequest, user: dict = Depends(require_lead_chitrakar)):
     """Lead Chitrakar can approve artworks"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     if request.approved:
-        result = supabase.table('artworks').update({"is_approved": True}).eq('id', request.artwork_id).execute()
+        result = await supabase.table('artworks').update({"is_approved": True}).eq('id', request.artwork_id).execute()
     else:
-        result = supabase.table('artworks').delete().eq('id', request.artwork_id).execute()
+        result = await supabase.table('artworks').delete().eq('id', request.artwork_id).execute()
     
     return {"success": True, "message": f"Artwork {'approved' if request.approved else 'rejected'}"}
 
@@ -4267,14 +5294,14 @@ async def lead_chitrakar_approve_artwork(request: ArtworkApprovalRequest, user:
 @app.get("/api/admin/kalakar/exhibitions-analytics")
 async def kalakar_exhibitions_analytics(user: dict = Depends(require_kalakar)):
     """Kalakar can view exhibition analytics"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    total = supabase.table('exhibitions').select('id', count='exact').execute()
-    active = supabase.table('exhibitions').select('id', count='exact').eq('status', 'active').execute()
-    archived = supabase.table('exhibitions').select('id', count='exact').eq('status', 'archived').execute()
+    total = await supabase.table('exhibitions').select('id', count='exact').execute()
+    active = await supabase.table('exhibitions').select('id', count='exact').eq('status', 'active').execute()
+    archived = await supabase.table('exhibitions').select('id', count='exact').eq('status', 'archived').execute()
     
     # Get revenue
-    exhibitions = supabase.table('exhibitions').select('fees, voluntary_platform_fee').execute()
+    exhibitions = await supabase.table('exhibitions').select('fees, voluntary_platform_fee').execute()
     total_revenue = sum(e.get('fees', 0) for e in (exhibitions.data or []))
     voluntary_fees = sum(e.get('voluntary_platform_fee', 0) for e in (exhibitions.data or []))
     
@@ -4289,9 +5316,9 @@ async def kalakar_exhibitions_analytics(user: dict = Depends(require_kalakar)):
 @app.get("/api/admin/kalakar/payment-records")
 async def kalakar_payment_records(user: dict = Depends(require_kalakar)):
     """Kalakar can view payment records"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    exhibitions = supabase.table('exhibitions').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
+    exhibitions = await supabase.table('exhibitions').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
     
     return {"payment_records": exhibitions.data or []}
 
@@ -4300,19 +5327,20 @@ async def kalakar_payment_records(user: dict = Depends(require_kalakar)):
 @app.get("/api/artist/profile")
 async def get_artist_profile(artist: dict = Depends(require_artist)):
     """Get artist profile"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    profile = supabase.table('profiles').select('*').eq('id', artist['id']).single().execute()
+    profile = await supabase.table('profiles').select('*').eq('id', artist['id']).single().execute()
     
     return {"profile": profile.data}
 
 @app.put("/api/auth/profile")
+@response_cache.invalidates('profiles')
 async def update_profile(
     updates: ProfileUpdateRequest,
     user: dict = Depends(require_user)
 ):
     try:
-        supabase = get_supabase_client()
+        supabase = get_async_supabase_client()
         
         if not supabase:
             raise HTTPException(status_code=503, detail="Database not configured")
@@ -4325,14 +5353,18 @@ async def update_profile(
         # Log the update for debugging
         print(f"Updating profile for user {user['id']} with data: {update_data}")
 
-        result = supabase.table('profiles') \
+        result = await supabase.table('profiles') \
             .update(update_data) \
             .eq('id', user['id']) \
             .execute()
         
         print(f"Update result: {result}")
+        invalidate_user_auth_cache(user['id'])
+        _profile_card_cache.pop(user['id'], None)
+        if user.get('role') == 'artist':
+            _schedule_search_reindex('artist', user['id'])
 
-        updated_user = supabase.table('profiles') \
+        updated_user = await supabase.table('profiles') \
             .select('*') \
             .eq('id', user['id']) \
             .single() \
@@ -4349,8 +5381,8 @@ async def update_profile(
 async def get_artist_artworks(artist: dict = Depends(require_artist)):
     """Get artist's artworks"""
     try:
-        supabase = get_supabase_client()
-        artworks = supabase.table('artworks').select('*').eq('artist_id', artist['id']).order('created_at', desc=True).execute()
+        supabase = get_async_supabase_client()
+        artworks = await supabase.table('artworks').select('*').eq('artist_id', artist['id']).order('created_at', desc=True).execute()
         return {"artworks": artworks.data or []}
     except Exception as e:
         print(f"Error fetching artworks: {e}")
@@ -4358,12 +5390,13 @@ async def get_artist_artworks(artist: dict = Depends(require_artist)):
 
 @app.post("/api/artist/portfolio")
 @app.post("/api/artist/artworks")
+@response_cache.invalidates('artworks')
 async def create_artwork(
     artwork: ArtworkCreate,
     artist: dict = Depends(require_artist),
 ):
     try:
-        supabase = get_supabase_client()
+        supabase = get_async_supabase_client()
 
         if not artist or "id" not in artist:
             raise HTTPException(status_code=401, detail="Invalid artist")
@@ -4454,12 +5487,12 @@ async def create_artwork(
         }
 
         try:
-            result = supabase.table("artworks").insert(artwork_data).execute()
+            result = await supabase.table("artworks").insert(artwork_data).execute()
         except Exception as e:
             # Backward compatibility if column is not yet migrated
             if "image_display_settings" in str(e):
                 fallback_data = {k: v for k, v in artwork_data.items() if k != "image_display_settings"}
-                result = supabase.table("artworks").insert(fallback_data).execute()
+                result = await supabase.table("artworks").insert(fallback_data).execute()
             else:
                 raise
 
@@ -4475,167 +5508,378 @@ async def create_artwork(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/artist/push-to-marketplace")
+@response_cache.invalidates('artworks')
 async def push_to_marketplace(data: PushToMarketplaceRequest, artist: dict = Depends(require_artist)):
     """Push approved artworks to marketplace (requires membership)"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Check membership status
-    profile = supabase.table('profiles').select('is_member, membership_expiry').eq('id', artist['id']).single().execute()
-    
-    if not profile.data:
-        raise HTTPException(status_code=404, detail="Profile not found")
-    
-    is_active_member = False
-    if profile.data.get('is_member') and profile.data.get('membership_expiry'):
-        expiry = datetime.fromisoformat(profile.data['membership_expiry'].replace('Z', '+00:00'))
-        is_active_member = expiry > datetime.now(timezone.utc)
-    
-    if not is_active_member:
+    if not await _is_active_member(supabase, artist['id']):
         raise HTTPException(status_code=403, detail="Active membership required to push to marketplace")
     
     # Update artworks
     for artwork_id in data.artwork_ids:
         # Verify ownership and approval
-        artwork = supabase.table('artworks').select('id').eq('id', artwork_id).eq('artist_id', artist['id']).eq('is_approved', True).single().execute()
+        artwork = await supabase.table('artworks').select('id').eq('id', artwork_id).eq('artist_id', artist['id']).eq('is_approved', True).single().execute()
         if artwork.data:
-            supabase.table('artworks').update({"in_marketplace": True}).eq('id', artwork_id).execute()
+            await supabase.table('artworks').update({"in_marketplace": True}).eq('id', artwork_id).execute()
     
     return {"success": True, "message": f"Pushed {len(data.artwork_ids)} artworks to marketplace"}
 
 
 # AI Pricing Engine
+PRICING_LLM_MODEL = os.environ.get('PRICING_LLM_MODEL', 'gpt-4o')
+PRICING_CALIBRATION_SECONDS = int(os.environ.get('PRICING_CALIBRATION_SECONDS', '21600'))
+PRICING_BUYER_MESSAGE_CACHE_SIZE = int(os.environ.get('PRICING_BUYER_MESSAGE_CACHE_SIZE', '4096'))
+# A pricing_buyer_messages row still without a message after this long was abandoned (e.g. its worker exited)
+PRICING_BUYER_MESSAGE_PENDING_SECONDS = int(os.environ.get('PRICING_BUYER_MESSAGE_PENDING_SECONDS', '30'))
+PRICING_ARTWORK_COLUMNS = (
+    'id, artist_id, price, medium, style, dimensions, artwork_type, artwork_width, artwork_height, '
+    'realism_level, detailing_level, uniqueness, hours_spent, material_cost'
+)
+
+BUYER_MESSAGE_SYSTEM_PROMPT = """You are the Chitrakalakar Art Pricing Advisor for an Indian art marketplace.
+Write one or two friendly sentences for buyers explaining how this painting's price compares to fair market value.
+Use the figures given; do not invent new ones. Output plain text only."""
+
+# Rate tables until the first calibration against approved marketplace prices replaces them
+_pricing_state = {"model": PricingModel(), "calibrated_at": None}
+# pricing input + model version hash -> model-written buyer message (this worker's copy of pricing_buyer_messages)
+_buyer_messages: "OrderedDict[str, str]" = OrderedDict()
+_buyer_message_tasks: Dict[str, asyncio.Task] = {}
+
+
+async def _calibrate_pricing_model(supabase):
+    rows = await _fetch_all_rows(supabase, 'artworks', PRICING_ARTWORK_COLUMNS, (('is_approved', True), ('in_marketplace', True)))
+    samples = [inputs for inputs in map(pricing_inputs_from_artwork, rows) if inputs]
+    _pricing_state["model"] = PricingModel.calibrate(samples)
+    _pricing_state["calibrated_at"] = datetime.now(timezone.utc).isoformat()
+    print(f"[pricing] model fitted on {_pricing_state['model'].samples} of {len(rows)} marketplace artworks")
+
+
+def _remember_buyer_message(key: str, message: str):
+    _buyer_messages[key] = message
+    _buyer_messages.move_to_end(key)
+    while len(_buyer_messages) > PRICING_BUYER_MESSAGE_CACHE_SIZE:
+        _buyer_messages.popitem(last=False)
+
+
+async def _load_buyer_message(supabase, key: str) -> Optional[dict]:
+    """The shared pricing_buyer_messages row for `key` (message is None while it is being written)."""
+    try:
+        result = await supabase.table('pricing_buyer_messages').select('message, created_at').eq('key', key).execute()
+    except Exception as e:
+        print(f"pricing_buyer_messages read error: {e}")
+        return None
+    row = (result.data or [None])[0]
+    if row and row.get('message'):
+        _remember_buyer_message(key, row['message'])
+    return row
+
+
+async def _write_buyer_message(key: str, inputs: dict, result: dict) -> Optional[str]:
+    """Have the model write (and share) the buyer message; None if it is unavailable."""
+    cached = _buyer_messages.get(key)
+    if cached is not None:
+        return cached
+    supabase = get_async_supabase_client()
+    row = await _load_buyer_message(supabase, key)
+    if row and row.get('message'):
+        return row['message']
+    
+    prompt = f"""ARTWORK: {inputs['width']}" x {inputs['height']}" {inputs['medium']}, {inputs['realism_level']}, {inputs['detailing_level']} detailing, {inputs['uniqueness']}, {inputs['artist_experience']} artist
+Artist's price: ₹{inputs['artist_price']}
+Fair range: ₹{result['suggested_price_range']['min']} - ₹{result['suggested_price_range']['max']}
+Evaluation: {result['pricing_evaluation']}"""
+    try:
+        message = (await get_llm_gateway().complete('pricing', BUYER_MESSAGE_SYSTEM_PROMPT, prompt, PRICING_LLM_MODEL)).strip()
+    except Exception as e:
+        print(f"Buyer message error: {e}")
+        return None
+    if message:
+        _remember_buyer_message(key, message)
+        try:
+            await supabase.table('pricing_buyer_messages').upsert({
+                "key": key,
+                "message": message,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }).execute()
+        except Exception as e:
+            print(f"pricing_buyer_messages write error: {e}")
+    return message or None
+
+
+def _schedule_buyer_message(key: str, inputs: dict, result: dict):
+    """Write the buyer message in the background; the template stands in until then."""
+    if key in _buyer_messages or key in _buyer_message_tasks or not get_llm_gateway().provider.configured:
+        return
+    
+    async def write():
+        try:
+            # Tell polls that reach other workers the message is on its way
+            try:
+                await get_async_supabase_client().table('pricing_buyer_messages').upsert(
+                    {"key": key}, ignore_duplicates=True
+                ).execute()
+            except Exception as e:
+                print(f"pricing_buyer_messages write error: {e}")
+            await _write_buyer_message(key, inputs, result)
+        finally:
+            _buyer_message_tasks.pop(key, None)
+    
+    _buyer_message_tasks[key] = asyncio.create_task(write())
+
+
 @app.post("/api/artwork/pricing-analysis")
 async def analyze_artwork_pricing(request: ArtworkPricingRequest):
     """
-    AI-powered artwork pricing analysis.
-    Analyzes artwork attributes and provides fair market price estimate.
+    Artwork pricing analysis.
+    The range, evaluation and badge come from the local pricing model; the
+    model-written buyer message follows asynchronously (poll `buyer_message_key`).
     """
-    import os
-    from emergentintegrations.llm.chat import LlmChat, UserMessage
-    
-    api_key = os.environ.get("EMERGENT_LLM_KEY")
-    if not api_key:
-        raise HTTPException(status_code=503, detail="AI pricing service not configured")
-    
-    # System prompt for the Chitrakalakar pricing advisor
-    system_prompt = """You are the Chitrakalakar Art Pricing Advisor for an Indian art marketplace.
-
-Your role is to estimate a fair price range for a painting based on its attributes and help maintain transparency between artists and buyers.
-
-Pricing considerations:
-1. Larger artworks typically justify higher prices. Base rate: ₹50-150 per square inch depending on medium and skill.
-2. Oil paintings command highest prices, followed by acrylic, then watercolor, then charcoal.
-3. Hyperrealism or extremely detailed works should increase the price range by 50-100%.
-4. Completely original works with no copies should increase value by 20-30%.
-5. Professional artists can command 2-3x higher prices than beginners.
-6. Material costs and time investment should be factored in.
-7. Indian art market prices are typically lower than Western markets.
-
-Output ONLY valid JSON with this exact structure:
-{
-  "suggested_price_range": {
-    "min": number,
-    "max": number
-  },
-  "pricing_evaluation": "fair" | "slightly_high" | "overpriced" | "underpriced",
-  "buyer_message": "short explanation for buyers",
-  "artist_suggestion": "if price is high, ask artist to justify the premium, otherwise null"
-}"""
-    
-    # Build the analysis prompt
-    analysis_prompt = f"""Analyze this artwork and provide pricing:
-
-ARTWORK DETAILS:
-- Size: {request.width}" x {request.height}" ({request.width * request.height} sq inches)
-- Medium: {request.medium}
-- Realism Level: {request.realism_level}
-- Detailing Level: {request.detailing_level}
-- Uniqueness: {request.uniqueness}
-- Artist Experience: {request.artist_experience}
-- Hours Spent: {request.hours_spent or 'Not specified'}
-- Material Cost: ₹{request.material_cost or 'Not specified'}
-- Artist's Quoted Price: ₹{request.artist_price}
-
-Provide your analysis as JSON only."""
+    inputs = request.model_dump()
+    model = _pricing_state["model"]
+    result = model.analyze(inputs)
+    # The message quotes the range, so a recalibrated model needs a new one
+    key = pricing_input_hash(inputs, model.version)
+    
+    message = _buyer_messages.get(key)
+    if message is None:
+        _schedule_buyer_message(key, inputs, result)
+    
+    return {
+        **result,
+        "buyer_message": message or template_buyer_message(result["pricing_evaluation"], inputs["medium"]),
+        "buyer_message_key": key,
+        "buyer_message_pending": key in _buyer_message_tasks,
+        "artist_suggestion": artist_suggestion_for(result["pricing_badge"])
+    }
+
 
+@app.get("/api/artwork/pricing-analysis/buyer-message/{key}")
+async def get_pricing_buyer_message(key: str):
+    """The model-written buyer message for a pricing analysis, once it is ready (from any worker)"""
+    message = _buyer_messages.get(key)
+    if message is not None or key in _buyer_message_tasks:
+        return {"buyer_message": message, "pending": message is None}
+    
+    row = await _load_buyer_message(get_async_supabase_client(), key)
+    if not row:
+        return {"buyer_message": None, "pending": False}
+    if row.get('message'):
+        return {"buyer_message": row['message'], "pending": False}
     try:
-        chat = LlmChat(
-            api_key=api_key,
-            session_id=f"pricing-{uuid.uuid4()}",
-            system_message=system_prompt
-        ).with_model("openai", "gpt-4o")
-        
-        user_message = UserMessage(text=analysis_prompt)
-        response = await chat.send_message(user_message)
-        
-        # Parse the JSON response
-        # Clean up response if needed
-        response_text = response.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
+        started_at = datetime.fromisoformat(str(row.get('created_at')).replace('Z', '+00:00'))
+        pending = (datetime.now(timezone.utc) - started_at).total_seconds() < PRICING_BUYER_MESSAGE_PENDING_SECONDS
+    except ValueError:
+        pending = False
+    return {"buyer_message": None, "pending": pending}
+
+
+@app.get("/api/admin/pricing-model")
+async def get_pricing_model(admin: dict = Depends(require_admin)):
+    """Current pricing model weights and calibration"""
+    return {**_pricing_state["model"].describe(), "calibrated_at": _pricing_state["calibrated_at"]}
+
+
+PRICING_BATCH_MAX_ARTWORKS = int(os.environ.get('PRICING_BATCH_MAX_ARTWORKS', '2000'))
+# Buyer messages being written at once by one job (the LLM gateway also caps the pricing feature)
+PRICING_BATCH_CONCURRENCY = int(os.environ.get('PRICING_BATCH_CONCURRENCY', '4'))
+PRICING_BATCH_WRITE_CHUNK = 500
+PRICING_BATCH_PROGRESS_EVERY = 25
+PRICING_BATCH_COLUMNS = PRICING_ARTWORK_COLUMNS + ', pricing_badge, pricing_input_hash'
+# Before pricing_batch_migration.sql there is no stored hash, so every artwork is re-priced
+PRICING_BATCH_LEGACY_COLUMNS = PRICING_ARTWORK_COLUMNS + ', pricing_badge'
+PRICING_JOB_FIELDS = (
+    'id', 'requested_by', 'artist_id', 'status', 'total', 'processed', 'repriced', 'unchanged',
+    'missing_inputs', 'error', 'created_at', 'updated_at', 'finished_at'
+)
+
+# Jobs started by this worker, newest last; others are read from pricing_jobs
+_pricing_jobs: "OrderedDict[str, dict]" = OrderedDict()
+_pricing_job_tasks: set = set()
+
+
+async def _save_pricing_job(supabase, job: dict):
+    job["updated_at"] = datetime.now(timezone.utc).isoformat()
+    try:
+        await supabase.table('pricing_jobs').upsert({field: job.get(field) for field in PRICING_JOB_FIELDS}).execute()
+    except Exception as e:
+        print(f"pricing_jobs write error: {e}")
+
+
+async def _fetch_pricing_batch_rows(supabase, artwork_ids: Optional[List[str]], artist_id: Optional[str]) -> List[dict]:
+    for columns in (PRICING_BATCH_COLUMNS, PRICING_BATCH_LEGACY_COLUMNS):
+        try:
+            if artwork_ids:
+                return await _fetch_rows_in(supabase, 'artworks', columns, 'id', artwork_ids)
+            return await _fetch_all_rows(supabase, 'artworks', columns, (('artist_id', artist_id),))
+        except Exception as e:
+            if columns == PRICING_BATCH_LEGACY_COLUMNS:
+                raise
+            print(f"pricing_input_hash unavailable, re-pricing every artwork: {e}")
+
+
+async def _apply_artwork_pricing(supabase, updates: List[dict]):
+    """Write pricing columns for many artworks: one RPC per chunk, per-row updates if it is missing."""
+    for i in range(0, len(updates), PRICING_BATCH_WRITE_CHUNK):
+        chunk = updates[i:i + PRICING_BATCH_WRITE_CHUNK]
+        try:
+            await supabase.rpc('apply_artwork_pricing', {"p_rows": chunk}).execute()
+            continue
+        except Exception as e:
+            print(f"apply_artwork_pricing unavailable, updating rows one by one: {e}")
         
-        pricing_data = json.loads(response_text.strip())
+        semaphore = asyncio.Semaphore(PRICING_BATCH_CONCURRENCY)
         
-        # Determine badge color
-        evaluation = pricing_data.get("pricing_evaluation", "fair")
-        if evaluation == "fair" or evaluation == "underpriced":
-            badge = "green"
-        elif evaluation == "slightly_high":
-            badge = "yellow"
-        else:  # overpriced
-            badge = "red"
+        async def update(row):
+            async with semaphore:
+                fields = {key: value for key, value in row.items() if key != 'id'}
+                try:
+                    await supabase.table('artworks').update(fields).eq('id', row['id']).execute()
+                except Exception:
+                    # Before pricing_batch_migration.sql: no hash/timestamp columns
+                    fields.pop('pricing_input_hash', None)
+                    fields.pop('pricing_updated_at', None)
+                    await supabase.table('artworks').update(fields).eq('id', row['id']).execute()
         
-        return {
-            "suggested_price_range": pricing_data.get("suggested_price_range", {"min": 0, "max": 0}),
-            "pricing_evaluation": evaluation,
-            "pricing_badge": badge,
-            "buyer_message": pricing_data.get("buyer_message", ""),
-            "artist_suggestion": pricing_data.get("artist_suggestion")
-        }
+        await asyncio.gather(*(update(row) for row in chunk))
+
+
+async def _run_pricing_batch(job: dict, rows: List[dict], artist_experience: Optional[str], force: bool):
+    """
+    Price `rows`, write buyer messages with bounded concurrency and store in bulk.
+    Rows whose inputs and pricing model version both match the stored hash are skipped.
+    """
+    supabase = get_async_supabase_client()
+    model = _pricing_state["model"]
+    job["status"] = "running"
+    await _save_pricing_job(supabase, job)
+    try:
+        pending = []
+        for row in rows:
+            inputs = pricing_inputs_from_artwork(row, artist_experience)
+            if inputs is None:
+                job["missing_inputs"] += 1
+                continue
+            key = pricing_input_hash(inputs, model.version)
+            if not force and row.get('pricing_badge') and row.get('pricing_input_hash') == key:
+                job["unchanged"] += 1
+                continue
+            pending.append((row['id'], inputs, key))
+        job["processed"] = job["missing_inputs"] + job["unchanged"]
         
-    except json.JSONDecodeError as e:
-        print(f"AI Pricing JSON error: {e}, Response: {response}")
-        # Fallback calculation based on size and medium
-        base_rate = {"oil": 120, "acrylic": 80, "watercolor": 60, "charcoal": 40, "mixed media": 70}.get(request.medium.lower(), 60)
-        sq_inches = request.width * request.height
-        min_price = int(sq_inches * base_rate * 0.8)
-        max_price = int(sq_inches * base_rate * 1.5)
+        # One matrix-vector product prices the whole batch
+        estimates = model.estimate_many([inputs for _, inputs, _ in pending])
+        semaphore = asyncio.Semaphore(PRICING_BATCH_CONCURRENCY)
+        write_messages = get_llm_gateway().provider.configured
+        priced_at = datetime.now(timezone.utc).isoformat()
         
-        if request.artist_price < min_price:
-            evaluation = "underpriced"
-            badge = "green"
-        elif request.artist_price <= max_price:
-            evaluation = "fair"
-            badge = "green"
-        elif request.artist_price <= max_price * 1.3:
-            evaluation = "slightly_high"
-            badge = "yellow"
-        else:
-            evaluation = "overpriced"
-            badge = "red"
+        async def price(item, estimate):
+            artwork_id, inputs, key = item
+            _, min_price, max_price = estimate
+            evaluation, badge = evaluate_price(inputs["artist_price"], min_price, max_price)
+            result = {"suggested_price_range": {"min": int(min_price), "max": int(max_price)}, "pricing_evaluation": evaluation}
+            message = None
+            if write_messages:
+                async with semaphore:
+                    message = await _write_buyer_message(key, inputs, result)
+            job["processed"] += 1
+            if job["processed"] % PRICING_BATCH_PROGRESS_EVERY == 0:
+                await _save_pricing_job(supabase, job)
+            return {
+                "id": artwork_id,
+                "pricing_badge": badge,
+                "pricing_evaluation": evaluation,
+                "pricing_buyer_message": message or template_buyer_message(evaluation, inputs["medium"]),
+                "pricing_suggested_range": result["suggested_price_range"],
+                "pricing_input_hash": key,
+                "pricing_updated_at": priced_at
+            }
         
-        return {
-            "suggested_price_range": {"min": min_price, "max": max_price},
-            "pricing_evaluation": evaluation,
-            "pricing_badge": badge,
-            "buyer_message": f"Based on size and medium, this artwork is {evaluation}.",
-            "artist_suggestion": "Consider providing details about materials, time invested, or unique aspects." if badge != "green" else None
-        }
+        updates = await asyncio.gather(*(price(item, estimate) for item, estimate in zip(pending, estimates)))
+        await _apply_artwork_pricing(supabase, updates)
+        job["repriced"] = len(updates)
+        job["status"] = "completed"
+        if updates:
+            await response_cache.invalidate('artworks')
     except Exception as e:
-        print(f"AI Pricing error: {e}")
-        raise HTTPException(status_code=500, detail="Pricing analysis failed")
+        print(f"Pricing batch {job['id']} failed: {e}")
+        job["status"] = "failed"
+        job["error"] = str(e)
+    finally:
+        job["finished_at"] = datetime.now(timezone.utc).isoformat()
+        await _save_pricing_job(supabase, job)
+
+
+@app.post("/api/artwork/pricing-batch")
+async def submit_pricing_batch(batch: PricingBatchRequest, artist: dict = Depends(require_artist)):
+    """Price a list of artworks or an artist's whole portfolio in the background; poll the returned job"""
+    supabase = get_async_supabase_client()
+    
+    is_admin = artist.get('role') == 'admin'
+    artist_id = batch.artist_id or (None if batch.artwork_ids else artist['id'])
+    if not is_admin and artist_id not in (None, artist['id']):
+        raise HTTPException(status_code=403, detail="Artists can only price their own artworks")
+    
+    if batch.artwork_ids and len(batch.artwork_ids) > PRICING_BATCH_MAX_ARTWORKS:
+        raise HTTPException(status_code=400, detail=f"At most {PRICING_BATCH_MAX_ARTWORKS} artworks per batch")
+    rows = await _fetch_pricing_batch_rows(supabase, batch.artwork_ids, artist_id)
+    if batch.artwork_ids:
+        owner = artist_id if (artist_id or is_admin) else artist['id']
+        if owner:
+            rows = [row for row in rows if row.get('artist_id') == owner]
+    elif len(rows) > PRICING_BATCH_MAX_ARTWORKS:
+        raise HTTPException(status_code=400, detail=f"At most {PRICING_BATCH_MAX_ARTWORKS} artworks per batch")
+    
+    now = datetime.now(timezone.utc).isoformat()
+    job = {
+        "id": str(uuid.uuid4()),
+        "requested_by": artist['id'],
+        "artist_id": artist_id,
+        "status": "queued",
+        "total": len(rows),
+        "processed": 0,
+        "repriced": 0,
+        "unchanged": 0,
+        "missing_inputs": 0,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+        "finished_at": None
+    }
+    _pricing_jobs[job["id"]] = job
+    while len(_pricing_jobs) > 256:
+        _pricing_jobs.popitem(last=False)
+    await _save_pricing_job(supabase, job)
+    
+    task = asyncio.create_task(_run_pricing_batch(job, rows, batch.artist_experience, batch.force))
+    _pricing_job_tasks.add(task)
+    task.add_done_callback(_pricing_job_tasks.discard)
+    
+    return {"success": True, "job": job}
+
+
+@app.get("/api/artwork/pricing-batch/{job_id}")
+async def get_pricing_batch(job_id: str, artist: dict = Depends(require_artist)):
+    """Progress of a batch pricing job"""
+    job = _pricing_jobs.get(job_id)
+    if job is None:
+        supabase = get_async_supabase_client()
+        result = await supabase.table('pricing_jobs').select('*').eq('id', job_id).execute()
+        job = (result.data or [None])[0]
+    if not job or (artist.get('role') != 'admin' and job.get('requested_by') != artist['id']):
+        raise HTTPException(status_code=404, detail="Pricing job not found")
+    
+    return {"job": job}
 
 
 @app.get("/api/artwork/{artwork_id}/pricing-badge")
 async def get_artwork_pricing_badge(artwork_id: str):
     """Get the pricing transparency badge for a specific artwork"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    artwork = supabase.table('artworks').select('*').eq('id', artwork_id).single().execute()
+    artwork = await supabase.table('artworks').select('*').eq('id', artwork_id).single().execute()
     if not artwork.data:
         raise HTTPException(status_code=404, detail="Artwork not found")
     
@@ -4653,24 +5897,21 @@ async def get_artwork_pricing_badge(artwork_id: str):
 
 @app.get("/api/artist/dashboard")
 async def get_artist_dashboard(artist: dict = Depends(require_artist)):
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
 
-    artworks = supabase.table("artworks") \
-        .select("id", count="exact") \
-        .eq("artist_id", artist["id"]) \
-        .execute()
-
-    orders = supabase.table("orders") \
-        .select("id", count="exact") \
-        .eq("artist_id", artist["id"]) \
-        .execute()
-
-    views = supabase.table("artworks") \
-        .select("views") \
-        .eq("artist_id", artist["id"]) \
-        .execute()
+    artworks, orders = await asyncio.gather(
+        supabase.table("artworks")
+            .select("views", count="exact")
+            .eq("artist_id", artist["id"])
+            .execute(),
+        supabase.table("orders")
+            .select("id", count="exact")
+            .eq("artist_id", artist["id"])
+            .execute(),
+    )
 
-    total_views = sum(a.get("views", 0) for a in (views.data or []))
+    # Include views recorded on this worker that haven't been flushed yet
+    total_views = sum(a.get("views") or 0 for a in (artworks.data or [])) + _view_counter.pending_for_artist(artist["id"])
 
     return {
         "total_artworks": artworks.count or 0,
@@ -4681,9 +5922,9 @@ async def get_artist_dashboard(artist: dict = Depends(require_artist)):
 
 @app.get("/api/artist/orders")
 async def get_artist_orders(artist: dict = Depends(require_artist)):
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
 
-    orders = supabase.table("orders") \
+    orders = await supabase.table("orders") \
         .select("*") \
         .eq("artist_id", artist["id"]) \
         .order("created_at", desc=True) \
@@ -4692,43 +5933,46 @@ async def get_artist_orders(artist: dict = Depends(require_artist)):
     return {"orders": orders.data or []}
 
 @app.delete("/api/artist/artworks/{artwork_id}")
+@response_cache.invalidates('artworks')
+@_reindexes_search('artwork', 'artwork_id')
 async def delete_artist_artwork(artwork_id: str, artist: dict = Depends(require_artist)):
     """Delete artist's own artwork"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Verify artwork belongs to artist
-    artwork = supabase.table('artworks').select('id').eq('id', artwork_id).eq('artist_id', artist['id']).single().execute()
+    artwork = await supabase.table('artworks').select('id').eq('id', artwork_id).eq('artist_id', artist['id']).single().execute()
     
     if not artwork.data:
         raise HTTPException(status_code=404, detail="Artwork not found or not owned by you")
     
-    supabase.table('artworks').delete().eq('id', artwork_id).execute()
+    await supabase.table('artworks').delete().eq('id', artwork_id).execute()
     
     return {"success": True, "message": "Artwork deleted successfully"}
 
 @app.get("/api/artist/exhibitions")
 async def get_artist_exhibitions(artist: dict = Depends(require_artist)):
     """Get artist's exhibitions"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
-    exhibitions = supabase.table('exhibitions').select('*').eq('artist_id', artist['id']).execute()
+    exhibitions = await supabase.table('exhibitions').select('*').eq('artist_id', artist['id']).execute()
     
     return {"exhibitions": exhibitions.data or []}
 
 
 @app.post("/api/artist/exhibitions/{exhibition_id}/request-action")
+@response_cache.invalidates('exhibitions')
 async def request_exhibition_action(
     exhibition_id: str,
     payload: ArtistExhibitionActionRequest,
     artist: dict = Depends(require_artist),
 ):
     """Artist can request pause/delete; admin must review."""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
 
     if payload.action not in ["pause", "delete"]:
         raise HTTPException(status_code=400, detail="action must be pause or delete")
 
-    exhibition = supabase.table('exhibitions').select('*').eq('id', exhibition_id).eq('artist_id', artist['id']).single().execute()
+    exhibition = await supabase.table('exhibitions').select('*').eq('id', exhibition_id).eq('artist_id', artist['id']).single().execute()
     if not exhibition.data:
         raise HTTPException(status_code=404, detail="Exhibition not found")
 
@@ -4741,24 +5985,26 @@ async def request_exhibition_action(
     }
 
     try:
-        supabase.table('exhibitions').update(update_payload).eq('id', exhibition_id).execute()
+        await supabase.table('exhibitions').update(update_payload).eq('id', exhibition_id).execute()
     except Exception as e:
         msg = str(e)
         fallback = {k: v for k, v in update_payload.items() if k not in ["artist_action_reason", "artist_action_requested_at", "updated_at"]}
         if "artist_action_request" in msg.lower() or "artist_action_status" in msg.lower() or "column" in msg.lower():
             raise HTTPException(status_code=500, detail="Exhibition action columns missing. Please run exhibition workflow migration.")
-        supabase.table('exhibitions').update(fallback).eq('id', exhibition_id).execute()
+        await supabase.table('exhibitions').update(fallback).eq('id', exhibition_id).execute()
 
     return {"success": True, "message": f"{payload.action.title()} request submitted for admin review"}
 
 
 @app.delete("/api/artist/exhibitions/{exhibition_id}")
+@response_cache.invalidates('exhibitions')
+@_reindexes_search('exhibition', 'exhibition_id')
 async def delete_artist_exhibition(exhibition_id: str, artist: dict = Depends(require_artist)):
     """Artist can delete their own exhibition if it's not yet approved or active"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get the exhibition
-    exhibition = supabase.table('exhibitions').select('*').eq('id', exhibition_id).eq('artist_id', artist['id']).single().execute()
+    exhibition = await supabase.table('exhibitions').select('*').eq('id', exhibition_id).eq('artist_id', artist['id']).single().execute()
     
     if not exhibition.data:
         raise HTTPException(status_code=404, detail="Exhibition not found")
@@ -4769,18 +6015,20 @@ async def delete_artist_exhibition(exhibition_id: str, artist: dict = Depends(re
         raise HTTPException(status_code=400, detail="Cannot delete an active exhibition. Please request to pause/delete instead.")
     
     # Delete the exhibition
-    supabase.table('exhibitions').delete().eq('id', exhibition_id).execute()
+    await supabase.table('exhibitions').delete().eq('id', exhibition_id).execute()
     
     return {"success": True, "message": "Exhibition deleted successfully"}
 
 
 @app.put("/api/artist/exhibitions/{exhibition_id}")
+@response_cache.invalidates('exhibitions')
+@_reindexes_search('exhibition', 'exhibition_id')
 async def update_artist_exhibition(exhibition_id: str, updates: dict, artist: dict = Depends(require_artist)):
     """Artist can update their exhibition details (name, description) before approval"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     
     # Get the exhibition
-    exhibition = supabase.table('exhibitions').select('*').eq('id', exhibition_id).eq('artist_id', artist['id']).single().execute()
+    exhibition = await supabase.table('exhibitions').select('*').eq('id', exhibition_id).eq('artist_id', artist['id']).single().execute()
     
     if not exhibition.data:
         raise HTTPException(status_code=404, detail="Exhibition not found")
@@ -4799,11 +6047,11 @@ async def update_artist_exhibition(exhibition_id: str, updates: dict, artist: di
     update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
     
     try:
-        supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
+        await supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
     except Exception as e:
         update_data.pop('updated_at', None)
         if update_data:
-            supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
+            await supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
     
     return {"success": True, "message": "Exhibition updated successfully"}
 
@@ -4839,9 +6087,10 @@ async def create_exhibition_payment_order(exhibition_type: str, artist: dict = D
     }
 
 @app.post("/api/artist/exhibitions")
+@response_cache.invalidates('exhibitions')
 async def create_exhibition(exhibition: ExhibitionCreate, artist: dict = Depends(require_artist)):
     """Create new exhibition request. Artists with validated terms can proceed faster; others need manual admin payment approval."""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
     
@@ -4893,8 +6142,7 @@ async def create_exhibition(exhibition: ExhibitionCreate, artist: dict = Depends
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid Razorpay signature")
 
-    profile = supabase.table('profiles').select('is_member').eq('id', artist['id']).single().execute()
-    is_member = bool((profile.data or {}).get('is_member'))
+    is_member = await _is_active_member(supabase, artist['id'])
 
     if payment_method == "razorpay":
         payment_status = "paid_razorpay"
@@ -4937,22 +6185,23 @@ async def create_exhibition(exhibition: ExhibitionCreate, artist: dict = Depends
     }
 
     try:
-        result = supabase.table('exhibitions').insert(exhibition_data).execute()
+        result = await supabase.table('exhibitions').insert(exhibition_data).execute()
     except Exception as e:
         msg = str(e)
         fallback = dict(exhibition_data)
         for optional_field in ["exhibition_images", "primary_exhibition_image", "payment_method", "payment_screenshot_url", "payment_reference", "razorpay_order_id", "razorpay_payment_id", "payment_status", "request_status", "updated_at"]:
             if optional_field in fallback and (optional_field in msg or "column" in msg.lower()):
                 fallback.pop(optional_field, None)
-        result = supabase.table('exhibitions').insert(fallback).execute()
+        result = await supabase.table('exhibitions').insert(fallback).execute()
     
     return {"success": True, "exhibition": result.data[0], "message": f"Exhibition submitted. Total fee: ₹{total_fees}"}
 
 
 @app.post("/api/admin/exhibitions/create")
+@response_cache.invalidates('exhibitions')
 async def admin_create_exhibition(payload: ExhibitionAdminCreate, admin: dict = Depends(require_lead_chitrakar)):
     """Admin can directly create and publish exhibitions without payment."""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
 
@@ -5001,30 +6250,33 @@ async def admin_create_exhibition(payload: ExhibitionAdminCreate, admin: dict =
     }
 
     try:
-        result = supabase.table('exhibitions').insert(exhibition_data).execute()
+        result = await supabase.table('exhibitions').insert(exhibition_data).execute()
     except Exception as e:
         msg = str(e)
         fallback = dict(exhibition_data)
         for optional_field in ["exhibition_images", "exhibition_paintings", "primary_exhibition_image", "payment_status", "request_status", "updated_at"]:
             if optional_field in fallback and (optional_field in msg or "column" in msg.lower()):
                 fallback.pop(optional_field, None)
-        result = supabase.table('exhibitions').insert(fallback).execute()
+        result = await supabase.table('exhibitions').insert(fallback).execute()
+
+    try:
+        await _exhibition_lifecycle_job.trigger()
+    except Exception:
+        pass
+
+    if result.data:
+        _schedule_search_reindex('exhibition', result.data[0].get('id'))
 
     return {"success": True, "exhibition": result.data[0] if result.data else None, "message": "Exhibition created by admin"}
 
 
 @app.get("/api/admin/exhibitions/all")
 async def admin_get_all_exhibitions(admin: dict = Depends(require_lead_chitrakar)):
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         return {"exhibitions": []}
 
-    try:
-        _sync_exhibition_statuses(supabase)
-    except Exception:
-        pass
-
-    exhibitions = supabase.table('exhibitions').select('*').order('created_at', desc=True).execute()
+    exhibitions = await supabase.table('exhibitions').select('*').order('created_at', desc=True).execute()
 
     result = []
     for exhibition in (exhibitions.data or []):
@@ -5032,7 +6284,7 @@ async def admin_get_all_exhibitions(admin: dict = Depends(require_lead_chitrakar
         artist_id = exhibition.get('artist_id')
         if artist_id:
             try:
-                profile = supabase.table('profiles').select('full_name').eq('id', artist_id).single().execute()
+                profile = await supabase.table('profiles').select('full_name').eq('id', artist_id).single().execute()
                 artist_name = (profile.data or {}).get('full_name')
             except Exception:
                 artist_name = None
@@ -5045,12 +6297,14 @@ async def admin_get_all_exhibitions(admin: dict = Depends(require_lead_chitrakar
 
 
 @app.post("/api/admin/exhibitions/extend")
+@response_cache.invalidates('exhibitions')
+@_reindexes_search('exhibition', 'payload.exhibition_id')
 async def admin_extend_exhibition(payload: AdminExhibitionExtendRequest, admin: dict = Depends(require_lead_chitrakar)):
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
 
-    exhibition = supabase.table('exhibitions').select('*').eq('id', payload.exhibition_id).single().execute()
+    exhibition = await supabase.table('exhibitions').select('*').eq('id', payload.exhibition_id).single().execute()
     if not exhibition.data:
         raise HTTPException(status_code=404, detail="Exhibition not found")
 
@@ -5062,13 +6316,13 @@ async def admin_extend_exhibition(payload: AdminExhibitionExtendRequest, admin:
     }
 
     try:
-        supabase.table('exhibitions').update(update_payload).eq('id', payload.exhibition_id).execute()
+        await supabase.table('exhibitions').update(update_payload).eq('id', payload.exhibition_id).execute()
     except Exception:
         fallback = {k: v for k, v in update_payload.items() if k in ['days_paid', 'status']}
-        supabase.table('exhibitions').update(fallback).eq('id', payload.exhibition_id).execute()
+        await supabase.table('exhibitions').update(fallback).eq('id', payload.exhibition_id).execute()
 
     try:
-        _sync_exhibition_statuses(supabase)
+        await _exhibition_lifecycle_job.trigger()
     except Exception:
         pass
 
@@ -5076,19 +6330,21 @@ async def admin_extend_exhibition(payload: AdminExhibitionExtendRequest, admin:
 
 
 @app.delete("/api/admin/exhibitions/{exhibition_id}")
+@response_cache.invalidates('exhibitions')
+@_reindexes_search('exhibition', 'exhibition_id')
 async def admin_delete_exhibition(exhibition_id: str, admin: dict = Depends(require_lead_chitrakar)):
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
 
     try:
-        supabase.table('exhibitions').update({
+        await supabase.table('exhibitions').update({
             'status': 'deleted',
             'is_approved': False,
             'updated_at': datetime.now(timezone.utc).isoformat(),
         }).eq('id', exhibition_id).execute()
     except Exception:
-        supabase.table('exhibitions').update({
+        await supabase.table('exhibitions').update({
             'status': 'deleted',
             'is_approved': False,
         }).eq('id', exhibition_id).execute()
@@ -5097,14 +6353,16 @@ async def admin_delete_exhibition(exhibition_id: str, admin: dict = Depends(requ
 
 
 @app.put("/api/admin/exhibitions/{exhibition_id}")
+@response_cache.invalidates('exhibitions')
+@_reindexes_search('exhibition', 'exhibition_id')
 async def admin_update_exhibition(exhibition_id: str, payload: AdminExhibitionUpdateRequest, admin: dict = Depends(require_lead_chitrakar)):
     """Admin can update exhibition details including name, description, end_date, and status"""
-    supabase = get_supabase_client()
+    supabase = get_async_supabase_client()
     if not supabase:
         raise HTTPException(status_code=503, detail="Database not configured")
 
     # Get current exhibition
-    exhibition = supabase.table('exhibitions').select('*').eq('id', exhibition_id).single().execute()
+    exhibition = await supabase.table('exhibitions').select('*').eq('id', exhibition_id).single().execute()
     if not exhibition.data:
         raise HTTPException(status_code=404, detail="Exhibition not found")
 
@@ -5125,12 +6383,17 @@ async def admin_update_exhibition(exhibition_id: str, payload: AdminExhibitionUp
     update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
 
     try:
-        supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
+        await supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
     except Exception as e:
         # Fallback without updated_at if column doesn't exist
         update_data.pop('updated_at', None)
         if update_data:
-            supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
+            await supabase.table('exhibitions').update(update_data).eq('id', exhibition_id).execute()
+
+    try:
+        await _exhibition_lifecycle_job.trigger()
+    except Exception:
+        pass
 
     return {"success": True, "message": "Exhibition updated"}
 
@@ -1,9 +1,17 @@
 import os
+import httpx
+from postgrest import AsyncPostgrestClient
 from supabase import create_client, Client
 
 SUPABASE_URL = os.environ.get('SUPABASE_URL', '')
 SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_KEY', '') or os.environ.get('SUPABASE_KEY', '')
 
+# Shared PostgREST connection pool settings (per-request timeout budget in seconds)
+DB_REQUEST_TIMEOUT = float(os.environ.get('DB_REQUEST_TIMEOUT', '10'))
+DB_CONNECT_TIMEOUT = float(os.environ.get('DB_CONNECT_TIMEOUT', '5'))
+DB_POOL_MAX_CONNECTIONS = int(os.environ.get('DB_POOL_MAX_CONNECTIONS', '100'))
+DB_POOL_MAX_KEEPALIVE = int(os.environ.get('DB_POOL_MAX_KEEPALIVE', '20'))
+
 # Check if Supabase is configured
 def is_supabase_configured():
     url = os.environ.get('SUPABASE_URL', '')
@@ -20,6 +28,8 @@ def is_supabase_configured():
 # Lazy initialization
 _supabase_client: Client = None
 _is_configured = None
+_async_http_client: httpx.AsyncClient = None
+_async_db_client: AsyncPostgrestClient = None
 
 def get_supabase_client() -> Client:
     """Get Supabase client instance with lazy initialization"""
@@ -37,3 +47,48 @@ def get_supabase_client() -> Client:
         _supabase_client = create_client(url, key)
     
     return _supabase_client
+
+def get_async_supabase_client() -> AsyncPostgrestClient:
+    """
+    Get the async PostgREST client (same table/select/eq/execute builder as the
+    sync client, but `execute()` must be awaited). All instances share one
+    HTTP/2 connection pool so route handlers never block the event loop.
+    """
+    global _is_configured, _async_http_client, _async_db_client
+    
+    if _is_configured is None:
+        _is_configured = is_supabase_configured()
+    
+    if not _is_configured:
+        return None
+    
+    if _async_db_client is None:
+        url = os.environ.get('SUPABASE_URL', '').rstrip('/')
+        key = os.environ.get('SUPABASE_SERVICE_KEY', '') or os.environ.get('SUPABASE_KEY', '')
+        rest_url = f"{url}/rest/v1"
+        headers = {
+            "apikey": key,
+            "Authorization": f"Bearer {key}",
+        }
+        _async_http_client = httpx.AsyncClient(
+            base_url=rest_url,
+            headers=headers,
+            http2=True,
+            timeout=httpx.Timeout(DB_REQUEST_TIMEOUT, connect=DB_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=DB_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=DB_POOL_MAX_KEEPALIVE,
+            ),
+        )
+        _async_db_client = AsyncPostgrestClient(rest_url, headers=headers, http_client=_async_http_client)
+    
+    return _async_db_client
+
+async def close_async_supabase_client():
+    """Close the shared connection pool (called on app shutdown)"""
+    global _async_http_client, _async_db_client
+    
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+    _async_http_client = None
+    _async_db_client = None
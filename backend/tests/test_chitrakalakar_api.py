@@ -22,6 +22,103 @@ class TestHealthCheck:
         print(f"✓ Health check passed: {data}")
 
 
+class TestLocationSearch:
+    """Tests for location autocomplete (served from the bundled gazetteer for India)"""
+    
+    def test_prefix_search_returns_city(self):
+        """Test /api/locations/search matches a city by prefix"""
+        response = requests.get(f"{BASE_URL}/api/locations/search", params={"q": "chen", "country": "in"})
+        assert response.status_code == 200
+        cities = [loc.get("city") for loc in response.json()["locations"]]
+        assert "Chennai" in cities
+    
+    def test_search_tolerates_typos_and_old_names(self):
+        """Test /api/locations/search resolves misspellings and former names"""
+        for query in ["banglore", "Bangalore"]:
+            response = requests.get(f"{BASE_URL}/api/locations/search", params={"q": query})
+            assert response.status_code == 200
+            cities = [loc.get("city") for loc in response.json()["locations"]]
+            assert "Bengaluru" in cities, f"{query} -> {cities}"
+
+
+class TestSearch:
+    """Tests for /api/search (in-process BM25 index over approved content)"""
+    
+    def test_search_returns_ranked_page_with_facets(self):
+        """Test /api/search returns results, total, facets and paging fields"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "painting", "limit": 5})
+        assert response.status_code == 200
+        data = response.json()
+        for key in ("results", "total", "facets", "offset", "limit"):
+            assert key in data
+        assert len(data["results"]) <= 5
+        scores = [result["score"] for result in data["results"]]
+        assert scores == sorted(scores, reverse=True)
+        print(f"✓ Search returned {data['total']} matches in {data.get('took_ms')}ms")
+    
+    def test_search_filters_by_kind(self):
+        """Test /api/search?kind=artist only returns artists"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "art", "kind": "artist"})
+        assert response.status_code == 200
+        assert all(result["kind"] == "artist" for result in response.json()["results"])
+    
+    def test_search_requires_query(self):
+        """Test /api/search without q is rejected"""
+        response = requests.get(f"{BASE_URL}/api/search")
+        assert response.status_code == 422
+    
+    def test_autocomplete_suggests_categories(self):
+        """Test /api/search/autocomplete suggests commission categories by prefix"""
+        response = requests.get(f"{BASE_URL}/api/search/autocomplete", params={"q": "water", "kind": "category"})
+        assert response.status_code == 200
+        texts = [s["text"] for s in response.json()["suggestions"]]
+        assert "Watercolors" in texts
+
+
+class TestPricingAnalysis:
+    """Tests for /api/artwork/pricing-analysis (local pricing model, buyer message filled in later)"""
+    
+    PAYLOAD = {
+        "width": 24, "height": 36, "medium": "oil", "realism_level": "realism",
+        "detailing_level": "average", "uniqueness": "original", "artist_experience": "intermediate",
+        "hours_spent": 40, "material_cost": 2000, "artist_price": 100000
+    }
+    
+    def test_pricing_analysis_returns_range_and_badge(self):
+        """Test the analysis returns an ordered range, evaluation, badge and message key"""
+        response = requests.post(f"{BASE_URL}/api/artwork/pricing-analysis", json=self.PAYLOAD)
+        assert response.status_code == 200
+        data = response.json()
+        price_range = data["suggested_price_range"]
+        assert 0 < price_range["min"] <= data["estimated_price"] <= price_range["max"]
+        assert data["pricing_evaluation"] in ("fair", "underpriced", "slightly_high", "overpriced")
+        assert data["pricing_badge"] in ("green", "yellow", "red")
+        assert data["buyer_message"]
+        assert data["buyer_message_key"]
+        print(f"✓ Pricing analysis: {data['pricing_evaluation']} {price_range}")
+    
+    def test_pricing_analysis_is_deterministic(self):
+        """Test identical inputs give identical results and a higher price never scores better"""
+        first = requests.post(f"{BASE_URL}/api/artwork/pricing-analysis", json=self.PAYLOAD).json()
+        second = requests.post(f"{BASE_URL}/api/artwork/pricing-analysis", json=self.PAYLOAD).json()
+        assert first["suggested_price_range"] == second["suggested_price_range"]
+        assert first["buyer_message_key"] == second["buyer_message_key"]
+        
+        steep = requests.post(f"{BASE_URL}/api/artwork/pricing-analysis", json={**self.PAYLOAD, "artist_price": 10_000_000}).json()
+        assert steep["pricing_badge"] == "red"
+        
+        message = requests.get(f"{BASE_URL}/api/artwork/pricing-analysis/buyer-message/{first['buyer_message_key']}")
+        assert message.status_code == 200
+        assert "pending" in message.json()
+    
+    def test_pricing_batch_requires_artist(self):
+        """Test batch pricing and its job status are not open to anonymous callers"""
+        response = requests.post(f"{BASE_URL}/api/artwork/pricing-batch", json={"artwork_ids": []})
+        assert response.status_code in [401, 403]
+        response = requests.get(f"{BASE_URL}/api/artwork/pricing-batch/00000000-0000-0000-0000-000000000000")
+        assert response.status_code in [401, 403]
+
+
 class TestPublicArtistsAPI:
     """Tests for /api/public/artists endpoint - should return ALL registered artists"""
     
@@ -203,6 +300,22 @@ class TestAdminExhibitionControls:
         print(f"✓ Admin delete endpoint properly requires auth (status: {response.status_code})")
 
 
+class TestAdminMetrics:
+    """Tests for admin metrics endpoints (auth required - testing endpoint existence)"""
+    
+    def test_auth_cache_metrics_requires_auth(self):
+        """Test /api/admin/metrics/auth-cache requires authentication"""
+        response = requests.get(f"{BASE_URL}/api/admin/metrics/auth-cache")
+        assert response.status_code in [401, 403], f"Expected 401/403, got {response.status_code}"
+        print(f"✓ Auth cache metrics endpoint properly requires auth (status: {response.status_code})")
+    
+    def test_llm_gateway_metrics_requires_auth(self):
+        """Test /api/admin/metrics/llm-gateway requires authentication"""
+        response = requests.get(f"{BASE_URL}/api/admin/metrics/llm-gateway")
+        assert response.status_code in [401, 403], f"Expected 401/403, got {response.status_code}"
+        print(f"✓ LLM gateway metrics endpoint properly requires auth (status: {response.status_code})")
+
+
 class TestArtistExhibitionControls:
     """Tests for artist exhibition control endpoints (auth required - testing endpoint existence)"""
     
@@ -255,6 +368,19 @@ class TestPublicStats:
         assert "active_exhibitions" in data
         
         print(f"✓ Platform stats: artists={data.get('total_artists')}, artworks={data.get('total_artworks')}, exhibitions={data.get('active_exhibitions')}")
+    
+    def test_public_stats_supports_conditional_requests(self):
+        """Test /api/public/stats returns an ETag and honours If-None-Match"""
+        response = requests.get(f"{BASE_URL}/api/public/stats")
+        assert response.status_code == 200
+        etag = response.headers.get("ETag")
+        assert etag, "Expected ETag header on cached public endpoint"
+        
+        revalidated = requests.get(f"{BASE_URL}/api/public/stats", headers={"If-None-Match": etag})
+        assert revalidated.status_code in [200, 304]
+        if revalidated.status_code == 304:
+            assert not revalidated.content
+        print(f"✓ Conditional request on stats returned {revalidated.status_code}")
 
 
 if __name__ == "__main__":
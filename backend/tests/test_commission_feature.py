@@ -111,3 +111,19 @@ class TestUploadUrlContract:
             timeout=20,
         )
         assert response.status_code in [401, 403]
+
+
+# Module: Paginated commission listings stay auth-protected
+class TestCommissionListingContract:
+    @pytest.mark.parametrize("path", ["/api/user/commissions", "/api/artist/commissions", "/api/admin/commissions"])
+    def test_listing_requires_authentication(self, api_base_url, path):
+        response = requests.get(
+            f"{api_base_url}{path}",
+            params={"limit": 10, "include_updates": "true"},
+            timeout=20,
+        )
+        assert response.status_code in [401, 403]
+
+    def test_listing_validates_page_size(self, api_base_url):
+        response = requests.get(f"{api_base_url}/api/user/commissions", params={"limit": 0}, timeout=20)
+        assert response.status_code in [401, 403, 422]
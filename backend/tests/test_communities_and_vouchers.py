@@ -5,6 +5,8 @@ Tests for new features: Communities, Community Detail, Admin Vouchers, Artist of
 import pytest
 import requests
 import os
+import json
+import base64
 
 # Get BASE_URL from environment
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://chitrakalakar-art.preview.emergentagent.com').rstrip('/')
@@ -130,6 +132,31 @@ class TestPublicPaintings:
         assert isinstance(data["paintings"], list)
         print(f"Public paintings: {len(data['paintings'])} paintings found")
 
+    def test_public_paintings_keyset_pagination(self):
+        """Test /api/public/paintings pages with an opaque next_cursor"""
+        response = requests.get(f"{BASE_URL}/api/public/paintings", params={"limit": 2, "projection": "card"})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["paintings"]) <= 2
+        assert "next_cursor" in data
+        if data["next_cursor"]:
+            next_page = requests.get(f"{BASE_URL}/api/public/paintings", params={"limit": 2, "cursor": data["next_cursor"]})
+            assert next_page.status_code == 200
+            first_ids = {p["id"] for p in data["paintings"]}
+            assert not first_ids & {p["id"] for p in next_page.json()["paintings"]}
+
+    def test_public_paintings_rejects_bad_cursor(self):
+        """Test /api/public/paintings rejects a malformed cursor"""
+        response = requests.get(f"{BASE_URL}/api/public/paintings", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_public_paintings_rejects_cursor_with_filter_syntax(self):
+        """Test /api/public/paintings rejects a well-encoded cursor whose values aren't a timestamp and UUID"""
+        raw = json.dumps(['2026-01-01",is_approved.eq.false,created_at.lt."2100-01-01', 'x']).encode()
+        cursor = base64.urlsafe_b64encode(raw).decode().rstrip('=')
+        response = requests.get(f"{BASE_URL}/api/public/paintings", params={"cursor": cursor})
+        assert response.status_code == 400
+
 
 class TestPublicExhibitions:
     """Public exhibitions endpoint tests"""
@@ -0,0 +1,68 @@
+"""
+Geocoding client tests (no network: the shared client is swapped for one over an httpx mock transport).
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from geocoding import GeocodingClient, get_geocoder, set_geocoder  # noqa: E402
+
+NOMINATIM_RESULT = [{
+    "display_name": "Madhubani, Bihar, India",
+    "address": {"town": "Madhubani", "state": "Bihar", "country": "India", "country_code": "in"},
+    "lat": "26.35", "lon": "86.07",
+}]
+
+
+def _stub_geocoder(delay: float = 0.05):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.params.get("q"))
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json=NOMINATIM_RESULT)
+
+    geocoder = GeocodingClient(base_url="http://geocoder.test", rate_per_second=1000, burst=10)
+    geocoder._client = httpx.AsyncClient(base_url="http://geocoder.test", transport=httpx.MockTransport(handler))
+    return geocoder, calls
+
+
+class TestGeocodingCoalescing:
+    """Identical in-flight searches share one upstream call"""
+    
+    def test_identical_searches_share_one_call(self):
+        async def run():
+            geocoder, calls = _stub_geocoder()
+            set_geocoder(geocoder)
+            results = await asyncio.gather(*(get_geocoder().search("Madhubani") for _ in range(5)))
+            await geocoder.close()
+            return results, calls, geocoder.stats
+        
+        results, calls, stats = asyncio.run(run())
+        assert all(result[0]["city"] == "Madhubani" for result in results)
+        assert len(calls) == 1
+        assert stats["coalesced"] == 4
+    
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test a follower still gets results when the request that started the fetch disconnects"""
+        async def run():
+            geocoder, calls = _stub_geocoder()
+            set_geocoder(geocoder)
+            leader = asyncio.create_task(get_geocoder().search("Madhubani"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(get_geocoder().search("madhubani"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            result = await follower
+            await geocoder.close()
+            return leader, follower, result, calls
+        
+        leader, follower, result, calls = asyncio.run(run())
+        assert leader.cancelled()
+        assert not follower.cancelled()
+        assert result[0]["city"] == "Madhubani"
+        assert len(calls) == 2
@@ -0,0 +1,109 @@
+"""
+LLM gateway tests (offline: the shared gateway is swapped for one over FakeLlmProvider).
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from llm_gateway import (  # noqa: E402
+    FakeLlmProvider,
+    FeaturePolicy,
+    LlmGateway,
+    LlmUnavailable,
+    get_llm_gateway,
+    set_llm_gateway,
+)
+
+
+class RecordingProvider(FakeLlmProvider):
+    """FakeLlmProvider that records the order calls start in."""
+    
+    def __init__(self, delay: float):
+        super().__init__(tokens=["ok"], delay=delay)
+        self.started = []
+    
+    async def stream(self, session_id, system_message, message, model):
+        self.started.append(message)
+        async for token in super().stream(session_id, system_message, message, model):
+            yield token
+
+
+def _gateway(provider, max_concurrency=1, chat_queue=10, pricing_queue=10, deadline=5.0):
+    gateway = LlmGateway(provider, {
+        "chat": FeaturePolicy("chat", 0, 1, chat_queue, deadline),
+        "pricing": FeaturePolicy("pricing", 1, 1, pricing_queue, deadline),
+    }, max_concurrency=max_concurrency)
+    set_llm_gateway(gateway)
+    return get_llm_gateway()
+
+
+class TestLlmGateway:
+    """Queueing, priority, deadlines and de-duplication in front of the provider"""
+    
+    def test_fake_provider_streams_offline(self):
+        async def run():
+            gateway = _gateway(FakeLlmProvider(delay=0))
+            return [chunk async for chunk in gateway.stream('chat', 'system', 'hello there', 'model')]
+        
+        chunks = asyncio.run(run())
+        assert len(chunks) > 1
+        assert "hello" in ''.join(chunks)
+    
+    def test_chat_is_served_before_queued_pricing(self):
+        async def run():
+            provider = RecordingProvider(delay=0.05)
+            gateway = _gateway(provider)
+            first = asyncio.create_task(gateway.complete('pricing', 's', 'pricing-1', 'm'))
+            await asyncio.sleep(0.01)
+            queued = [
+                asyncio.create_task(gateway.complete('pricing', 's', 'pricing-2', 'm')),
+                asyncio.create_task(gateway.complete('chat', 's', 'chat-1', 'm')),
+            ]
+            await asyncio.gather(first, *queued)
+            return provider.started
+        
+        assert asyncio.run(run()) == ['pricing-1', 'chat-1', 'pricing-2']
+    
+    def test_full_queue_is_rejected(self):
+        async def run():
+            gateway = _gateway(FakeLlmProvider(tokens=["ok"], delay=0.1), pricing_queue=1)
+            running = asyncio.create_task(gateway.complete('pricing', 's', 'a', 'm'))
+            await asyncio.sleep(0.01)
+            waiting = asyncio.create_task(gateway.complete('pricing', 's', 'b', 'm'))
+            await asyncio.sleep(0.01)
+            with pytest.raises(LlmUnavailable):
+                await gateway.complete('pricing', 's', 'c', 'm')
+            await asyncio.gather(running, waiting)
+            return gateway.metrics()
+        
+        metrics = asyncio.run(run())
+        assert metrics["features"]["pricing"]["rejected"] == 1
+        assert metrics["features"]["pricing"]["completed"] == 2
+        assert metrics["in_flight"] == 0
+    
+    def test_deadline_covers_generation(self):
+        async def run():
+            gateway = _gateway(FakeLlmProvider(tokens=["slow"], delay=0.5), deadline=0.05)
+            with pytest.raises(LlmUnavailable):
+                await gateway.complete('chat', 's', 'hello', 'm')
+            return gateway.metrics()
+        
+        metrics = asyncio.run(run())
+        assert metrics["features"]["chat"]["timed_out"] == 1
+        assert metrics["in_flight"] == 0
+    
+    def test_identical_calls_share_one_provider_call(self):
+        async def run():
+            provider = RecordingProvider(delay=0.05)
+            gateway = _gateway(provider, max_concurrency=4)
+            replies = await asyncio.gather(*(gateway.complete('pricing', 's', 'same', 'm') for _ in range(3)))
+            return replies, provider.started, gateway.metrics()
+        
+        replies, started, metrics = asyncio.run(run())
+        assert replies == ["ok"] * 3
+        assert started == ['same']
+        assert metrics["features"]["pricing"]["deduplicated"] == 2
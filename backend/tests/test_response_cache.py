@@ -0,0 +1,127 @@
+"""
+Response cache tests (in process: the backends are exercised directly, without a server).
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from response_cache import InMemoryCacheBackend, RedisCacheBackend, ResponseCache  # noqa: E402
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls RedisCacheBackend makes (decode_responses=True)."""
+    
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.expires = {}
+    
+    def _live(self, key):
+        if key in self.expires and self.expires[key] <= time.time():
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+            del self.expires[key]
+        return key in self.values or key in self.sets
+    
+    async def get(self, key):
+        return self.values.get(key) if self._live(key) else None
+    
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        if ex:
+            self.expires[key] = time.time() + ex
+    
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+    
+    async def expire(self, key, seconds):
+        self.expires[key] = time.time() + seconds
+    
+    async def smembers(self, key):
+        return set(self.sets.get(key, ())) if self._live(key) else set()
+    
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+            self.expires.pop(key, None)
+
+
+def _entry(n: int) -> dict:
+    return {"body": f'{{"n": {n}}}'.encode(), "etag": f'"{n}"', "fresh_until": 0}
+
+
+class TestInMemoryBackend:
+    """LRU eviction and expiry also drop keys from their tag sets"""
+    
+    def test_evicted_keys_leave_tag_sets(self):
+        async def run():
+            backend = InMemoryCacheBackend(max_entries=100)
+            for n in range(5000):
+                await backend.set(f"public_paintings?cursor={n}", _entry(n), 60, tags=('artworks', 'profiles'))
+            return backend
+        
+        backend = asyncio.run(run())
+        assert len(backend._entries) == 100
+        assert len(backend._tags['artworks']) == 100
+        assert len(backend._tags['profiles']) == 100
+    
+    def test_expired_and_invalidated_keys_leave_tag_sets(self):
+        async def run():
+            backend = InMemoryCacheBackend()
+            await backend.set("expired", _entry(1), -1, tags=('artworks',))
+            await backend.set("live", _entry(2), 60, tags=('artworks', 'profiles'))
+            assert await backend.get("expired") is None
+            assert backend._tags['artworks'] == {"live"}
+            await backend.invalidate_tags(('artworks',))
+            return backend
+        
+        backend = asyncio.run(run())
+        assert backend._entries == {}
+        assert backend._tags == {}
+
+
+class TestRedisBackend:
+    """The cache runs unchanged on the Redis backend over a local stand-in"""
+    
+    def test_cached_endpoint_over_redis_stand_in(self):
+        redis = FakeRedis()
+        cache = ResponseCache(InMemoryCacheBackend())
+        cache.use_backend(RedisCacheBackend(redis, prefix="test:"))
+        calls = []
+        app = FastAPI()
+        
+        @app.get("/items")
+        @cache.cached("items", ttl=60, tags=('artworks',))
+        async def items():
+            calls.append(1)
+            return {"items": len(calls)}
+        
+        @app.post("/items")
+        @cache.invalidates('artworks')
+        async def add_item():
+            return {"success": True}
+        
+        client = TestClient(app)
+        first = client.get("/items")
+        second = client.get("/items")
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json() == {"items": 1}
+        assert "test:items?" in redis.values
+        assert redis.sets["test:tag:artworks"] == {"test:items?"}
+        
+        not_modified = client.get("/items", headers={"If-None-Match": first.headers["ETag"]})
+        assert not_modified.status_code == 304
+        
+        client.post("/items")
+        assert redis.values == {} and redis.sets == {}
+        third = client.get("/items")
+        assert third.headers["X-Cache"] == "MISS"
+        assert third.json() == {"items": 2}
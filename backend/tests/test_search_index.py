@@ -0,0 +1,51 @@
+"""
+Search index tests (in process: the index is built and queried directly, without a server).
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from search_index import SearchIndex  # noqa: E402
+
+
+def _index() -> SearchIndex:
+    index = SearchIndex()
+    index.upsert('artwork', '1', {"title": "Madhubani fish", "medium": "ink"}, facets={"medium": "ink"})
+    index.upsert('artwork', '2', {"title": "Warli harvest", "medium": "acrylic"}, facets={"medium": "acrylic"})
+    return index
+
+
+class TestSpellingCorrection:
+    """Misspelled query terms are corrected through the symmetric-delete index"""
+
+    def test_exact_term_is_not_corrected(self):
+        result = _index().search("madhubani")
+        assert [r["id"] for r in result["results"]] == ['1']
+        assert result["corrections"] == {}
+
+    def test_short_word_allows_one_edit(self):
+        result = _index().search("warly")
+        assert [r["id"] for r in result["results"]] == ['2']
+        assert result["corrections"] == {"warly": ["warli"]}
+
+    def test_short_word_rejects_two_edits(self):
+        assert _index().search("wurly")["total"] == 0
+
+    def test_long_word_allows_two_substitutions(self):
+        result = _index().search("mathubeni")
+        assert [r["id"] for r in result["results"]] == ['1']
+        assert result["corrections"] == {"mathubeni": ["madhubani"]}
+
+    def test_long_word_allows_two_trailing_edits(self):
+        result = _index().search("madhubaxy")
+        assert [r["id"] for r in result["results"]] == ['1']
+
+    def test_long_word_rejects_three_edits(self):
+        assert _index().search("mathubexy")["total"] == 0
+
+    def test_removed_term_leaves_spelling_index(self):
+        index = _index()
+        index.remove('artwork', '1')
+        assert index.search("mathubeni")["total"] == 0
+        assert not any('madhubani' in terms for terms in index._spelling.values())
@@ -0,0 +1,75 @@
+import asyncio
+import os
+from typing import Awaitable, Callable, Dict, Optional
+
+# How often buffered view increments are written to the database
+VIEW_FLUSH_INTERVAL_SECONDS = float(os.environ.get('VIEW_FLUSH_INTERVAL_SECONDS', '5'))
+
+
+class WriteBehindViewCounter:
+    """
+    Buffers artwork view increments in memory and hands them to `flush_fn` in one batch
+    per interval. `flush_fn(views_by_artwork, views_by_artist)` must apply the deltas
+    atomically (additive, so concurrent workers each flushing their own buffers is safe).
+    A failed flush merges the batch back into the buffer for the next attempt.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[Dict[str, int], Dict[str, int]], Awaitable[None]],
+        interval_seconds: float = VIEW_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.flush_fn = flush_fn
+        self.interval_seconds = interval_seconds
+        self._views: Dict[str, int] = {}
+        self._artist_views: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def record(self, artwork_id: str, artist_id: Optional[str] = None, count: int = 1):
+        self._views[artwork_id] = self._views.get(artwork_id, 0) + count
+        if artist_id:
+            self._artist_views[artist_id] = self._artist_views.get(artist_id, 0) + count
+
+    def pending(self, artwork_id: str) -> int:
+        """Views recorded on this process that have not been flushed yet."""
+        return self._views.get(artwork_id, 0)
+
+    def pending_for_artist(self, artist_id: str) -> int:
+        return self._artist_views.get(artist_id, 0)
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._views and not self._artist_views:
+                return
+            views, artist_views = self._views, self._artist_views
+            self._views, self._artist_views = {}, {}
+            try:
+                await self.flush_fn(views, artist_views)
+            except Exception as e:
+                print(f"View counter flush failed ({len(views)} artworks), will retry: {e}")
+                for artwork_id, count in views.items():
+                    self._views[artwork_id] = self._views.get(artwork_id, 0) + count
+                for artist_id, count in artist_views.items():
+                    self._artist_views[artist_id] = self._artist_views.get(artist_id, 0) + count
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="view-counter-flush")
+        return self._task
+
+    async def stop(self):
+        """Stop the flush loop and write out whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.flush()
@@ -39,13 +39,24 @@ function Chatbot() {
         return;
       }
 
-      const response = await chatAPI.sendMessage(userMessage, sessionId);
+      // Grow the reply in place as tokens stream in
+      let started = false;
+      const response = await chatAPI.streamMessage(userMessage, sessionId, (text) => {
+        if (!started) {
+          started = true;
+          setLoading(false);
+          setMessages(prev => [...prev, { type: 'bot', text }]);
+          return;
+        }
+        setMessages(prev => {
+          const last = prev[prev.length - 1];
+          return [...prev.slice(0, -1), { ...last, text: last.text + text }];
+        });
+      });
       
       if (response.session_id) {
         setSessionId(response.session_id);
       }
-      
-      setMessages(prev => [...prev, { type: 'bot', text: response.response }]);
     } catch (error) {
       console.error('Chat error:', error);
       setMessages(prev => [...prev, { 
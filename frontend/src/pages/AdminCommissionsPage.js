@@ -10,6 +10,8 @@ function AdminCommissionsPage() {
   const [commissions, setCommissions] = useState([]);
   const [artists, setArtists] = useState([]);
   const [actionState, setActionState] = useState({});
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const fetchData = async () => {
     try {
@@ -18,6 +20,7 @@ function AdminCommissionsPage() {
         adminAPI.getApprovedArtists(),
       ]);
       setCommissions(commissionRes.commissions || []);
+      setNextCursor(commissionRes.next_cursor || null);
       setArtists(artistRes.artists || []);
     } catch (error) {
       console.error(error);
@@ -32,6 +35,20 @@ function AdminCommissionsPage() {
     fetchData();
   }, [profiles, navigate]);
 
+  const loadMoreCommissions = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const response = await commissionAPI.getAdminCommissions(nextCursor);
+      setCommissions(prev => [...prev, ...(response.commissions || [])]);
+      setNextCursor(response.next_cursor || null);
+    } catch (error) {
+      console.error(error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleAction = async (commissionId) => {
     const action = actionState[commissionId] || {};
     try {
@@ -123,6 +140,18 @@ function AdminCommissionsPage() {
             );
           })}
         </div>
+        {nextCursor && (
+          <div className="text-center mt-6">
+            <button
+              onClick={loadMoreCommissions}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-white border border-gray-300 text-[#1A1A1A] rounded-lg hover:bg-gray-100 transition-colors font-medium disabled:opacity-50"
+              data-testid="admin-commissions-load-more"
+            >
+              {loadingMore ? 'Loading...' : 'Load more commissions'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
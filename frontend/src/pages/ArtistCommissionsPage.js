@@ -11,12 +11,15 @@ function ArtistCommissionsPage() {
   const navigate = useNavigate();
   const [commissions, setCommissions] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [counterOffers, setCounterOffers] = useState({});
 
   const fetchCommissions = async () => {
     try {
       const response = await commissionAPI.getArtistCommissions();
       setCommissions(response.commissions || []);
+      setNextCursor(response.next_cursor || null);
     } catch (error) {
       console.error(error);
     } finally {
@@ -32,6 +35,20 @@ function ArtistCommissionsPage() {
     fetchCommissions();
   }, [profiles, navigate]);
 
+  const loadMoreCommissions = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const response = await commissionAPI.getArtistCommissions(nextCursor);
+      setCommissions(prev => [...prev, ...(response.commissions || [])]);
+      setNextCursor(response.next_cursor || null);
+    } catch (error) {
+      console.error(error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleUpdate = async (commissionId, payload) => {
     try {
       await commissionAPI.updateByArtist(commissionId, payload);
@@ -138,6 +155,18 @@ function ArtistCommissionsPage() {
             ))}
           </div>
         )}
+        {nextCursor && (
+          <div className="text-center mt-6">
+            <button
+              onClick={loadMoreCommissions}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-white border border-gray-300 text-[#1A1A1A] rounded-lg hover:bg-gray-100 transition-colors font-medium disabled:opacity-50"
+              data-testid="artist-commissions-load-more"
+            >
+              {loadingMore ? 'Loading...' : 'Load more commissions'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
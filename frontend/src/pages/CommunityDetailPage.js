@@ -12,7 +12,12 @@ function CommunityDetailPage() {
   
   const [community, setCommunity] = useState(null);
   const [members, setMembers] = useState([]);
+  const [memberCount, setMemberCount] = useState(0);
+  const [membersCursor, setMembersCursor] = useState(null);
+  const [loadingMembers, setLoadingMembers] = useState(false);
   const [posts, setPosts] = useState([]);
+  const [postsCursor, setPostsCursor] = useState(null);
+  const [loadingPosts, setLoadingPosts] = useState(false);
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState('posts');
   const [isMember, setIsMember] = useState(false);
@@ -36,14 +41,17 @@ function CommunityDetailPage() {
   const fetchCommunityData = useCallback(async () => {
     try {
       setLoading(true);
-      const response = await communityAPI.getDetails(id);
+      const response = await communityAPI.getDetails(id, profiles?.id);
       setCommunity(response.community);
       setMembers(response.members || []);
+      setMemberCount(response.member_count ?? (response.members || []).length);
+      setMembersCursor(response.members_next_cursor || null);
       setPosts(response.posts || []);
+      setPostsCursor(response.posts_next_cursor || null);
       
       // Check if current user is a member
       if (profiles?.id) {
-        const memberRecord = (response.members || []).find(m => m.user_id === profiles.id);
+        const memberRecord = response.viewer_membership;
         setIsMember(!!memberRecord);
         setIsAdmin(memberRecord?.role === 'admin');
       }
@@ -57,6 +65,34 @@ function CommunityDetailPage() {
   useEffect(() => {
     fetchCommunityData();
   }, [fetchCommunityData]);
+  const loadMoreMembers = async () => {
+    if (!membersCursor) return;
+    setLoadingMembers(true);
+    try {
+      const response = await communityAPI.getMembers(id, membersCursor);
+      setMembers(prev => [...prev, ...(response.members || [])]);
+      setMembersCursor(response.next_cursor || null);
+    } catch (error) {
+      console.error('Error loading members:', error);
+    } finally {
+      setLoadingMembers(false);
+    }
+  };
+
+  const loadMorePosts = async () => {
+    if (!postsCursor) return;
+    setLoadingPosts(true);
+    try {
+      const response = await communityAPI.getPosts(id, postsCursor);
+      setPosts(prev => [...prev, ...(response.posts || [])]);
+      setPostsCursor(response.next_cursor || null);
+    } catch (error) {
+      console.error('Error loading posts:', error);
+    } finally {
+      setLoadingPosts(false);
+    }
+  };
+
   const handleJoin = async () => {
     if (!isAuthenticated) {
       alert('Please login to join communities');
@@ -214,7 +250,7 @@ function CommunityDetailPage() {
               
               <div className="flex items-center gap-4 text-sm text-gray-500">
                 <span className="flex items-center gap-1">
-                  <span className="font-semibold text-gray-900">{members.length}</span> members
+                  <span className="font-semibold text-gray-900">{memberCount}</span> members
                 </span>
                 <span className="flex items-center gap-1">
                   <span className="font-semibold text-gray-900">{posts.length}</span> posts
@@ -341,6 +377,18 @@ function CommunityDetailPage() {
                 </div>
               ))
             )}
+            {postsCursor && (
+              <div className="text-center">
+                <button
+                  onClick={loadMorePosts}
+                  disabled={loadingPosts}
+                  className="px-6 py-2 bg-white border border-orange-300 text-orange-600 rounded-lg hover:bg-orange-50 transition-colors font-medium disabled:opacity-50"
+                  data-testid="load-more-posts"
+                >
+                  {loadingPosts ? 'Loading...' : 'Load more posts'}
+                </button>
+              </div>
+            )}
           </div>
         )}
 
@@ -348,7 +396,7 @@ function CommunityDetailPage() {
         {activeTab === 'members' && (
           <div className="bg-white rounded-xl shadow-sm">
             <div className="p-4 border-b border-gray-100">
-              <h3 className="font-semibold text-gray-900">{members.length} Members</h3>
+              <h3 className="font-semibold text-gray-900">{memberCount} Members</h3>
             </div>
             <div className="divide-y divide-gray-100">
               {members.map((member) => (
@@ -379,6 +427,18 @@ function CommunityDetailPage() {
                 </div>
               ))}
             </div>
+            {membersCursor && (
+              <div className="p-4 text-center border-t border-gray-100">
+                <button
+                  onClick={loadMoreMembers}
+                  disabled={loadingMembers}
+                  className="px-6 py-2 bg-white border border-orange-300 text-orange-600 rounded-lg hover:bg-orange-50 transition-colors font-medium disabled:opacity-50"
+                  data-testid="load-more-members"
+                >
+                  {loadingMembers ? 'Loading...' : 'Load more members'}
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>
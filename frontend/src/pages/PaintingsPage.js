@@ -11,6 +11,8 @@ function PaintingsPage() {
   const [paintings, setPaintings] = useState([]);
   const [filteredPaintings, setFilteredPaintings] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
   const [selectedCategory, setSelectedCategory] = useState('all');
   const [sortBy, setSortBy] = useState('latest');
   const [priceRange, setPriceRange] = useState('all');
@@ -38,35 +40,39 @@ function PaintingsPage() {
     { id: 'above-50000', name: 'Above ₹50K', color: 'bg-orange-100 text-orange-700' },
   ];
 
-  const fetchPaintings = useCallback(async () => {
+  // Category and price are filtered server-side; room filtering stays client-side
+  // because it falls back to category-based suggestions when suitable_rooms is empty.
+  const fetchPaintings = useCallback(async (cursor = null) => {
+    const ranges = {
+      'under-5000': [0, 5000],
+      '5000-15000': [5000, 15000],
+      '15000-50000': [15000, 50000],
+      'above-50000': [50000, null],
+    };
+    const [minPrice, maxPrice] = ranges[priceRange] || [null, null];
+    if (cursor) {
+      setLoadingMore(true);
+    }
     try {
-      const response = await publicAPI.getPaintings();
-      setPaintings(response.paintings || []);
+      const response = await publicAPI.getPaintings({
+        category: selectedCategory !== 'all' ? selectedCategory : null,
+        min_price: minPrice,
+        max_price: maxPrice,
+        cursor,
+      });
+      setPaintings(prev => (cursor ? [...prev, ...(response.paintings || [])] : (response.paintings || [])));
+      setNextCursor(response.next_cursor || null);
     } catch (error) {
       console.error('Error fetching paintings:', error);
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
-  }, []);
+  }, [selectedCategory, priceRange]);
 
   const filterAndSortPaintings = useCallback(() => {
     let filtered = [...paintings];
 
-    if (selectedCategory !== 'all') {
-      filtered = filtered.filter(p => p.category === selectedCategory);
-    }
-
-    if (priceRange !== 'all') {
-      const ranges = {
-        'under-5000': [0, 5000],
-        '5000-15000': [5000, 15000],
-        '15000-50000': [15000, 50000],
-        'above-50000': [50000, Infinity],
-      };
-      const [min, max] = ranges[priceRange];
-      filtered = filtered.filter(p => p.price >= min && p.price < max);
-    }
-
     // Room-based filtering
     if (selectedRoom !== 'all') {
       filtered = filtered.filter(p => {
@@ -109,7 +115,7 @@ function PaintingsPage() {
     }
 
     setFilteredPaintings(filtered);
-  }, [paintings, selectedCategory, priceRange, selectedRoom, sortBy]);
+  }, [paintings, selectedRoom, sortBy]);
 
   useEffect(() => {
     fetchPaintings();
@@ -433,6 +439,19 @@ function PaintingsPage() {
           </div>
         )}
 
+        {nextCursor && (
+          <div className="mt-8 text-center">
+            <button
+              onClick={() => fetchPaintings(nextCursor)}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-white border border-orange-300 text-orange-600 rounded-lg hover:bg-orange-50 transition-colors font-medium disabled:opacity-50"
+              data-testid="load-more-paintings"
+            >
+              {loadingMore ? 'Loading...' : 'Load more paintings'}
+            </button>
+          </div>
+        )}
+
         {/* Contact Note */}
         <div className="mt-12 bg-orange-50 border border-orange-200 rounded-xl p-6 text-center">
           <h3 className="text-lg font-semibold text-orange-800 mb-2">
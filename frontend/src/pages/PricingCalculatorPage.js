@@ -60,6 +60,23 @@ function PricingCalculatorPage() {
     setFormData(prev => ({ ...prev, [name]: value }));
   };
 
+  // The range and badge arrive at once; the written explanation follows a few seconds later
+  const pollBuyerMessage = async (key, attempts = 5) => {
+    for (let i = 0; i < attempts; i++) {
+      await new Promise(resolve => setTimeout(resolve, 1500));
+      try {
+        const { buyer_message, pending } = await pricingAPI.getBuyerMessage(key);
+        if (buyer_message) {
+          setAnalysis(prev => (prev?.buyer_message_key === key ? { ...prev, buyer_message } : prev));
+          return;
+        }
+        if (!pending) return;
+      } catch {
+        return;
+      }
+    }
+  };
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     setLoading(true);
@@ -81,6 +98,9 @@ function PricingCalculatorPage() {
 
       const result = await pricingAPI.analyzePrice(payload);
       setAnalysis(result);
+      if (result.buyer_message_pending) {
+        pollBuyerMessage(result.buyer_message_key);
+      }
     } catch (err) {
       setError(err.message || 'Failed to analyze pricing');
     } finally {
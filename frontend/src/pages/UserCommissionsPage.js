@@ -10,6 +10,8 @@ function UserCommissionsPage() {
   const navigate = useNavigate();
   const [commissions, setCommissions] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (!isAuthenticated) {
@@ -21,6 +23,7 @@ function UserCommissionsPage() {
       try {
         const response = await commissionAPI.getUserCommissions();
         setCommissions(response.commissions || []);
+        setNextCursor(response.next_cursor || null);
       } catch (error) {
         console.error(error);
       } finally {
@@ -31,6 +34,20 @@ function UserCommissionsPage() {
     fetchCommissions();
   }, [isAuthenticated, navigate]);
 
+  const loadMoreCommissions = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const response = await commissionAPI.getUserCommissions(nextCursor);
+      setCommissions(prev => [...prev, ...(response.commissions || [])]);
+      setNextCursor(response.next_cursor || null);
+    } catch (error) {
+      console.error(error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   return (
     <div className="min-h-screen bg-gray-50 px-4 sm:px-6 lg:px-8 py-10" data-testid="user-commissions-page">
       <div className="max-w-6xl mx-auto">
@@ -78,6 +95,18 @@ function UserCommissionsPage() {
             ))}
           </div>
         )}
+        {nextCursor && (
+          <div className="text-center mt-6">
+            <button
+              onClick={loadMoreCommissions}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-white border border-gray-300 text-[#1A1A1A] rounded-lg hover:bg-gray-100 transition-colors font-medium disabled:opacity-50"
+              data-testid="user-commissions-load-more"
+            >
+              {loadingMore ? 'Loading...' : 'Load more commissions'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
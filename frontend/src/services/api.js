@@ -105,7 +105,13 @@ export const publicAPI = {
   getFeaturedArtists: () => apiCall('/public/featured-artists'),
   getArtists: () => apiCall('/public/artists'),
   getArtistDetail: (artistId) => apiCall(`/public/artist/${artistId}`),
-  getPaintings: () => apiCall('/public/paintings'),
+  getPaintings: (filters = {}) => {
+    const params = new URLSearchParams({ projection: 'card' });
+    Object.entries(filters).forEach(([key, value]) => {
+      if (value !== undefined && value !== null && value !== '') params.append(key, value);
+    });
+    return apiCall(`/public/paintings?${params.toString()}`);
+  },
   getPaintingDetail: (paintingId) => apiCall(`/public/painting/${paintingId}`),
   getExhibitions: () => apiCall('/public/exhibitions'),
   getActiveExhibitions: () => apiCall('/public/exhibitions/active'),
@@ -142,7 +148,9 @@ export const communityAPI = {
     body: JSON.stringify(data),
   }),
   getAll: () => apiCall('/public/communities'),
-  getDetails: (communityId) => apiCall(`/community/${communityId}`),
+  getDetails: (communityId, viewerId = null) => apiCall(`/community/${communityId}${viewerId ? `?viewer_id=${encodeURIComponent(viewerId)}` : ''}`),
+  getMembers: (communityId, cursor = null) => apiCall(`/community/${communityId}/members${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`),
+  getPosts: (communityId, cursor = null) => apiCall(`/community/${communityId}/posts${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`),
   join: (communityId) => apiCall(`/community/${communityId}/join`, {
     method: 'POST',
   }),
@@ -174,6 +182,47 @@ export const chatAPI = {
     method: 'POST',
     body: JSON.stringify({ message, session_id: sessionId }),
   }),
+  // Reply over Server-Sent Events; onToken receives each chunk of text as it arrives
+  streamMessage: async (message, sessionId = null, onToken = () => {}) => {
+    if (!BACKEND_URL) {
+      throw new Error('REACT_APP_BACKEND_URL is not configured');
+    }
+    const token = await getToken();
+    const response = await fetch(`${API}/chat/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(token && { Authorization: `Bearer ${token}` }),
+      },
+      body: JSON.stringify({ message, session_id: sessionId }),
+    });
+    if (!response.ok || !response.body) {
+      throw new Error('Request failed');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = { session_id: sessionId, needs_admin_review: false };
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const raw = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        const event = raw.match(/^event: (.*)$/m)?.[1];
+        const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || '{}');
+        if (event === 'token') {
+          onToken(data.text);
+        } else if (event === 'session' || event === 'done') {
+          result = { ...result, ...data };
+        }
+      }
+    }
+    return result;
+  },
   getHistory: () => apiCall('/chat/history'),
 };
 
@@ -252,7 +301,7 @@ export const profileModificationAPI = {
 export const userAPI = {
   getMyEnquiries: () => apiCall('/user/my-enquiries'),
   getProfile: () => apiCall('/user/profile'),
-  getMyCommissions: () => apiCall('/user/commissions'),
+  getMyCommissions: () => apiCall('/user/commissions?include_updates=true'),
 };
 
 export const commissionAPI = {
@@ -260,9 +309,9 @@ export const commissionAPI = {
     method: 'POST',
     body: JSON.stringify(data),
   }),
-  getUserCommissions: () => apiCall('/user/commissions'),
-  getArtistCommissions: () => apiCall('/artist/commissions'),
-  getAdminCommissions: () => apiCall('/admin/commissions'),
+  getUserCommissions: (cursor = null) => apiCall(`/user/commissions?include_updates=true${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`),
+  getArtistCommissions: (cursor = null) => apiCall(`/artist/commissions?include_updates=true${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`),
+  getAdminCommissions: (cursor = null) => apiCall(`/admin/commissions?include_updates=true${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`),
   updateByArtist: (commissionId, data) => apiCall(`/artist/commissions/${commissionId}/update`, {
     method: 'POST',
     body: JSON.stringify(data),
@@ -429,6 +478,18 @@ export const adminAPI = {
   respondToChat: (messageId, response) => apiCall(`/admin/respond-to-chat?message_id=${messageId}&response=${encodeURIComponent(response)}`, {
     method: 'POST',
   }),
+  promoteChatAnswer: (messageId, promotion = {}) => apiCall(`/admin/chat-messages/${messageId}/promote`, {
+    method: 'POST',
+    body: JSON.stringify(promotion),
+  }),
+  getChatFaq: () => apiCall('/admin/chat-faq'),
+  createChatFaq: (question, answer) => apiCall('/admin/chat-faq', {
+    method: 'POST',
+    body: JSON.stringify({ question, answer }),
+  }),
+  deleteChatFaq: (faqId) => apiCall(`/admin/chat-faq/${faqId}`, {
+    method: 'DELETE',
+  }),
   
   // Featured Requests
   getFeaturedRequests: () => apiCall('/admin/featured-requests'),
@@ -548,7 +609,19 @@ export const pricingAPI = {
     body: JSON.stringify(data),
   }),
 
+  // Model-written buyer message, generated after the analysis returns
+  getBuyerMessage: (key) => apiCall(`/artwork/pricing-analysis/buyer-message/${key}`),
+
   // Get pricing badge for an artwork
   getPricingBadge: (artworkId) => apiCall(`/artwork/${artworkId}/pricing-badge`),
+
+  // Price many artworks (artwork_ids, or a whole artist portfolio) in the background
+  submitBatch: (data) => apiCall('/artwork/pricing-batch', {
+    method: 'POST',
+    body: JSON.stringify(data),
+  }),
+
+  // Progress of a batch pricing job
+  getBatchJob: (jobId) => apiCall(`/artwork/pricing-batch/${jobId}`),
 };
 
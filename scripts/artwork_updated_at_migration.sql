@@ -0,0 +1,30 @@
+-- Migration: Track artwork modification time
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- The backend caches exhibition artwork cards keyed by artwork id + updated_at and
+-- revalidates them with a cheap (id, updated_at) query, so updated_at must move on every write.
+
+ALTER TABLE artworks
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+
+UPDATE artworks SET updated_at = COALESCE(created_at, NOW()) WHERE updated_at IS NULL;
+
+CREATE OR REPLACE FUNCTION touch_artwork_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- View counter bumps don't change what an artwork card shows
+    IF NEW.views IS DISTINCT FROM OLD.views
+       AND (to_jsonb(NEW) - 'views' - 'updated_at') = (to_jsonb(OLD) - 'views' - 'updated_at') THEN
+        RETURN NEW;
+    END IF;
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_artworks_touch_updated_at ON artworks;
+CREATE TRIGGER trg_artworks_touch_updated_at
+BEFORE UPDATE ON artworks
+FOR EACH ROW EXECUTE FUNCTION touch_artwork_updated_at();
+
+COMMENT ON COLUMN artworks.updated_at IS 'Last modification time; bumped by trigger on every update except view counting';
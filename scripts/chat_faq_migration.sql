@@ -0,0 +1,28 @@
+-- Migration: Chatbot FAQ answer cache
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- Curated answers and answers admins promote from chat_messages. The backend loads the
+-- active rows into its in-process similarity index and answers matching questions
+-- without calling the model.
+
+-- =====================================================
+-- CHAT FAQ TABLE
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS chat_faq (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT 'curated' CHECK (source IN ('curated', 'promoted')),
+    source_message_id UUID,  -- chat_messages row the answer was promoted from
+    created_by UUID REFERENCES profiles(id) ON DELETE SET NULL,
+    is_active BOOLEAN NOT NULL DEFAULT true,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_chat_faq_active ON chat_faq(is_active);
+
+ALTER TABLE chat_faq ENABLE ROW LEVEL SECURITY;
+
+-- Read and written only by the backend (service role)
@@ -0,0 +1,12 @@
+-- Migration: Community post feed index
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- The feed is keyset-paginated on (created_at, id) newest first within a community;
+-- this index serves every page as a single range scan.
+
+-- =====================================================
+-- FEED ORDER INDEX
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_community_posts_feed
+    ON community_posts(community_id, created_at DESC, id DESC);
@@ -0,0 +1,82 @@
+-- Migration: Atomic community member counts
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- Membership rows and communities.member_count change together in one statement-level
+-- transaction, so concurrent joins/leaves can't lose updates. reconcile_community_member_counts()
+-- recomputes every count from community_members (run periodically by the app).
+
+-- =====================================================
+-- ADD / REMOVE A MEMBER AND ADJUST THE COUNT IN ONE ROUND TRIP
+-- Both return whether a membership row was actually inserted/deleted
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION add_community_member(p_community_id UUID, p_user_id UUID, p_role TEXT DEFAULT 'member')
+RETURNS BOOLEAN AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    INSERT INTO community_members (community_id, user_id, role, joined_at)
+    VALUES (p_community_id, p_user_id, p_role, NOW())
+    ON CONFLICT (community_id, user_id) DO NOTHING;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    IF inserted_count > 0 THEN
+        UPDATE communities SET member_count = COALESCE(member_count, 0) + 1 WHERE id = p_community_id;
+    END IF;
+    RETURN inserted_count > 0;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION remove_community_member(p_community_id UUID, p_user_id UUID)
+RETURNS BOOLEAN AS $$
+DECLARE
+    deleted_count INTEGER;
+BEGIN
+    DELETE FROM community_members
+    WHERE community_id = p_community_id AND user_id = p_user_id;
+
+    GET DIAGNOSTICS deleted_count = ROW_COUNT;
+    IF deleted_count > 0 THEN
+        UPDATE communities SET member_count = GREATEST(COALESCE(member_count, 0) - 1, 0) WHERE id = p_community_id;
+    END IF;
+    RETURN deleted_count > 0;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Standalone counterpart of increment_community_members (additional_migration.sql)
+CREATE OR REPLACE FUNCTION decrement_community_members(community_id UUID)
+RETURNS void AS $$
+BEGIN
+    UPDATE communities
+    SET member_count = GREATEST(COALESCE(member_count, 0) - 1, 0)
+    WHERE id = community_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- RECONCILIATION: recompute all counts in one statement
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION reconcile_community_member_counts()
+RETURNS INTEGER AS $$
+DECLARE
+    fixed_count INTEGER;
+BEGIN
+    UPDATE communities c
+    SET member_count = actual.n
+    FROM (
+        SELECT c2.id, COUNT(m.id) AS n
+        FROM communities c2
+        LEFT JOIN community_members m ON m.community_id = c2.id
+        GROUP BY c2.id
+    ) actual
+    WHERE c.id = actual.id
+      AND c.member_count IS DISTINCT FROM actual.n;
+
+    GET DIAGNOSTICS fixed_count = ROW_COUNT;
+    RETURN fixed_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE INDEX IF NOT EXISTS idx_community_members_community_joined
+ON community_members(community_id, joined_at, id);
@@ -0,0 +1,15 @@
+-- Migration: Keyset-paginated marketplace listing
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- /api/public/paintings pages through listed artworks ordered by (created_at DESC, id DESC)
+-- and seeks with (created_at, id) < cursor. This partial index serves that order directly;
+-- filters on category/medium/orientation/price are applied on top of it, and room filters use
+-- idx_artworks_suitable_rooms (GIN) from room_based_filtering_migration.sql.
+
+CREATE INDEX IF NOT EXISTS idx_artworks_marketplace_keyset
+ON artworks(created_at DESC, id DESC)
+WHERE is_approved = true AND in_marketplace = true AND is_available = true;
+
+CREATE INDEX IF NOT EXISTS idx_artworks_marketplace_category_keyset
+ON artworks(category, created_at DESC, id DESC)
+WHERE is_approved = true AND in_marketplace = true AND is_available = true;
@@ -0,0 +1,15 @@
+-- Migration: Active-membership index
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- Backs the membership expiry job (one bulk UPDATE ... WHERE is_member AND membership_expiry <= now())
+-- and the SQL-side active-member filters on featured/trending artists and the index reload.
+
+CREATE INDEX IF NOT EXISTS idx_profiles_active_membership
+ON profiles(membership_expiry)
+WHERE is_member = TRUE;
+
+-- One-off: flip memberships that have already lapsed
+UPDATE profiles
+SET is_member = FALSE
+WHERE is_member = TRUE
+  AND (membership_expiry IS NULL OR membership_expiry <= NOW());
@@ -0,0 +1,133 @@
+-- Migration: Materialized platform counters
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- Public stats and the admin dashboard read these counters in one query instead of running
+-- count(*) scans. Row triggers keep them exact: each insert/update/delete moves the row in or
+-- out of the counters it belongs to. refresh_platform_counters() recomputes everything
+-- (run at the end of this migration; safe to re-run any time).
+
+CREATE TABLE IF NOT EXISTS platform_counters (
+    name TEXT PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- =====================================================
+-- ROW TRIGGERS: move each changed row in/out of its counters
+-- =====================================================
+
+-- Counters a row of p_table belongs to
+CREATE OR REPLACE FUNCTION platform_counter_keys(p_table TEXT, r JSONB)
+RETURNS TEXT[] AS $$
+BEGIN
+    IF r IS NULL THEN
+        RETURN '{}';
+    END IF;
+    CASE p_table
+        WHEN 'profiles' THEN
+            RETURN array_remove(ARRAY[
+                'total_users',
+                CASE WHEN r->>'role' = 'artist' AND (r->>'is_approved')::boolean IS FALSE THEN 'pending_artists' END,
+                CASE WHEN r->>'role' = 'artist' AND (r->>'is_approved')::boolean IS TRUE THEN 'approved_artists' END
+            ], NULL);
+        WHEN 'artworks' THEN
+            RETURN array_remove(ARRAY[
+                CASE WHEN (r->>'is_approved')::boolean IS FALSE THEN 'pending_artworks' END,
+                CASE WHEN (r->>'is_approved')::boolean IS TRUE THEN 'approved_artworks' END
+            ], NULL);
+        WHEN 'exhibitions' THEN
+            RETURN array_remove(ARRAY[
+                CASE WHEN (r->>'is_approved')::boolean IS FALSE THEN 'pending_exhibitions' END,
+                CASE WHEN (r->>'is_approved')::boolean IS TRUE THEN 'approved_exhibitions' END
+            ], NULL);
+        WHEN 'communities' THEN
+            RETURN array_remove(ARRAY[
+                CASE WHEN (r->>'is_approved')::boolean IS FALSE THEN 'pending_communities' END
+            ], NULL);
+        WHEN 'profile_modifications' THEN
+            RETURN array_remove(ARRAY[
+                CASE WHEN r->>'status' = 'pending' THEN 'pending_modifications' END
+            ], NULL);
+        WHEN 'video_screenings' THEN
+            RETURN array_remove(ARRAY[
+                CASE WHEN r->>'status' = 'pending' THEN 'pending_screenings' END
+            ], NULL);
+        ELSE
+            RETURN '{}';
+    END CASE;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION track_platform_counters()
+RETURNS TRIGGER AS $$
+DECLARE
+    old_keys TEXT[] := '{}';
+    new_keys TEXT[] := '{}';
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        old_keys := platform_counter_keys(TG_TABLE_NAME, to_jsonb(OLD));
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        new_keys := platform_counter_keys(TG_TABLE_NAME, to_jsonb(NEW));
+    END IF;
+
+    IF old_keys IS DISTINCT FROM new_keys THEN
+        UPDATE platform_counters SET value = value + 1, updated_at = NOW()
+        WHERE name = ANY(new_keys) AND NOT (name = ANY(old_keys));
+        UPDATE platform_counters SET value = GREATEST(value - 1, 0), updated_at = NOW()
+        WHERE name = ANY(old_keys) AND NOT (name = ANY(new_keys));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['profiles', 'artworks', 'exhibitions', 'communities', 'profile_modifications', 'video_screenings'] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_platform_counters ON %I', t, t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_platform_counters AFTER INSERT OR UPDATE OR DELETE ON %I '
+            'FOR EACH ROW EXECUTE FUNCTION track_platform_counters()', t, t
+        );
+    END LOOP;
+END;
+$$;
+
+-- =====================================================
+-- BACKFILL / RECONCILIATION: exact recount of every counter
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION refresh_platform_counters()
+RETURNS void AS $$
+BEGIN
+    -- Every counter needs a row, even at zero, so the triggers have something to increment
+    INSERT INTO platform_counters (name, value)
+    SELECT n, 0 FROM unnest(ARRAY[
+        'total_users', 'pending_artists', 'approved_artists', 'pending_artworks', 'approved_artworks',
+        'pending_exhibitions', 'approved_exhibitions', 'pending_communities', 'pending_modifications',
+        'pending_screenings'
+    ]) AS n
+    ON CONFLICT (name) DO NOTHING;
+
+    UPDATE platform_counters pc
+    SET value = COALESCE(c.n, 0), updated_at = NOW()
+    FROM platform_counters base
+    LEFT JOIN (
+        SELECT k, COUNT(*) AS n
+        FROM (
+            SELECT unnest(platform_counter_keys('profiles', to_jsonb(p))) AS k FROM profiles p
+            UNION ALL SELECT unnest(platform_counter_keys('artworks', to_jsonb(a))) FROM artworks a
+            UNION ALL SELECT unnest(platform_counter_keys('exhibitions', to_jsonb(e))) FROM exhibitions e
+            UNION ALL SELECT unnest(platform_counter_keys('communities', to_jsonb(c))) FROM communities c
+            UNION ALL SELECT unnest(platform_counter_keys('profile_modifications', to_jsonb(m))) FROM profile_modifications m
+            UNION ALL SELECT unnest(platform_counter_keys('video_screenings', to_jsonb(v))) FROM video_screenings v
+        ) keys
+        GROUP BY k
+    ) c ON c.k = base.name
+    WHERE pc.name = base.name;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT refresh_platform_counters();
@@ -0,0 +1,75 @@
+-- Migration: Batch pricing analysis
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- Run after ai_pricing_engine_migration.sql. Batch jobs price whole portfolios, write the
+-- pricing_* columns in one statement per chunk and record a hash of the pricing inputs so
+-- re-runs skip artworks that have not changed.
+
+-- =====================================================
+-- ARTWORK COLUMNS
+-- =====================================================
+
+ALTER TABLE artworks
+ADD COLUMN IF NOT EXISTS pricing_input_hash TEXT;  -- sha256 of the inputs the badge was computed from
+
+ALTER TABLE artworks
+ADD COLUMN IF NOT EXISTS pricing_updated_at TIMESTAMPTZ;
+
+-- =====================================================
+-- BULK WRITE: one UPDATE for a JSON array of pricing results
+-- Returns the number of artworks updated
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION apply_artwork_pricing(p_rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE artworks a
+    SET pricing_badge = r.pricing_badge,
+        pricing_evaluation = r.pricing_evaluation,
+        pricing_buyer_message = r.pricing_buyer_message,
+        pricing_suggested_range = r.pricing_suggested_range,
+        pricing_input_hash = r.pricing_input_hash,
+        pricing_updated_at = r.pricing_updated_at
+    FROM jsonb_to_recordset(p_rows) AS r(
+        id UUID,
+        pricing_badge TEXT,
+        pricing_evaluation TEXT,
+        pricing_buyer_message TEXT,
+        pricing_suggested_range JSONB,
+        pricing_input_hash TEXT,
+        pricing_updated_at TIMESTAMPTZ
+    )
+    WHERE a.id = r.id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- JOB STATUS
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS pricing_jobs (
+    id UUID PRIMARY KEY,
+    requested_by UUID REFERENCES profiles(id) ON DELETE SET NULL,
+    artist_id UUID,
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'completed', 'failed')),
+    total INTEGER NOT NULL DEFAULT 0,
+    processed INTEGER NOT NULL DEFAULT 0,
+    repriced INTEGER NOT NULL DEFAULT 0,
+    unchanged INTEGER NOT NULL DEFAULT 0,
+    missing_inputs INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_pricing_jobs_requested_by ON pricing_jobs(requested_by, created_at DESC);
+
+ALTER TABLE pricing_jobs ENABLE ROW LEVEL SECURITY;
+
+-- Read and written only by the backend (service role)
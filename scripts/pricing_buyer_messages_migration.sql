@@ -0,0 +1,23 @@
+-- Migration: Shared pricing buyer messages
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- The pricing analysis answers at once with a template buyer message; the model-written
+-- one is generated in the background. Storing it here lets whichever worker receives the
+-- poll serve it. A row with a NULL message is still being written.
+
+-- =====================================================
+-- BUYER MESSAGES (keyed by pricing input + model version hash)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS pricing_buyer_messages (
+    key TEXT PRIMARY KEY,
+    message TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_pricing_buyer_messages_created ON pricing_buyer_messages(created_at);
+
+ALTER TABLE pricing_buyer_messages ENABLE ROW LEVEL SECURITY;
+
+-- Read and written only by the backend (service role)
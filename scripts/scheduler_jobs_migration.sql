@@ -0,0 +1,60 @@
+-- Migration: In-app background jobs (leader election + exhibition lifecycle)
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+
+-- =====================================================
+-- LEADER ELECTION: one lease row per background job
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT,
+    lease_expires_at TIMESTAMPTZ,
+    next_run_at TIMESTAMPTZ,  -- Published by whichever worker last ran the job
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Acquire the lease if it is free/expired, or renew it if p_holder already owns it
+CREATE OR REPLACE FUNCTION acquire_scheduler_lease(p_name TEXT, p_holder TEXT, p_ttl_seconds INTEGER)
+RETURNS TABLE(is_leader BOOLEAN, published_next_run_at TIMESTAMPTZ) AS $$
+BEGIN
+    INSERT INTO scheduler_leases AS l (name, holder, lease_expires_at, updated_at)
+    VALUES (p_name, p_holder, NOW() + make_interval(secs => p_ttl_seconds), NOW())
+    ON CONFLICT (name) DO UPDATE SET
+        holder = EXCLUDED.holder,
+        lease_expires_at = EXCLUDED.lease_expires_at,
+        updated_at = NOW()
+    WHERE l.holder = EXCLUDED.holder
+       OR l.lease_expires_at IS NULL
+       OR l.lease_expires_at < NOW();
+
+    RETURN QUERY
+    SELECT l.holder = p_holder, l.next_run_at
+    FROM scheduler_leases l
+    WHERE l.name = p_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- EXHIBITION LIFECYCLE: apply all status transitions in one round trip
+-- p_transitions: [{"id": "<uuid>", "status": "active"}, ...]
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION apply_exhibition_status_transitions(p_transitions JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE exhibitions e
+    SET status = t.status,
+        updated_at = NOW()
+    FROM jsonb_to_recordset(p_transitions) AS t(id UUID, status TEXT)
+    WHERE e.id = t.id
+      AND e.status IS DISTINCT FROM t.status;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE INDEX IF NOT EXISTS idx_exhibitions_approved_status
+ON exhibitions(is_approved, status);
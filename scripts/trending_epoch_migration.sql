@@ -0,0 +1,121 @@
+-- Migration: Rebasable forward-decay epoch for trending scores
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+-- Run after trending_scores_migration.sql and view_counter_migration.sql.
+--
+-- Forward decay stores weight * 2^((event_time - epoch) / half_life). With a fixed epoch the
+-- growth factor passes the DOUBLE PRECISION range after ~1024 half-lives (~9.8 years at 3.5 days).
+-- The epoch now lives in trending_state, growth is computed in SQL from it, and
+-- rebase_trending_epoch() periodically moves the epoch forward by k whole half-lives while
+-- scaling every stored score by 2^-k in the same transaction. Rankings and displayed scores
+-- are unchanged by a rebase.
+
+-- =====================================================
+-- EPOCH STATE (single row)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS trending_state (
+    id BOOLEAN PRIMARY KEY DEFAULT true CHECK (id),
+    epoch TIMESTAMPTZ NOT NULL,
+    half_life_days DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Seeded with the epoch and half-life the existing scores were written against
+INSERT INTO trending_state (id, epoch, half_life_days)
+VALUES (true, TIMESTAMPTZ '2026-01-01 00:00:00+00', 3.5)
+ON CONFLICT (id) DO NOTHING;
+
+-- Read and written only by the backend (service role)
+ALTER TABLE trending_state ENABLE ROW LEVEL SECURITY;
+
+-- =====================================================
+-- SCORE UPDATES: growth is computed here, against the current epoch
+-- The state row is read FOR SHARE so updates never interleave with a rebase.
+-- =====================================================
+
+DROP FUNCTION IF EXISTS bump_trending_score(UUID, DOUBLE PRECISION, INTEGER, INTEGER);
+
+CREATE OR REPLACE FUNCTION bump_trending_score(
+    p_artist_id UUID,
+    p_weight DOUBLE PRECISION,
+    p_views INTEGER DEFAULT 0,
+    p_sales INTEGER DEFAULT 0
+)
+RETURNS void AS $$
+DECLARE
+    growth DOUBLE PRECISION;
+BEGIN
+    SELECT power(2.0, extract(epoch FROM (NOW() - epoch)) / (half_life_days * 86400))
+    INTO growth
+    FROM trending_state
+    FOR SHARE;
+
+    INSERT INTO trending_scores (artist_id, decay_score, total_views, sales_count, updated_at)
+    VALUES (p_artist_id, p_weight * growth, p_views, p_sales, NOW())
+    ON CONFLICT (artist_id) DO UPDATE SET
+        decay_score = trending_scores.decay_score + EXCLUDED.decay_score,
+        total_views = trending_scores.total_views + EXCLUDED.total_views,
+        sales_count = trending_scores.sales_count + EXCLUDED.sales_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- p_artwork_views: [{"id": "<artwork uuid>", "views": 3}, ...]
+-- p_artist_views:  [{"artist_id": "<profile uuid>", "views": 5, "weight": 5}, ...]
+CREATE OR REPLACE FUNCTION flush_artwork_views(p_artwork_views JSONB, p_artist_views JSONB)
+RETURNS void AS $$
+DECLARE
+    growth DOUBLE PRECISION;
+BEGIN
+    UPDATE artworks a
+    SET views = COALESCE(a.views, 0) + v.views
+    FROM jsonb_to_recordset(p_artwork_views) AS v(id UUID, views INTEGER)
+    WHERE a.id = v.id;
+
+    SELECT power(2.0, extract(epoch FROM (NOW() - epoch)) / (half_life_days * 86400))
+    INTO growth
+    FROM trending_state
+    FOR SHARE;
+
+    INSERT INTO trending_scores (artist_id, decay_score, total_views, sales_count, updated_at)
+    SELECT v.artist_id, v.weight * growth, v.views, 0, NOW()
+    FROM jsonb_to_recordset(p_artist_views) AS v(artist_id UUID, views INTEGER, weight DOUBLE PRECISION)
+    ON CONFLICT (artist_id) DO UPDATE SET
+        decay_score = trending_scores.decay_score + EXCLUDED.decay_score,
+        total_views = trending_scores.total_views + EXCLUDED.total_views,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- REBASE (run periodically by the app)
+-- Once at least p_min_half_lives have elapsed since the epoch, advance it by the whole
+-- number of elapsed half-lives k and scale every score by 2^-k (exact in floating point).
+-- Returns the epoch in effect afterwards.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION rebase_trending_epoch(p_min_half_lives INTEGER DEFAULT 64)
+RETURNS TIMESTAMPTZ AS $$
+DECLARE
+    state trending_state%ROWTYPE;
+    k INTEGER;
+    new_epoch TIMESTAMPTZ;
+BEGIN
+    SELECT * INTO state FROM trending_state FOR UPDATE;
+
+    k := floor(extract(epoch FROM (NOW() - state.epoch)) / (state.half_life_days * 86400));
+    IF k < p_min_half_lives THEN
+        RETURN state.epoch;
+    END IF;
+
+    new_epoch := state.epoch + make_interval(secs => k * state.half_life_days * 86400);
+
+    UPDATE trending_scores SET decay_score = decay_score * power(2.0, -k);
+    UPDATE trending_state SET epoch = new_epoch, updated_at = NOW() WHERE id;
+
+    RETURN new_epoch;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON TABLE trending_state IS 'Current forward-decay epoch and half-life for trending_scores';
+COMMENT ON COLUMN trending_scores.decay_score IS 'Forward-decayed score; divide by 2^((now - trending_state.epoch) / half_life) for the current value';
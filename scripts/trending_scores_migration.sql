@@ -0,0 +1,71 @@
+-- Migration: Materialized trending-artist leaderboard
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- Scores use forward decay: every event adds weight * 2^((event_time - epoch) / half_life)
+-- to decay_score. Ranking by decay_score is identical to ranking by the time-decayed score,
+-- so the leaderboard is a plain ORDER BY. The backend divides by 2^((now - epoch) / half_life)
+-- for display. Epoch (2026-01-01) and half-life (3.5 days) must match TRENDING_EPOCH and
+-- TRENDING_HALF_LIFE_DAYS in backend/server.py.
+-- trending_epoch_migration.sql moves the epoch into trending_state and rebases it periodically.
+
+CREATE TABLE IF NOT EXISTS trending_scores (
+    artist_id UUID PRIMARY KEY REFERENCES profiles(id) ON DELETE CASCADE,
+    decay_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    total_views BIGINT NOT NULL DEFAULT 0,
+    sales_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_trending_scores_decay_score
+ON trending_scores(decay_score DESC);
+
+-- Atomic incremental update (called on recorded views and created orders)
+CREATE OR REPLACE FUNCTION bump_trending_score(
+    p_artist_id UUID,
+    p_score_delta DOUBLE PRECISION,
+    p_views INTEGER DEFAULT 0,
+    p_sales INTEGER DEFAULT 0
+)
+RETURNS void AS $$
+BEGIN
+    INSERT INTO trending_scores (artist_id, decay_score, total_views, sales_count, updated_at)
+    VALUES (p_artist_id, p_score_delta, p_views, p_sales, NOW())
+    ON CONFLICT (artist_id) DO UPDATE SET
+        decay_score = trending_scores.decay_score + EXCLUDED.decay_score,
+        total_views = trending_scores.total_views + EXCLUDED.total_views,
+        sales_count = trending_scores.sales_count + EXCLUDED.sales_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- One-off backfill: existing (undated) views count as of now, sales from the last 14 days
+-- are weighted by their order time. Views weigh 1, sales weigh 10.
+INSERT INTO trending_scores (artist_id, decay_score, total_views, sales_count, updated_at)
+SELECT
+    p.id,
+    COALESCE(v.views, 0) * power(2.0, extract(epoch FROM (NOW() - TIMESTAMPTZ '2026-01-01 00:00:00+00')) / (3.5 * 86400))
+        + COALESCE(s.sales_score, 0),
+    COALESCE(v.views, 0),
+    COALESCE(s.sales_count, 0),
+    NOW()
+FROM profiles p
+LEFT JOIN (
+    SELECT artist_id, SUM(COALESCE(views, 0)) AS views
+    FROM artworks
+    WHERE is_approved = true
+    GROUP BY artist_id
+) v ON v.artist_id = p.id
+LEFT JOIN (
+    SELECT
+        artist_id,
+        COUNT(*) AS sales_count,
+        SUM(10 * power(2.0, extract(epoch FROM (created_at - TIMESTAMPTZ '2026-01-01 00:00:00+00')) / (3.5 * 86400))) AS sales_score
+    FROM orders
+    WHERE created_at >= NOW() - INTERVAL '14 days'
+    GROUP BY artist_id
+) s ON s.artist_id = p.id
+WHERE p.role = 'artist'
+ON CONFLICT (artist_id) DO NOTHING;
+
+COMMENT ON TABLE trending_scores IS 'Incrementally maintained, time-decayed trending score per artist';
+COMMENT ON COLUMN trending_scores.decay_score IS 'Forward-decayed score; divide by 2^((now - epoch) / half_life) for the current value';
@@ -0,0 +1,29 @@
+-- Migration: Write-behind artwork view counter
+-- Run this in Supabase SQL Editor: https://supabase.com/dashboard/project/lurvhgzauuzwftfymjym/sql/new
+--
+-- The backend buffers detail-page views in memory and flushes them every few seconds.
+-- Each flush applies all deltas in one transaction: artworks.views is incremented in place
+-- (no read-modify-write) and trending_scores gets the matching forward-decayed score
+-- (see trending_scores_migration.sql). trending_epoch_migration.sql replaces this function
+-- with one that takes a raw "weight" per artist instead of "score_delta".
+--
+-- p_artwork_views: [{"id": "<artwork uuid>", "views": 3}, ...]
+-- p_artist_views:  [{"artist_id": "<profile uuid>", "views": 5, "score_delta": 123.4}, ...]
+
+CREATE OR REPLACE FUNCTION flush_artwork_views(p_artwork_views JSONB, p_artist_views JSONB)
+RETURNS void AS $$
+BEGIN
+    UPDATE artworks a
+    SET views = COALESCE(a.views, 0) + v.views
+    FROM jsonb_to_recordset(p_artwork_views) AS v(id UUID, views INTEGER)
+    WHERE a.id = v.id;
+
+    INSERT INTO trending_scores (artist_id, decay_score, total_views, sales_count, updated_at)
+    SELECT v.artist_id, v.score_delta, v.views, 0, NOW()
+    FROM jsonb_to_recordset(p_artist_views) AS v(artist_id UUID, views INTEGER, score_delta DOUBLE PRECISION)
+    ON CONFLICT (artist_id) DO UPDATE SET
+        decay_score = trending_scores.decay_score + EXCLUDED.decay_score,
+        total_views = trending_scores.total_views + EXCLUDED.total_views,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;